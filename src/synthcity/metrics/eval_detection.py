@@ -1,10 +1,13 @@
 # stdlib
+import os
 import platform
-from typing import Any, Dict
+import tempfile
+from typing import Any, Dict, Optional
 
 # third party
 import numpy as np
 import torch
+from joblib import Parallel, delayed
 from pydantic import validate_arguments
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
@@ -19,7 +22,7 @@ from synthcity.plugins.core.dataloader import DataLoader
 from synthcity.plugins.core.dataset import NumpyDataset
 from synthcity.plugins.core.models.convnet import suggest_image_classifier_arch
 from synthcity.plugins.core.models.mlp import MLP
-from synthcity.utils.reproducibility import clear_cache
+from synthcity.utils.reproducibility import clear_cache, enable_reproducible_results
 from synthcity.utils.serialization import load_from_file, save_to_file
 
 
@@ -165,6 +168,41 @@ class SyntheticDetectionXGB(DetectionEvaluator):
         )
 
 
+def _image_detection_fold(
+    data: np.ndarray,
+    labels: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    n_threads: Optional[int],
+    random_state: int,
+    batch_size: int = 1024,
+    **arch_args: Any,
+) -> float:
+    """Train an image classifier on a fold of the real+synthetic images, and return its test AUCROC.
+
+    The fold rows are read from `data` by index, so a memory-mapped array is not copied per fold. The seed is reset for each fold, so the score does not depend on the folds running in sequence or in parallel.
+    """
+    threads = torch.get_num_threads()
+    if n_threads is not None:
+        torch.set_num_threads(n_threads)
+
+    try:
+        enable_reproducible_results(random_state)
+        clf = suggest_image_classifier_arch(
+            classes=2, random_state=random_state, **arch_args
+        )
+        clf.fit(NumpyDataset(data, labels, indices=train_idx))
+
+        test_pred = []
+        for start in range(0, len(test_idx), batch_size):
+            test_X = np.array(data[test_idx[start : start + batch_size]])
+            test_pred.append(clf.predict_proba(torch.from_numpy(test_X))[:, 1].numpy())
+    finally:
+        torch.set_num_threads(threads)
+
+    return roc_auc_score(labels[test_idx], np.concatenate(test_pred))
+
+
 class SyntheticDetectionMLP(DetectionEvaluator):
     """
     .. inheritance-diagram:: synthcity.metrics.eval_detection.SyntheticDetectionMLP
@@ -178,11 +216,33 @@ class SyntheticDetectionMLP(DetectionEvaluator):
     Score:
         0: The datasets are indistinguishable.
         1: The datasets are totally distinguishable.
+
+    Args:
+        n_jobs: int
+            Number of folds trained in parallel for the image data. -1 uses all the CPUs.
+        n_threads: Optional[int]
+            Number of torch threads per image fold. Defaults to the current number of threads split between the parallel folds.
+        n_iter: int
+            Maximum number of epochs of the image classifiers.
+        patience: int
+            Number of epochs without improvement of the validation loss before the early stopping of the image classifiers.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        n_jobs: int = 1,
+        n_threads: Optional[int] = None,
+        n_iter: int = 1000,
+        patience: int = 10,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
 
+        self._n_jobs = n_jobs
+        self._n_threads = n_threads
+        self._n_iter = n_iter
+        self._patience = patience
+
     @staticmethod
     def name() -> str:
         return "detection_mlp"
@@ -204,35 +264,58 @@ class SyntheticDetectionMLP(DetectionEvaluator):
 
         data_gt = X_gt.numpy()
         data_syn = X_syn.numpy()
-        data = np.concatenate([data_gt, data_syn], axis=0)
 
         labels_gt = np.asarray([0] * len(X_gt))
         labels_syn = np.asarray([1] * len(X_syn))
         labels = np.concatenate([labels_gt, labels_syn])
 
+        arch_args = {
+            "n_channels": X_gt.info()["channels"],
+            "height": X_gt.info()["height"],
+            "width": X_gt.info()["width"],
+            "n_iter": self._n_iter,
+            "patience": self._patience,
+        }
+        n_jobs = self._n_jobs if self._n_jobs > 0 else os.cpu_count() or 1
+        n_threads = self._n_threads
+        if n_threads is None and n_jobs > 1:
+            n_threads = max(1, torch.get_num_threads() // n_jobs)
+
         skf = StratifiedKFold(
             n_splits=self._n_folds, shuffle=True, random_state=self._random_state
         )
-        res = []
-        for train_idx, test_idx in skf.split(data, labels):
-            train_X = data[train_idx]
-            train_y = labels[train_idx]
-            test_X = data[test_idx]
-            test_y = labels[test_idx]
-
-            clf = suggest_image_classifier_arch(
-                n_channels=X_gt.info()["channels"],
-                height=X_gt.info()["height"],
-                width=X_gt.info()["width"],
-                classes=2,
-            )
-            train_dataset = NumpyDataset(train_X, train_y)
-
-            clf.fit(train_dataset)
-            test_pred = clf.predict_proba(torch.from_numpy(test_X))[:, 1].cpu().numpy()
 
-            score = roc_auc_score(test_y, test_pred)
-            res.append(score)
+        # The real and synthetic images are written once to a memory-mapped file, shared by all the folds and workers.
+        with tempfile.TemporaryDirectory(dir=self._workspace) as tmp_dir:
+            data = np.lib.format.open_memmap(
+                os.path.join(tmp_dir, "detection_images.npy"),
+                mode="w+",
+                dtype=np.result_type(data_gt, data_syn),
+                shape=(len(labels), *data_gt.shape[1:]),
+            )
+            data[: len(data_gt)] = data_gt
+            data[len(data_gt) :] = data_syn
+            data.flush()
+            data = np.load(data.filename, mmap_mode="r")
+
+            tasks = [
+                delayed(_image_detection_fold)(
+                    data,
+                    labels,
+                    train_idx,
+                    test_idx,
+                    n_threads,
+                    self._random_state,
+                    **arch_args,
+                )
+                for train_idx, test_idx in skf.split(labels, labels)
+            ]
+            if n_jobs == 1:
+                res = [fn(*fn_args, **fn_kwargs) for fn, fn_args, fn_kwargs in tasks]
+            else:
+                res = Parallel(n_jobs=n_jobs)(tasks)
+
+            del data
 
         results = {self._reduction: float(self.reduction()(res))}
         log.info(
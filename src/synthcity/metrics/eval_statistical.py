@@ -1,7 +1,8 @@
 # stdlib
 import platform
 from abc import abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
 
 # third party
 import numpy as np
@@ -22,9 +23,11 @@ import synthcity.logger as log
 from synthcity.metrics._utils import get_frequency
 from synthcity.metrics.core import MetricEvaluator
 from synthcity.plugins.core.dataloader import DataLoader
+from synthcity.plugins.core.models.convnet import suggest_image_feature_extractor
 from synthcity.plugins.core.models.survival_analysis.metrics import (
     nonparametric_distance,
 )
+from synthcity.utils.constants import DEVICE
 from synthcity.utils.reproducibility import clear_cache
 from synthcity.utils.serialization import load_from_file, save_to_file
 
@@ -811,12 +814,37 @@ class FrechetInceptionDistance(StatisticalEvaluator):
     The FID metric calculates the distance between two distributions of images.
     Typically, we have summary statistics (mean & covariance matrix) of one of these distributions, while the 2nd distribution is given by a GAN.
 
+    By default, the distance is computed on the raw pixels. With a `feature_extractor`, the images are embedded in mini-batches, and the distance is computed on the low-dimensional features. In both cases, the mean and the covariance are accumulated batch by batch, so the memory is bounded by the batch size and the number of features.
+
     Adapted by Boris van Breugel(bv292@cam.ac.uk)
+
+    Args:
+        feature_extractor: Optional[Union[torch.nn.Module, str, Path]]
+            None for the pixel space, a torch module mapping the image batches to features, "convnet" for the fixed random network of `suggest_image_feature_extractor`, or the path of a local torch checkpoint of a module.
+        batch_size: int
+            The number of images embedded at once.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        feature_extractor: Optional[Union[torch.nn.Module, str, Path]] = None,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
 
+        if (
+            isinstance(feature_extractor, (str, Path))
+            and feature_extractor != "convnet"
+        ):
+            # a pickled module, not a state dict: weights_only must be off
+            feature_extractor = torch.load(  # nosec B614
+                feature_extractor, map_location=DEVICE, weights_only=False
+            )
+
+        self._feature_extractor = feature_extractor
+        self._batch_size = batch_size
+
     @staticmethod
     def name() -> str:
         return "fid"
@@ -837,6 +865,54 @@ class FrechetInceptionDistance(StatisticalEvaluator):
         sigma = np.cov(act.T)
         return mu, sigma
 
+    def _features(self, images: np.ndarray) -> np.ndarray:
+        """Embed a batch of images, or flatten them in the pixel space."""
+        if self._feature_extractor is None:
+            return images.reshape(len(images), -1).astype(np.float64)
+
+        if self._feature_extractor == "convnet":
+            self._feature_extractor = suggest_image_feature_extractor(
+                n_channels=images.shape[1], random_state=self._random_state
+            )
+
+        self._feature_extractor.eval()
+        with torch.no_grad():
+            # copy: the images can be read-only views of the shared image cache
+            batch = torch.tensor(images, dtype=torch.float32, device=DEVICE)
+            act = self._feature_extractor(batch)
+
+        return act.reshape(len(images), -1).cpu().numpy().astype(np.float64)
+
+    def _fit_gaussian_streaming(self, X: DataLoader) -> Tuple[np.ndarray, np.ndarray]:
+        """Streaming version of `_fit_gaussian`, over the mini-batches of the features.
+
+        The batch statistics are merged with the parallel variant of the Welford algorithm.
+        """
+        images = X.numpy()
+
+        count = 0
+        mu = np.zeros(0)
+        m2 = np.zeros((0, 0))
+        for start in range(0, len(images), self._batch_size):
+            act = self._features(images[start : start + self._batch_size])
+
+            batch_count = len(act)
+            batch_mu = act.mean(axis=0)
+            centered = act - batch_mu
+            batch_m2 = centered.T @ centered
+
+            if count == 0:
+                count, mu, m2 = batch_count, batch_mu, batch_m2
+                continue
+
+            total = count + batch_count
+            delta = batch_mu - mu
+            mu = mu + delta * batch_count / total
+            m2 = m2 + batch_m2 + np.outer(delta, delta) * count * batch_count / total
+            count = total
+
+        return mu, m2 / (count - 1)
+
     def _calculate_frechet_distance(
         self,
         mu1: np.ndarray,
@@ -898,6 +974,15 @@ class FrechetInceptionDistance(StatisticalEvaluator):
 
         return diff.dot(diff) + np.trace(sigma1) + np.trace(sigma2) - 2 * tr_covmean
 
+    @validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def evaluate(self, X_gt: DataLoader, X_syn: DataLoader) -> Dict:
+        if self._feature_extractor is None:
+            return super().evaluate(X_gt, X_syn)
+
+        # the cache files are keyed by the metric name and the data, not by the feature extractor
+        clear_cache()
+        return self._evaluate(X_gt, X_syn)
+
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _evaluate(
         self,
@@ -909,11 +994,8 @@ class FrechetInceptionDistance(StatisticalEvaluator):
                 f"The metric is valid only for image tasks, but got datasets {X.type()} and {X_syn.type()}"
             )
 
-        X1 = X.numpy().reshape(len(X), -1)
-        X2 = X_syn.numpy().reshape(len(X_syn), -1)
-
-        mu1, cov1 = self._fit_gaussian(X1)
-        mu2, cov2 = self._fit_gaussian(X2)
+        mu1, cov1 = self._fit_gaussian_streaming(X)
+        mu2, cov2 = self._fit_gaussian_streaming(X_syn)
         score = self._calculate_frechet_distance(mu1, cov1, mu2, cov2)
 
         return {
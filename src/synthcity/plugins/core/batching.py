@@ -0,0 +1,264 @@
+# stdlib
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# third party
+import cloudpickle
+
+# synthcity absolute
+import synthcity.logger as log
+from synthcity.plugins.core.constraints import Constraints
+from synthcity.plugins.core.dataloader import DataLoader
+from synthcity.plugins.core.schema import CompiledConstraints
+
+# The data types whose generated rows are independent samples, which can be split between the requests.
+BATCHABLE_DATA_TYPES = ["generic", "survival_analysis"]
+
+
+class _GenerationBatch:
+    def __init__(
+        self,
+        constraints: Optional[Union[CompiledConstraints, Constraints]],
+        kwargs: dict,
+    ) -> None:
+        self.constraints = constraints
+        self.kwargs = kwargs
+        self.requests: List[Tuple[int, Future]] = []
+        self.total = 0
+        self.ready = threading.Event()
+
+
+class GenerationBatcher:
+    """Micro-batching executor for the `generate` calls of a fitted plugin.
+
+    The concurrent requests with the same constraints and arguments are coalesced, within a short time window, into a single `generate` call. The output is split back between the requests. The first request of a batch waits for the window to close, runs the generation, and serves the other requests of the batch.
+
+    The requests with a `random_state` or a generation conditional(`cond`), and the plugins for non-tabular data are not coalesced, but they are still serialized with the batched calls.
+
+    Args:
+        plugin: Plugin
+            The fitted plugin.
+        max_batch_size: int
+            The maximum number of rows generated by a single call. A batch is closed as soon as it reaches this size.
+        max_delay: float
+            The time window in seconds used for collecting the concurrent requests.
+    """
+
+    def __init__(
+        self,
+        plugin: Any,
+        max_batch_size: int = 10000,
+        max_delay: float = 0.005,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError(f"Invalid max_batch_size {max_batch_size}")
+        if max_delay < 0:
+            raise ValueError(f"Invalid max_delay {max_delay}")
+
+        self.plugin = plugin
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        # The plugins are not reentrant, a single generation runs at a time.
+        self._generate_lock = threading.Lock()
+        self._pending: Dict[bytes, _GenerationBatch] = {}
+
+        self.n_requests = 0
+        self.n_generate_calls = 0
+
+    def _batch_key(
+        self,
+        constraints: Optional[Union[CompiledConstraints, Constraints]],
+        random_state: Optional[int],
+        kwargs: dict,
+    ) -> Optional[bytes]:
+        if random_state is not None or kwargs.get("cond", None) is not None:
+            return None
+
+        if self.plugin.data_info["data_type"] not in BATCHABLE_DATA_TYPES:
+            return None
+
+        try:
+            return cloudpickle.dumps((constraints, sorted(kwargs.items())))
+        except BaseException:
+            return None
+
+    def _generate(self, count: int, **kwargs: Any) -> DataLoader:
+        with self._generate_lock:
+            self.n_generate_calls += 1
+            return self.plugin.generate(count=count, **kwargs)
+
+    def _run(self, batch: _GenerationBatch) -> None:
+        try:
+            X_syn = self._generate(
+                batch.total, constraints=batch.constraints, **batch.kwargs
+            )
+        except BaseException as e:
+            for _, future in batch.requests:
+                future.set_exception(e)
+            return
+
+        if len(batch.requests) == 1:
+            batch.requests[0][1].set_result(X_syn)
+            return
+
+        # The constraints can filter out some rows, the last requests get the shortfall.
+        data = X_syn.dataframe()
+        offset = 0
+        for count, future in batch.requests:
+            chunk = data.iloc[offset : offset + count].reset_index(drop=True)
+            offset += count
+            future.set_result(X_syn.decorate(chunk))
+
+    def _enqueue(
+        self,
+        count: Optional[int],
+        constraints: Optional[Union[CompiledConstraints, Constraints]],
+        random_state: Optional[int],
+        kwargs: dict,
+    ) -> Tuple[Future, Optional[Callable[[], None]]]:
+        """Register a request. Returns its future, and the work to run by the caller(None, if another request runs the batch)."""
+        if count is None:
+            count = self.plugin.data_info["len"]
+
+        future: Future = Future()
+        with self._lock:
+            self.n_requests += 1
+
+        n: int = count
+        key = self._batch_key(constraints, random_state, kwargs)
+        if key is None:
+
+            def run_single() -> None:
+                try:
+                    future.set_result(
+                        self._generate(
+                            n,
+                            constraints=constraints,
+                            random_state=random_state,
+                            **kwargs,
+                        )
+                    )
+                except BaseException as e:
+                    future.set_exception(e)
+
+            return future, run_single
+
+        leader = False
+        with self._lock:
+            batch = self._pending.get(key)
+            if batch is not None and batch.total + count > self.max_batch_size:
+                # Release the full batch, and start a new one.
+                batch.ready.set()
+                batch = None
+
+            if batch is None:
+                batch = _GenerationBatch(constraints, kwargs)
+                self._pending[key] = batch
+                leader = True
+
+            batch.requests.append((count, future))
+            batch.total += count
+            if batch.total >= self.max_batch_size:
+                batch.ready.set()
+
+        if not leader:
+            return future, None
+
+        batch_key: bytes = key
+        current: _GenerationBatch = batch
+
+        def run_batch() -> None:
+            current.ready.wait(self.max_delay)
+            with self._lock:
+                if self._pending.get(batch_key) is current:
+                    del self._pending[batch_key]
+
+            log.debug(
+                f"[{self.plugin.name()}] coalesced {len(current.requests)} requests into a batch of {current.total} samples"
+            )
+            self._run(current)
+
+        return future, run_batch
+
+    def submit(
+        self,
+        count: Optional[int] = None,
+        constraints: Optional[Union[CompiledConstraints, Constraints]] = None,
+        random_state: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Submit a generation request.
+
+        Args:
+            count: optional int.
+                The number of samples to generate. If None, it generates len(reference_dataset) samples.
+            constraints: optional Constraints or CompiledConstraints.
+                Optional constraints to apply on the generated data.
+            random_state: optional int.
+                Optional random seed to use. The seeded requests are not coalesced.
+            kwargs: Any
+                Forwarded to `Plugin.generate`.
+
+        Returns:
+            Future with the <count> synthetic samples. The future is already done when the calling thread ran the generation.
+        """
+        future, work = self._enqueue(count, constraints, random_state, kwargs)
+        if work is not None:
+            work()
+
+        return future
+
+    def generate(
+        self,
+        count: Optional[int] = None,
+        constraints: Optional[Union[CompiledConstraints, Constraints]] = None,
+        random_state: Optional[int] = None,
+        **kwargs: Any,
+    ) -> DataLoader:
+        """Blocking generation, coalesced with the concurrent requests. See `submit`."""
+        return self.submit(
+            count, constraints=constraints, random_state=random_state, **kwargs
+        ).result()
+
+    async def agenerate(
+        self,
+        count: Optional[int] = None,
+        constraints: Optional[Union[CompiledConstraints, Constraints]] = None,
+        random_state: Optional[int] = None,
+        **kwargs: Any,
+    ) -> DataLoader:
+        """Asynchronous generation, coalesced with the concurrent requests. See `submit`.
+
+        Only the request running the batch uses a thread of the default executor, the other requests wait on the event loop.
+        """
+        future, work = self._enqueue(count, constraints, random_state, kwargs)
+
+        if work is not None:
+            await asyncio.get_running_loop().run_in_executor(None, work)
+
+        return await asyncio.wrap_future(future)
+
+
+_batchers: "weakref.WeakKeyDictionary[Any, GenerationBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+_batchers_lock = threading.Lock()
+
+
+def generation_batcher(plugin: Any) -> GenerationBatcher:
+    """The default batcher of a plugin, used by `Plugin.agenerate`.
+
+    The batchers are kept outside of the plugins, which stay serializable, and are released with the plugins.
+    """
+    with _batchers_lock:
+        batcher = _batchers.get(plugin)
+        if batcher is None:
+            batcher = GenerationBatcher(weakref.proxy(plugin))
+            _batchers[plugin] = batcher
+
+    return batcher
@@ -12,6 +12,7 @@ import torch
 from pydantic import validate_arguments
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
+from sklearn.utils import column_or_1d
 from torchvision import transforms
 
 # synthcity absolute
@@ -22,6 +23,57 @@ from synthcity.plugins.core.models.syn_seq.syn_seq_encoder import Syn_SeqEncoder
 from synthcity.utils.compression import compress_dataset, decompress_dataset
 from synthcity.utils.serialization import dataframe_hash
 
+# number of pixel values hashed at once by ImageDataLoader.hash
+IMAGE_HASH_CHUNK_SIZE = 2**23
+
+
+class _FactorizedLabelEncoder(LabelEncoder):
+    """LabelEncoder backed by the pandas hash tables.
+
+    The classes are the sorted unique values, as with LabelEncoder, but only the unique values are sorted: the values are encoded with pd.factorize, and decoded with a take on classes_. The encoder is a LabelEncoder, with the same classes_, so the serialized encoders remain compatible.
+
+    The missing and unknown values are handled by the LabelEncoder implementation.
+    """
+
+    def fit(self, y: Any) -> "_FactorizedLabelEncoder":
+        self.fit_transform(y)
+        return self
+
+    def fit_transform(self, y: Any) -> np.ndarray:
+        y = column_or_1d(y, warn=True)
+        codes, uniques = pd.factorize(y)
+        if (codes < 0).any():
+            return super().fit_transform(y)
+
+        order = np.argsort(uniques, kind="stable")
+        self.classes_ = uniques[order]
+
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        return ranks[codes]
+
+    def transform(self, y: Any) -> np.ndarray:
+        y = column_or_1d(y, warn=True)
+        # look up the unique values only
+        codes, uniques = pd.factorize(y)
+        lookup = pd.Index(self.classes_).get_indexer(uniques)
+        if (codes < 0).any() or (lookup < 0).any():
+            return super().transform(y)
+
+        return lookup[codes].astype(np.int64)
+
+    def inverse_transform(self, y: Any) -> np.ndarray:
+        y = column_or_1d(y, warn=True)
+        if (
+            len(y) == 0
+            or y.dtype.kind not in ["i", "u"]
+            or y.min() < 0
+            or y.max() >= len(self.classes_)
+        ):
+            return super().inverse_transform(y)
+
+        return self.classes_.take(y)
+
 
 class DataLoader(metaclass=ABCMeta):
     """
@@ -224,21 +276,20 @@ class DataLoader(metaclass=ABCMeta):
             encoders = {}
 
             for col in encoded.columns:
+                kind = encoded[col].infer_objects().dtype.kind
+                n_unique = encoded[col].nunique(dropna=False)
                 if (
-                    encoded[col].infer_objects().dtype.kind == "i"
+                    kind == "i"
                     and encoded[col].min() == 0
-                    and encoded[col].max() == len(encoded[col].unique()) - 1
+                    and encoded[col].max() == n_unique - 1
                 ):
                     continue
 
-                if (
-                    encoded[col].infer_objects().dtype.kind in ["O", "b"]
-                    or len(encoded[col].unique()) < 15
-                ):
-                    encoder = LabelEncoder().fit(encoded[col])
-                    encoded[col] = encoder.transform(encoded[col])
+                if kind in ["O", "b"] or n_unique < 15:
+                    encoder = _FactorizedLabelEncoder()
+                    encoded[col] = encoder.fit_transform(encoded[col])
                     encoders[col] = encoder
-                elif encoded[col].infer_objects().dtype.kind in ["M"]:
+                elif kind in ["M"]:
                     encoder = DatetimeEncoder().fit(encoded[col])
                     encoded[col] = encoder.transform(encoded[col]).values
                     encoders[col] = encoder
@@ -1605,6 +1656,8 @@ class ImageDataLoader(DataLoader):
             Optional width to use internally. If None, it is used the same value as height.
         train_size: float = 0.8
             Train dataset ratio.
+        data_transform: Optional[Any]
+            Optional image transform. If None, the images are resized to (height, width) and normalized. The subsets of a loader reuse its transform, and share its cached images.
     Example:
         >>> dataset = datasets.MNIST(".", download=True)
         >>>
@@ -1625,6 +1678,7 @@ class ImageDataLoader(DataLoader):
         width: Optional[int] = None,
         random_state: int = 0,
         train_size: float = 0.8,
+        data_transform: Optional[Any] = None,
         **kwargs: Any,
     ) -> None:
         if width is None:
@@ -1634,22 +1688,22 @@ class ImageDataLoader(DataLoader):
             X, y = data
             data = TensorDataset(images=X, targets=y)
 
-        self.data_transform = None
-
-        dummy, _ = data[0]
-        img_transform = []
-        if not isinstance(dummy, PIL.Image.Image):
-            img_transform = [transforms.ToPILImage()]
-
-        img_transform.extend(
-            [
-                transforms.Resize((height, width)),
-                transforms.ToTensor(),
-                transforms.Normalize(mean=(0.5,), std=(0.5,)),
-            ]
-        )
+        if data_transform is None:
+            dummy, _ = data[0]
+            img_transform = []
+            if not isinstance(dummy, PIL.Image.Image):
+                img_transform = [transforms.ToPILImage()]
+
+            img_transform.extend(
+                [
+                    transforms.Resize((height, width)),
+                    transforms.ToTensor(),
+                    transforms.Normalize(mean=(0.5,), std=(0.5,)),
+                ]
+            )
+            data_transform = transforms.Compose(img_transform)
 
-        self.data_transform = transforms.Compose(img_transform)
+        self.data_transform = data_transform
         data = FlexibleDataset(data, transform=self.data_transform)
 
         self.height = height
@@ -1688,6 +1742,23 @@ class ImageDataLoader(DataLoader):
 
         return x
 
+    def hash(self) -> str:
+        # Same value as dataframe_hash(self.dataframe()), computed over chunks of rows, without the full dataframe copy.
+        x = self.numpy().reshape(len(self), -1)
+        columns = np.argsort(np.arange(x.shape[1]).astype(str))
+        chunk_size = max(1, IMAGE_HASH_CHUNK_SIZE // max(1, x.shape[1]))
+
+        # uint64 arrays, the sum wraps around like the pandas one
+        total = np.zeros(1, dtype=np.uint64)
+        for start in range(0, len(x), chunk_size):
+            chunk = x[start : start + chunk_size][:, columns]
+            chunk = pd.DataFrame(chunk, index=pd.RangeIndex(start, start + len(chunk)))
+            total += pd.util.hash_pandas_object(chunk.fillna(0)).values.sum(
+                dtype=np.uint64, keepdims=True
+            )
+
+        return str(total[0])
+
     def info(self) -> dict:
         return {
             "data_type": self.data_type,
@@ -1709,6 +1780,7 @@ class ImageDataLoader(DataLoader):
             train_size=self.train_size,
             height=self.height,
             width=self.width,
+            data_transform=self.data_transform,
         )
 
     def sample(self, count: int, random_state: int = 0) -> "DataLoader":
@@ -1,5 +1,9 @@
 # stdlib
-from typing import List, Optional, Tuple
+import contextlib
+import os
+import tempfile
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 # third party
 import numpy as np
@@ -9,11 +13,104 @@ import torch
 from synthcity.utils.constants import DEVICE
 
 
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+class _TransformedImages:
+    """Lazily filled cache of the transformed images of a dataset, for a transform.
+
+    The images are stored in a memory-mapped .npy file, filled the first time each row is requested. The cache is shared by all the FlexibleDataset views of the same dataset and transform, so the subsets(train/test/sample) do not repeat the transform.
+
+    Args:
+        n_items: The length of the dataset
+        transform: An optional transform
+    """
+
+    def __init__(self, n_items: int, transform: Optional[torch.nn.Module]) -> None:
+        self.transform = transform
+        self.images: Optional[np.ndarray] = None
+        self.labels = np.empty(n_items, dtype=object)
+        self.done = np.zeros(n_items, dtype=bool)
+
+    def _allocate(self, row: np.ndarray) -> np.ndarray:
+        fd, path = tempfile.mkstemp(prefix="synthcity_images_", suffix=".npy")
+        os.close(fd)
+        images = np.lib.format.open_memmap(
+            path, mode="w+", dtype=row.dtype, shape=(len(self.done), *row.shape)
+        )
+        weakref.finalize(self, _remove_file, path)
+
+        return images
+
+    def get(
+        self, data: torch.utils.data.Dataset, indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the transformed images and the labels of the rows <indices> of <data>."""
+        indices = np.asarray(indices, dtype=int)
+        for idx in np.unique(indices[~self.done[indices]]):
+            x, y = data[idx]
+            if self.transform:
+                x = self.transform(x)
+            x = x.cpu().numpy()
+
+            if self.images is None:
+                self.images = self._allocate(x)
+            self.images[idx] = x
+            self.labels[idx] = y
+            self.done[idx] = True
+
+        if len(indices) == 0:
+            return np.zeros((0,)), np.asarray([])
+
+        if self.images is None:
+            raise RuntimeError("Invalid image cache state")
+
+        images = np.asarray(self.images)
+        start = indices[0]
+        if np.array_equal(indices, np.arange(start, start + len(indices))):
+            # contiguous rows, zero-copy view, read-only as it is shared by all the subsets
+            x = images[start : start + len(indices)]
+            x.flags.writeable = False
+        else:
+            x = images[indices]
+
+        return x, np.asarray(self.labels[indices].tolist())
+
+
+# dataset -> id(transform) -> the cached transformed images
+_transformed_images: "weakref.WeakKeyDictionary[Any, Dict[int, _TransformedImages]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_images(
+    data: torch.utils.data.Dataset, transform: Optional[torch.nn.Module]
+) -> _TransformedImages:
+    # The transforms are identified by object, not by value: distinct transforms can have the same repr(e.g. transforms.Lambda).
+    # Each entry holds a reference to its transform, so the id cannot be reused while the entry exists.
+    key = id(transform)
+    try:
+        entries = _transformed_images.setdefault(data, {})
+    except TypeError:
+        # the dataset does not support weak references, cache on the caller only
+        return _TransformedImages(len(data), transform)
+
+    # the entries must not reference the dataset, which is the weak key
+    if key not in entries or entries[key].transform is not transform:
+        entries[key] = _TransformedImages(len(data), transform)
+
+    return entries[key]
+
+
 class FlexibleDataset(torch.utils.data.Dataset):
     """Helper dataset wrapper for post-processing or transforming another dataset. Used for controlling the image sizes for the synthcity models.
 
     The class supports adding custom transforms to existing datasets, and to subsample a set of indices.
 
+    The transformed images are cached per (source dataset, transform), in a memory-mapped array shared by all the subsets of the source dataset, so the transforms must be deterministic.
+
     Args:
         data: torch.Dataset
         transform: An optional list of transforms
@@ -50,25 +147,31 @@ class FlexibleDataset(torch.utils.data.Dataset):
 
         return (len(self), *x.shape)
 
+    def _source(self) -> Tuple[torch.utils.data.Dataset, np.ndarray]:
+        """The underlying dataset and indices, skipping the nested subsets without transforms."""
+        data = self.data
+        indices = self.indices
+        while isinstance(data, FlexibleDataset) and not data.transform:
+            indices = data.indices[indices]
+            data = data.data
+
+        return data, indices
+
     def numpy(self) -> Tuple[np.ndarray, np.ndarray]:
         if self.ndarrays is not None:
             return self.ndarrays
 
-        x_buff = []
-        y_buff = []
-        for idx in range(len(self)):
-            x_local, y_local = self[idx]
-            x_buff.append(x_local.unsqueeze(0).cpu().numpy())
-            y_buff.append(y_local)
-
-        x = np.concatenate(x_buff, axis=0)
-        y = np.asarray(y_buff)
+        data, indices = self._source()
+        x, y = _cached_images(data, self.transform).get(data, indices)
 
         self.ndarrays = (x, y)
         return x, y
 
     def tensors(self) -> Tuple[torch.Tensor, torch.Tensor]:
         x, y = self.numpy()
+        if not x.flags.writeable:
+            # the shared cache views are read-only, the tensors get their own copy
+            x = x.copy()
 
         return torch.from_numpy(x), torch.from_numpy(y)
 
@@ -170,19 +273,32 @@ class NumpyDataset(torch.utils.data.Dataset):
     Args:
         X: np.ndarray
         y: np.ndarray
+        indices: An optional list of rows to use, without copying the arrays (for example, the folds of a memory-mapped array)
     """
 
-    def __init__(self, X: np.ndarray, y: np.ndarray) -> None:
+    def __init__(
+        self, X: np.ndarray, y: np.ndarray, indices: Optional[np.ndarray] = None
+    ) -> None:
         super().__init__()
 
         self.X = X
         self.y = y
+        self.indices = None if indices is None else np.asarray(indices)
 
     def __getitem__(self, index: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        if self.indices is not None:
+            index = self.indices[index]
+
         x = self.X[index]
         y = self.y[index]
+        if not x.flags.writeable:
+            # read-only memory map
+            x = np.array(x)
 
         return torch.from_numpy(x).to(DEVICE), y
 
     def __len__(self) -> int:
+        if self.indices is not None:
+            return len(self.indices)
+
         return len(self.X)
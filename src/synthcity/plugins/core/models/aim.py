@@ -254,7 +254,7 @@ class AIM(Mechanism):
     def worst_approximated(
         self,
         candidates: Dict,
-        answers: Dict,
+        data: Dataset,
         model: GraphicalModel,
         eps: float,
         sigma: float,
@@ -263,7 +263,7 @@ class AIM(Mechanism):
         sensitivity = {}
         for cl in candidates:
             wgt = candidates[cl]
-            x = answers[cl]
+            x = data.project(cl).datavector()
             bias = np.sqrt(2 / np.pi) * sigma * model.domain.size(cl)
             xest = model.project(cl).datavector()
             errors[cl] = wgt * (np.linalg.norm(x - xest, 1) - bias)
@@ -277,7 +277,6 @@ class AIM(Mechanism):
         rounds = self.rounds or 16 * len(data.domain)
         workload = [cl for cl, _ in W]
         candidates = compile_workload(workload)
-        answers = {cl: data.project(cl).datavector() for cl in candidates}
 
         oneway = [cl for cl in candidates if len(cl) == 1]
 
@@ -318,9 +317,7 @@ class AIM(Mechanism):
             rho_used += 1.0 / 8 * epsilon**2 + 0.5 / sigma**2
             size_limit = self.max_model_size * rho_used / self.rho
             small_candidates = filter_candidates(candidates, model, size_limit)
-            cl = self.worst_approximated(
-                small_candidates, answers, model, epsilon, sigma
-            )
+            cl = self.worst_approximated(small_candidates, data, model, epsilon, sigma)
 
             n = data.domain.size(cl)
             Q = Identity(n)
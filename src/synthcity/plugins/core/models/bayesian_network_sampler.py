@@ -0,0 +1,78 @@
+"""Compiled ancestral sampler for the discrete Bayesian networks fitted with pgmpy.
+"""
+
+# stdlib
+from typing import Any, List, Tuple
+
+# third party
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+
+class BayesianNetworkSampler:
+    """Vectorized forward sampling from a fitted pgmpy Bayesian network.
+
+    The CPDs are compiled once into NumPy tables: for each node, the cumulative probabilities of its states, indexed by the code of the parents state. The ancestral sampling draws a full column per node, using a single `searchsorted` over the cumulative tables, instead of the per-node DataFrame handling of `BayesianModelSampling.forward_sample`.
+
+    The samples follow the same distribution as `BayesianModelSampling.forward_sample`, with the same columns and state names.
+
+    Args:
+        network: pgmpy.models.BayesianNetwork
+            The fitted network, with a CPD for each node.
+    """
+
+    def __init__(self, network: Any) -> None:
+        self.columns = list(network.nodes())
+
+        # (node, parent positions, parent cardinalities, cumulative table, state names)
+        self.nodes: List[Tuple[str, List[int], List[int], np.ndarray, np.ndarray]] = []
+        for node in nx.topological_sort(network):
+            cpd = network.get_cpds(node)
+            parents = cpd.variables[1:]
+
+            # (parents states, node states), the parents states in C order
+            probs = np.asarray(cpd.get_values(), dtype=float).T
+            totals = probs.sum(axis=1, keepdims=True)
+            probs = np.where(totals > 0, probs, 1.0)
+            cdf = np.cumsum(probs, axis=1)
+            cdf /= cdf[:, -1:]
+            # offset the tables by the parents state, so a single search covers all the rows
+            cdf += np.arange(len(cdf))[:, None]
+
+            self.nodes.append(
+                (
+                    node,
+                    [self.columns.index(parent) for parent in parents],
+                    [int(card) for card in cpd.cardinality[1:]],
+                    cdf.ravel(),
+                    np.asarray(cpd.state_names[node]),
+                )
+            )
+
+    def sample(self, count: int) -> pd.DataFrame:
+        """Generate <count> samples.
+
+        Args:
+            count: int
+                The number of samples.
+
+        Returns:
+            pd.DataFrame with a column per node, containing the state names.
+        """
+        codes = np.zeros((len(self.columns), count), dtype=np.int64)
+        output = {}
+        for node, parents, parents_card, cdf, states in self.nodes:
+            if len(parents) > 0:
+                parent_state = np.ravel_multi_index(codes[parents], parents_card)
+            else:
+                parent_state = np.zeros(count, dtype=np.int64)
+
+            u = np.random.random_sample(count)
+            flat = np.searchsorted(cdf, parent_state + u, side="right")
+            node_codes = np.minimum(flat - parent_state * len(states), len(states) - 1)
+
+            codes[self.columns.index(node)] = node_codes
+            output[node] = states[node_codes]
+
+        return pd.DataFrame(output, columns=self.columns)
@@ -582,3 +582,43 @@ def suggest_image_classifier_arch(
         )
 
     raise ValueError(f"unsupported image arch : ({n_channels}, {height}, {width})")
+
+
+def suggest_image_feature_extractor(
+    n_channels: int,
+    n_features: int = 64,
+    nonlin: str = "leaky_relu",
+    random_state: int = 0,
+    device: Any = DEVICE,
+) -> nn.Module:
+    """Helper for a small convolutional feature extractor, for comparing image distributions in a low-dimensional space.
+
+    The network is not trained: the weights are the seeded random initialization, so the features are reproducible. Works for any image size.
+
+    Args:
+        n_channels: int
+            Number of channels in the image
+        n_features: int
+            Number of output features
+        nonlin: str
+            name of the activation activation layers. Can be relu, elu, prelu or leaky_relu
+        random_state: int
+            random_state used for the weights
+        device: str
+            PyTorch device. cpu, cuda
+    """
+    act = Act[map_nonlin(nonlin)]
+    with torch.random.fork_rng(devices=[]):
+        torch.manual_seed(random_state)
+        model = nn.Sequential(
+            nn.Conv2d(n_channels, 16, kernel_size=3, stride=2, padding=1),
+            act(),
+            nn.Conv2d(16, 32, kernel_size=3, stride=2, padding=1),
+            act(),
+            nn.Conv2d(32, n_features, kernel_size=3, stride=2, padding=1),
+            act(),
+            nn.AdaptiveAvgPool2d(1),
+            nn.Flatten(),
+        )
+
+    return model.to(device).eval()
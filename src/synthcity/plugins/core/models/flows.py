@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Sequence, Tuple
 
 # third party
 import numpy as np
@@ -24,12 +24,13 @@ from nflows.transforms.permutations import RandomPermutation
 from nflows.transforms.svd import SVDLinear
 from torch import nn, optim
 from torch.nn import functional as F
-from torch.utils.data import DataLoader, TensorDataset
 from tqdm import tqdm
 
 # synthcity absolute
 from synthcity.metrics.weighted_metrics import WeightedMetrics
+from synthcity.utils.callbacks import Callback, CallbackHookMixin
 from synthcity.utils.constants import DEVICE
+from synthcity.utils.tensor_loader import TensorDataLoader
 
 
 def create_alternating_binary_mask(features: int, even: bool = True) -> torch.Tensor:
@@ -45,7 +46,7 @@ def create_alternating_binary_mask(features: int, even: bool = True) -> torch.Te
     return mask
 
 
-class NormalizingFlows(nn.Module):
+class NormalizingFlows(nn.Module, CallbackHookMixin):
     """Normalizing Flows are generative models which produce tractable distributions where both sampling and density evaluation can be efficient and exact.
 
     Args:
@@ -101,6 +102,8 @@ class NormalizingFlows(nn.Module):
             Max number of iterations without any improvement before early stopping is trigged.
         patience_metric: Optional[WeightedMetrics]
             If not None, the metric is used for evaluation the criterion for early stopping.
+        callbacks: Sequence[Callback]
+            Optional training callbacks. The latest `patience_metric` score is exposed to them as `valid_score`.
     """
 
     def __init__(
@@ -125,8 +128,11 @@ class NormalizingFlows(nn.Module):
         n_iter_print: int = 10,
         patience: int = 20,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
     ) -> None:
-        super(NormalizingFlows, self).__init__()
+        nn.Module.__init__(self)
+        CallbackHookMixin.__init__(self, callbacks)
+        self.valid_score: Optional[float] = None
         self.device = device
         self.n_iter = n_iter
         self.n_layers_hidden = n_layers_hidden
@@ -149,9 +155,8 @@ class NormalizingFlows(nn.Module):
         self.patience = patience
         self.patience_metric = patience_metric
 
-    def dataloader(self, X: torch.Tensor) -> DataLoader:
-        dataset = TensorDataset(X)
-        return DataLoader(dataset, batch_size=self.batch_size, pin_memory=False)
+    def dataloader(self, X: torch.Tensor) -> TensorDataLoader:
+        return TensorDataLoader(X, batch_size=self.batch_size)
 
     def generate(self, count: int) -> np.ndarray:
         return self(count).detach().cpu().numpy()
@@ -195,6 +200,7 @@ class NormalizingFlows(nn.Module):
             pd.DataFrame(X.detach().cpu().numpy()),
             pd.DataFrame(X_syn),
         )
+        self.valid_score = new_score
         score = prev_score
         if self.patience_metric.direction() == "minimize":
             if new_score >= prev_score:
@@ -236,7 +242,11 @@ class NormalizingFlows(nn.Module):
         patience = 0
         best_state_dict = None
 
+        self.on_fit_begin()
         for it in tqdm(range(self.n_iter)):
+            self.valid_score = None
+            self.on_epoch_begin()
+            early_stop = False
             self.train()
             for _, data in enumerate(loader):
                 optimizer.zero_grad()
@@ -257,12 +267,17 @@ class NormalizingFlows(nn.Module):
                     if save:
                         best_state_dict = self.state_dict()
 
-                if patience >= self.patience and it >= self.n_iter_min:
-                    break
+                early_stop = patience >= self.patience and it >= self.n_iter_min
+
+            self.on_epoch_end()
+            if early_stop:
+                break
 
         if best_state_dict is not None:
             self.load_state_dict(best_state_dict)
 
+        self.on_fit_end()
+
         return self
 
     def _check_tensor(self, X: torch.Tensor) -> torch.Tensor:
@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 # third party
 import numpy as np
@@ -14,14 +14,16 @@ from tqdm import tqdm
 # synthcity absolute
 import synthcity.logger as log
 from synthcity.metrics.weighted_metrics import WeightedMetrics
+from synthcity.utils.callbacks import Callback, CallbackHookMixin
 from synthcity.utils.constants import DEVICE
 from synthcity.utils.reproducibility import clear_cache, enable_reproducible_results
+from synthcity.utils.tensor_loader import TensorDataLoader
 
 # synthcity relative
 from .mlp import MLP
 
 
-class GAN(nn.Module):
+class GAN(nn.Module, CallbackHookMixin):
     """
     .. inheritance-diagram:: synthcity.plugins.core.models.gan.GAN
         :parts: 1
@@ -102,6 +104,8 @@ class GAN(nn.Module):
             Max number of iterations without any improvement before early stopping is trigged.
         patience_metric: Optional[WeightedMetrics]
             If not None, the metric is used for evaluation the criterion for early stopping.
+        callbacks: Sequence[Callback]
+            Optional training callbacks. The latest `patience_metric` score is exposed to them as `valid_score`.
         # privacy settings
         dp_enabled: bool
             Train the discriminator with Differential Privacy guarantees
@@ -157,6 +161,7 @@ class GAN(nn.Module):
         n_iter_print: int = 10,
         patience: int = 20,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
         # privacy settings
         dp_enabled: bool = False,
         dp_delta: Optional[float] = None,
@@ -164,7 +169,9 @@ class GAN(nn.Module):
         dp_max_grad_norm: float = 2,
         dp_secure_mode: bool = False,
     ) -> None:
-        super(GAN, self).__init__()
+        nn.Module.__init__(self)
+        CallbackHookMixin.__init__(self, callbacks)
+        self.valid_score: Optional[float] = None
 
         extra_penalty_list = ["identifiability_penalty"]
         for penalty in generator_extra_penalties:
@@ -320,16 +327,22 @@ class GAN(nn.Module):
 
     def dataloader(
         self, X: torch.Tensor, cond: Optional[torch.Tensor] = None
-    ) -> DataLoader:
-        if cond is None:
-            dataset = TensorDataset(X)
-        else:
-            dataset = TensorDataset(X, cond)
-        return DataLoader(
-            dataset,
+    ) -> Union[DataLoader, TensorDataLoader]:
+        tensors = (X,) if cond is None else (X, cond)
+
+        if self.dp_enabled and self.dp_secure_mode:
+            # Opacus replaces the random generator of the torch sampler with a secure one.
+            return DataLoader(
+                TensorDataset(*tensors),
+                batch_size=self.batch_size,
+                sampler=self.dataloader_sampler,
+                pin_memory=False,
+            )
+
+        return TensorDataLoader(
+            *tensors,
             batch_size=self.batch_size,
             sampler=self.dataloader_sampler,
-            pin_memory=False,
         )
 
     def _train_epoch_generator(
@@ -470,7 +483,7 @@ class GAN(nn.Module):
 
     def _train_epoch(
         self,
-        loader: DataLoader,
+        loader: Union[DataLoader, TensorDataLoader],
         fake_labels_generator: Optional[Callable] = None,
         true_labels_generator: Optional[Callable] = None,
     ) -> Tuple[float, float]:
@@ -533,6 +546,7 @@ class GAN(nn.Module):
             pd.DataFrame(X.detach().cpu().numpy()),
             pd.DataFrame(X_syn),
         )
+        self.valid_score = new_score
         score = prev_score
         if self.patience_metric.direction() == "minimize":
             if new_score >= prev_score:
@@ -612,7 +626,11 @@ class GAN(nn.Module):
         patience = 0
         best_state_dict = None
 
+        self.on_fit_begin()
         for i in tqdm(range(self.generator_n_iter)):
+            self.valid_score = None
+            self.on_epoch_begin()
+            early_stop = False
             g_loss, d_loss = self._train_epoch(
                 loader,
                 fake_labels_generator=fake_labels_generator,
@@ -635,13 +653,18 @@ class GAN(nn.Module):
                     if save:
                         best_state_dict = self.state_dict()
 
-                    if patience >= self.patience and i >= self.n_iter_min:
-                        log.debug(f"[{i}/{self.generator_n_iter}] Early stopping")
-                        break
+                    early_stop = patience >= self.patience and i >= self.n_iter_min
+
+            self.on_epoch_end()
+            if early_stop:
+                log.debug(f"[{i}/{self.generator_n_iter}] Early stopping")
+                break
 
         if best_state_dict is not None:
             self.load_state_dict(best_state_dict)
 
+        self.on_fit_end()
+
         return self
 
     def _check_tensor(self, X: torch.Tensor) -> torch.Tensor:
@@ -9,10 +9,40 @@ import pandas as pd
 from .domain import Domain
 
 
+def _code_dtype(shape):
+    """smallest signed integer type able to store the codes of a domain"""
+    largest = max(shape, default=0)
+    for dtype in [np.int8, np.int16, np.int32]:
+        if largest <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _encode(df, domain):
+    """integer-code the attributes of a dataframe
+
+    The codes follow the bins of np.histogramdd with the edges 0, 1, ..., n: a value v
+    gets the code floor(v), the value n gets the code n - 1, and the values outside
+    of [0, n] (or missing) get the code -1, which is ignored by the datavectors.
+    """
+    values = np.empty((df.shape[0], len(domain.attrs)), dtype=_code_dtype(domain.shape))
+    for i, (attr, n) in enumerate(zip(domain.attrs, domain.shape)):
+        col = df[attr].to_numpy(dtype=float, na_value=np.nan)
+        invalid = ~((col >= 0) & (col <= n))
+        codes = np.floor(np.where(invalid, 0, col)).astype(np.int64)
+        codes[codes == n] = n - 1
+        codes[invalid] = -1
+        values[:, i] = codes
+    return values
+
+
 class Dataset:
     def __init__(self, df, domain, weights=None):
         """create a Dataset object
 
+        The data is stored as a matrix of integer codes. The projections share this
+        matrix and the cache of the datavectors.
+
         :param df: a pandas dataframe
         :param domain: a domain object
         :param weight: weight for each row
@@ -21,9 +51,44 @@ class Dataset:
             raise AssertionError("data must contain domain attributes")
         if weights is not None and df.shape[0] != weights.size:
             raise AssertionError("weights must be the same size as the data")
+        self._init(_encode(df, domain), domain, weights)
+
+    def _init(self, values, domain, weights, columns=None, cache=None):
         self.domain = domain
-        self.df = df.loc[:, domain.attrs]
         self.weights = weights
+        self._values = values
+        self._columns = list(range(len(domain))) if columns is None else columns
+        self._cache = {} if cache is None else cache
+
+    @staticmethod
+    def from_codes(values, domain, weights=None):
+        """create a Dataset object from a matrix of integer codes
+
+        :param values: a (records x attributes) integer array, with the codes of each
+            attribute in [0, domain size)
+        :param domain: a domain object
+        :param weight: weight for each row
+        """
+        if values.ndim != 2 or values.shape[1] != len(domain):
+            raise AssertionError("values must have one column per domain attribute")
+        if weights is not None and values.shape[0] != weights.size:
+            raise AssertionError("weights must be the same size as the data")
+        data = Dataset.__new__(Dataset)
+        data._init(
+            values.astype(_code_dtype(domain.shape), copy=False), domain, weights
+        )
+        return data
+
+    @property
+    def values(self):
+        """the integer codes of the attributes, in the domain order"""
+        if self._columns == list(range(self._values.shape[1])):
+            return self._values
+        return self._values[:, self._columns]
+
+    @property
+    def df(self):
+        return pd.DataFrame(self.values.astype(int), columns=self.domain.attrs)
 
     @staticmethod
     def synthetic(domain, N):
@@ -53,9 +118,11 @@ class Dataset:
         """project dataset onto a subset of columns"""
         if type(cols) in [str, int]:
             cols = [cols]
-        data = self.df.loc[:, cols]
         domain = self.domain.project(cols)
-        return Dataset(data, domain, self.weights)
+        columns = [self._columns[self.domain.attrs.index(col)] for col in cols]
+        data = Dataset.__new__(Dataset)
+        data._init(self._values, domain, self.weights, columns, self._cache)
+        return data
 
     def drop(self, cols):
         proj = [c for c in self.domain if c not in cols]
@@ -63,10 +130,32 @@ class Dataset:
 
     @property
     def records(self):
-        return self.df.shape[0]
+        return self._values.shape[0]
 
     def datavector(self, flatten=True):
-        """return the database in vector-of-counts form"""
-        bins = [range(n + 1) for n in self.domain.shape]
-        ans = np.histogramdd(self.df.values, bins, weights=self.weights)[0]
-        return ans.flatten() if flatten else ans
+        """return the database in vector-of-counts form
+
+        The counts are computed with np.bincount on the flat cell indices of the rows,
+        and cached for the dataset and its projections.
+        """
+        key = tuple(self._columns)
+        ans = self._cache.get(key)
+        if ans is None:
+            ans = self._count()
+            self._cache[key] = ans
+        ans = ans.copy()
+        return ans if flatten else ans.reshape(self.domain.shape)
+
+    def _count(self):
+        values = self.values
+        weights = self.weights
+        valid = (values >= 0).all(axis=1)
+        if not valid.all():
+            values = values[valid]
+            weights = None if weights is None else weights[valid]
+        if len(self.domain) == 0:
+            total = values.shape[0] if weights is None else weights.sum()
+            return np.array([total], dtype=float)
+        cells = np.ravel_multi_index(values.T.astype(np.intp), self.domain.shape)
+        counts = np.bincount(cells, weights=weights, minlength=self.domain.size())
+        return counts.astype(float)
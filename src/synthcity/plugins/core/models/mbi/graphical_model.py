@@ -6,7 +6,6 @@ from functools import reduce
 import cloudpickle
 import networkx as nx
 import numpy as np
-import pandas as pd
 
 # synthcity relative
 from .clique_vector import CliqueVector
@@ -227,50 +226,87 @@ class GraphicalModel:
         Valid options for method are 'round' and 'sample'."""
         total = int(self.total) if rows is None else rows
         cols = self.domain.attrs
-        data = np.zeros((total, len(cols)), dtype=int)
-        df = pd.DataFrame(data, columns=cols)
+        data = np.zeros((total, len(cols)), dtype=np.int64)
         cliques = [set(cl) for cl in self.cliques]
 
-        def synthetic_col(counts, total):
-            if method == "sample":
-                probas = counts / counts.sum()
-                return np.random.choice(counts.size, total, True, probas)
-            counts *= total / counts.sum()
-            frac, integ = np.modf(counts)
-            integ = integ.astype(int)
-            extra = total - integ.sum()
-            if extra > 0:
-                idx = np.random.choice(counts.size, extra, False, frac / frac.sum())
-                integ[idx] += 1
-            vals = np.repeat(np.arange(counts.size), integ)
-            np.random.shuffle(vals)
-            return vals
-
         order = self.elimination_order[::-1]
-        col = order[0]
-        marg = self.project([col]).datavector(flatten=False)
-        df.loc[:, col] = synthetic_col(marg, total)
-        used = {col}
-
-        for col in order[1:]:
+        used = []
+        for col in order:
             relevant = [cl for cl in cliques if col in cl]
-            relevant = used.intersection(set.union(*relevant))
-            proj = tuple(relevant)
-            used.add(col)
+            proj = tuple(a for a in used if a in set.union(*relevant))
+            used.append(col)
             marg = self.project(proj + (col,)).datavector(flatten=False)
 
-            def foo(group):
-                idx = group.name
-                vals = synthetic_col(marg[idx], group.shape[0])
-                group[col] = vals
-                return group
-
+            # the rows are grouped by the values of the already generated parents
             if len(proj) >= 1:
-                df = df.groupby(list(proj), group_keys=False).apply(foo)
+                axes = [cols.index(a) for a in proj]
+                groups = np.ravel_multi_index(data[:, axes].T, marg.shape[:-1])
             else:
-                df[col] = synthetic_col(marg, df.shape[0])
-
-        return Dataset(df, self.domain)
+                groups = np.zeros(total, dtype=np.int64)
+            marg = marg.reshape(-1, marg.shape[-1])
+            data[:, cols.index(col)] = synthetic_cols(marg, groups, method)
+
+        return Dataset.from_codes(data, self.domain)
+
+
+def synthetic_cols(marg, groups, method="round"):
+    """Generate the values of a column for rows grouped by the values of its parents.
+
+    All the groups are sampled at once, with numpy operations over the
+    (groups x values) table, instead of a python call per group.
+
+    :param marg: a (parent cells x column values) table of counts
+    :param groups: the parent cell of each row
+    :param method: 'sample' draws each row independently from the conditional
+        distribution of its group. 'round' allocates the values of each group in
+        proportion to the counts, distributes the remainder randomly based on the
+        fractional parts, and shuffles the values within the group.
+    :return: the generated values, one per row
+    """
+    total = groups.size
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    group_sizes = np.bincount(groups, minlength=marg.shape[0])
+    present = np.flatnonzero(group_sizes)
+    group_sizes = group_sizes[present]
+    position = np.zeros(marg.shape[0], dtype=np.int64)
+    position[present] = np.arange(len(present))
+    inverse = position[groups]
+    counts = marg[present].astype(float)
+    sums = counts.sum(axis=1, keepdims=True)
+    # uniform distribution for the groups without mass
+    counts = np.where(sums > 0, counts, 1.0)
+    probas = counts / counts.sum(axis=1, keepdims=True)
+    size = probas.shape[1]
+
+    if method == "sample":
+        cdf = np.cumsum(probas, axis=1)
+        cdf[:, -1] = 1.0
+        # the cdfs are shifted by the group position, so a single search covers all the groups
+        flat = (cdf + np.arange(len(present))[:, None]).ravel()
+        u = np.random.random_sample(total)
+        vals = np.searchsorted(flat, inverse + u, side="right") - inverse * size
+        return np.minimum(vals, size - 1)
+
+    frac, integ = np.modf(probas * group_sizes[:, None])
+    integ = integ.astype(np.int64)
+    extra = np.maximum(group_sizes - integ.sum(axis=1), 0)
+
+    # weighted sampling without replacement of the remainders: the top keys log(u) / frac
+    with np.errstate(divide="ignore"):
+        keys = np.where(
+            frac > 0, np.log(np.random.random_sample(frac.shape)) / frac, -np.inf
+        )
+    ranks = np.argsort(np.argsort(-keys, axis=1, kind="stable"), axis=1)
+    integ += ranks < extra[:, None]
+
+    # the values of each group, in the group order, assigned to the rows of the group in a random order
+    values = np.repeat(np.tile(np.arange(size), len(present)), integ.ravel())
+    order = np.argsort(inverse + np.random.random_sample(total))
+    vals = np.empty(total, dtype=np.int64)
+    vals[order] = values
+    return vals
 
 
 def variable_elimination_logspace(potentials, elim, total):
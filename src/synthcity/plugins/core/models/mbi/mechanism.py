@@ -52,7 +52,7 @@ def run(
             l2 += np.square(Q).sum(axis=0).max()  # for dense matrices
 
     if bounded:
-        total = dataset.df.shape[0]
+        total = dataset.records
         l1 *= 2
         l2 *= 2
 
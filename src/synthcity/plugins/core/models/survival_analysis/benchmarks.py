@@ -1,10 +1,11 @@
 # stdlib
 import copy
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Generator, List
 
 # third party
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import StratifiedKFold, train_test_split
 
@@ -21,6 +22,140 @@ from synthcity.plugins.core.models.survival_analysis.metrics import (
 from synthcity.utils.dataframe import constant_columns
 
 
+def _split_folds(
+    X: pd.DataFrame,
+    T: pd.DataFrame,
+    Y: pd.DataFrame,
+    n_folds: int,
+    random_state: int,
+) -> List[tuple]:
+    """Split the data into (X_train, X_test, T_train, T_test, Y_train, Y_test) folds."""
+    if n_folds == 1:
+        return [tuple(train_test_split(X, T, Y, random_state=random_state))]
+
+    skf = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
+
+    folds: List[tuple] = []
+    for train_index, test_index in skf.split(X, Y):
+        folds.append(
+            (
+                X.loc[X.index[train_index]],
+                X.loc[X.index[test_index]],
+                T.loc[T.index[train_index]],
+                T.loc[T.index[test_index]],
+                Y.loc[Y.index[train_index]],
+                Y.loc[Y.index[test_index]],
+            )
+        )
+
+    return folds
+
+
+def _train_and_predict(
+    estimator: Any,
+    pretrained: bool,
+    cv_idx: int,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    T_train: pd.DataFrame,
+    T_test: pd.DataFrame,
+    Y_train: pd.DataFrame,
+    time_horizons: list,
+) -> np.ndarray:
+    train_max = T_train.max()
+    T_test[T_test > train_max] = train_max
+
+    if pretrained:
+        model = estimator[cv_idx]
+    else:
+        model = copy.deepcopy(estimator)
+
+        constant_cols = constant_columns(X_train)
+        X_train = X_train.drop(columns=constant_cols)
+        X_test = X_test.drop(columns=constant_cols)
+
+        model.fit(X_train, T_train, Y_train)
+
+    return model.predict(X_test, time_horizons).to_numpy()
+
+
+def _get_surv_metrics(
+    estimator: Any,
+    pretrained: bool,
+    cv_idx: int,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    T_train: pd.DataFrame,
+    T_test: pd.DataFrame,
+    Y_train: pd.DataFrame,
+    Y_test: pd.DataFrame,
+    time_horizons: list,
+) -> tuple:
+    """Train the model on a fold, and evaluate the C-INDEX and the Brier score over all the horizons."""
+    pred = _train_and_predict(
+        estimator,
+        pretrained,
+        cv_idx,
+        X_train,
+        X_test,
+        T_train,
+        T_test,
+        Y_train,
+        time_horizons,
+    )
+
+    c_index = 0.0
+    brier_score = 0.0
+
+    for k in range(len(time_horizons)):
+        eval_horizon = min(time_horizons[k], np.max(T_test) - 1)
+
+        def get_score(fn: Callable) -> float:
+            return fn(
+                T_train,
+                Y_train,
+                pred[:, k],
+                T_test,
+                Y_test,
+                eval_horizon,
+            ) / (len(time_horizons))
+
+        c_index += get_score(evaluate_c_index)
+        brier_score += get_score(evaluate_brier_score)
+
+    return c_index, brier_score
+
+
+def _get_clf_metrics(
+    estimator: Any,
+    pretrained: bool,
+    horizon_idx: int,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    T_train: pd.DataFrame,
+    T_test: pd.DataFrame,
+    Y_train: pd.DataFrame,
+    Y_test: pd.DataFrame,
+    time_horizons: list,
+) -> float:
+    """Train the model on a fold of the dataset for a horizon, and evaluate the AUCROC at that horizon."""
+    pred = _train_and_predict(
+        estimator,
+        pretrained,
+        0,
+        X_train,
+        X_test,
+        T_train,
+        T_test,
+        Y_train,
+        time_horizons,
+    )
+
+    local_preds = pd.DataFrame(pred[:, horizon_idx]).squeeze()
+
+    return roc_auc_score(Y_test, local_preds) / (len(time_horizons))
+
+
 def evaluate_survival_model(
     estimator: Any,
     X: pd.DataFrame,
@@ -31,9 +166,12 @@ def evaluate_survival_model(
     metrics: List[str] = ["c_index", "brier_score", "aucroc"],
     random_state: int = 0,
     pretrained: bool = False,
+    n_jobs: int = 1,
 ) -> Dict:
     """Helper for evaluating survival analysis tasks.
 
+    The folds, and the (horizon, fold) pairs of the AUCROC, are independent, and are evaluated in parallel when `n_jobs` is not 1.
+
     Args:
         model_name: str
             The model to evaluate
@@ -55,6 +193,8 @@ def evaluate_survival_model(
             Random seed
         pretrained: bool
             If the estimator was trained or not
+        n_jobs: int
+            Number of worker processes for the folds evaluation. -1 uses all the CPUs.
     """
 
     supported_metrics = ["c_index", "brier_score", "aucroc"]
@@ -66,201 +206,49 @@ def evaluate_survival_model(
 
         results[metric] = np.zeros(n_folds)
 
-    def _get_surv_metrics(
-        cv_idx: int,
-        X_train: pd.DataFrame,
-        X_test: pd.DataFrame,
-        T_train: pd.DataFrame,
-        T_test: pd.DataFrame,
-        Y_train: pd.DataFrame,
-        Y_test: pd.DataFrame,
-        time_horizons: list,
-    ) -> tuple:
-        train_max = T_train.max()
-        T_test[T_test > train_max] = train_max
-
-        if pretrained:
-            model = estimator[cv_idx]
-        else:
-            model = copy.deepcopy(estimator)
-
-            constant_cols = constant_columns(X_train)
-            X_train = X_train.drop(columns=constant_cols)
-            X_test = X_test.drop(columns=constant_cols)
-
-            model.fit(X_train, T_train, Y_train)
-
-        try:
-            pred = model.predict(X_test, time_horizons).to_numpy()
-        except BaseException as e:
-            raise e
-
-        c_index = 0.0
-        brier_score = 0.0
+    folds = _split_folds(X, T, Y, n_folds, random_state)
+    folds_time_horizons = [
+        [t for t in time_horizons if t > np.min(fold[3])] for fold in folds
+    ]
+    # the AUCROC uses the horizons of the last fold
+    local_time_horizons = folds_time_horizons[-1]
+
+    def _tasks() -> Generator:
+        for cv_idx, fold in enumerate(folds):
+            yield delayed(_get_surv_metrics)(
+                estimator, pretrained, cv_idx, *fold, folds_time_horizons[cv_idx]
+            )
+
+        if "aucroc" not in metrics:
+            return
 
         for k in range(len(time_horizons)):
-            eval_horizon = min(time_horizons[k], np.max(T_test) - 1)
-
-            def get_score(fn: Callable) -> float:
-                return fn(
-                    T_train,
-                    Y_train,
-                    pred[:, k],
-                    T_test,
-                    Y_test,
-                    eval_horizon,
-                ) / (len(time_horizons))
-
-            c_index += get_score(evaluate_c_index)
-            brier_score += get_score(evaluate_brier_score)
-
-        return c_index, brier_score
-
-    def _get_clf_metrics(
-        cv_idx: int,
-        X_train: pd.DataFrame,
-        X_test: pd.DataFrame,
-        T_train: pd.DataFrame,
-        T_test: pd.DataFrame,
-        Y_train: pd.DataFrame,
-        Y_test: pd.DataFrame,
-        time_horizons: list,
-    ) -> float:
-        cv_idx = 0
-
-        train_max = T_train.max()
-        T_test[T_test > train_max] = train_max
-
-        if pretrained:
-            model = estimator[cv_idx]
-        else:
-            model = copy.deepcopy(estimator)
-
-            constant_cols = constant_columns(X_train)
-            X_train = X_train.drop(columns=constant_cols)
-            X_test = X_test.drop(columns=constant_cols)
-
-            model.fit(X_train, T_train, Y_train)
-
-        try:
-            pred = model.predict(X_test, time_horizons).to_numpy()
-        except BaseException as e:
-            raise e
-
-        local_preds = pd.DataFrame(pred[:, k]).squeeze()
-
-        return roc_auc_score(Y_test, local_preds) / (len(time_horizons))
+            X_horizon, T_horizon, Y_horizon = generate_dataset_for_horizon(
+                X, T, Y, time_horizons[k]
+            )
+            for fold in _split_folds(
+                X_horizon, T_horizon, Y_horizon, n_folds, random_state
+            ):
+                yield delayed(_get_clf_metrics)(
+                    estimator, pretrained, k, *fold, local_time_horizons
+                )
 
-    if n_folds == 1:
-        cv_idx = 0
-        X_train, X_test, T_train, T_test, Y_train, Y_test = train_test_split(
-            X, T, Y, random_state=random_state
-        )
-        local_time_horizons = [t for t in time_horizons if t > np.min(T_test)]
-
-        c_index, brier_score = _get_surv_metrics(
-            cv_idx,
-            X_train,
-            X_test,
-            T_train,
-            T_test,
-            Y_train,
-            Y_test,
-            local_time_horizons,
-        )
+    if n_jobs == 1:
+        scores = [fn(*fn_args, **fn_kwargs) for fn, fn_args, fn_kwargs in _tasks()]
+    else:
+        scores = Parallel(n_jobs=n_jobs)(_tasks())
+
+    for cv_idx in range(len(folds)):
+        c_index, brier_score = scores[cv_idx]
         for metric in metrics:
             if metric == "c_index":
                 results[metric][cv_idx] = c_index
             elif metric == "brier_score":
                 results[metric][cv_idx] = brier_score
 
-        if "aucroc" in metrics:
-            for k in range(len(time_horizons)):
-                cv_idx = 0
-
-                X_horizon, T_horizon, Y_horizon = generate_dataset_for_horizon(
-                    X, T, Y, time_horizons[k]
-                )
-                X_train, X_test, T_train, T_test, Y_train, Y_test = train_test_split(
-                    X_horizon, T_horizon, Y_horizon, random_state=random_state
-                )
-
-                metric = "aucroc"
-
-                results[metric][cv_idx] += _get_clf_metrics(
-                    cv_idx,
-                    X_train,
-                    X_test,
-                    T_train,
-                    T_test,
-                    Y_train,
-                    Y_test,
-                    local_time_horizons,
-                )
-
-    else:
-        skf = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
-
-        cv_idx = 0
-        for train_index, test_index in skf.split(X, Y):
-
-            X_train = X.loc[X.index[train_index]]
-            Y_train = Y.loc[Y.index[train_index]]
-            T_train = T.loc[T.index[train_index]]
-            X_test = X.loc[X.index[test_index]]
-            Y_test = Y.loc[Y.index[test_index]]
-            T_test = T.loc[T.index[test_index]]
-
-            local_time_horizons = [t for t in time_horizons if t > np.min(T_test)]
-
-            c_index, brier_score = _get_surv_metrics(
-                cv_idx,
-                X_train,
-                X_test,
-                T_train,
-                T_test,
-                Y_train,
-                Y_test,
-                local_time_horizons,
-            )
-            for metric in metrics:
-                if metric == "c_index":
-                    results[metric][cv_idx] = c_index
-                elif metric == "brier_score":
-                    results[metric][cv_idx] = brier_score
-
-            cv_idx += 1
-
-        if "aucroc" in metrics:
-            for k in range(len(time_horizons)):
-                cv_idx = 0
-
-                X_horizon, T_horizon, Y_horizon = generate_dataset_for_horizon(
-                    X, T, Y, time_horizons[k]
-                )
-                for train_index, test_index in skf.split(X_horizon, Y_horizon):
-
-                    X_train = X_horizon.loc[X_horizon.index[train_index]]
-                    Y_train = Y_horizon.loc[Y_horizon.index[train_index]]
-                    T_train = T_horizon.loc[T_horizon.index[train_index]]
-                    X_test = X_horizon.loc[X_horizon.index[test_index]]
-                    Y_test = Y_horizon.loc[Y_horizon.index[test_index]]
-                    T_test = T_horizon.loc[T_horizon.index[test_index]]
-
-                    metric = "aucroc"
-
-                    results[metric][cv_idx] += _get_clf_metrics(
-                        cv_idx,
-                        X_train,
-                        X_test,
-                        T_train,
-                        T_test,
-                        Y_train,
-                        Y_test,
-                        local_time_horizons,
-                    )
-
-                    cv_idx += 1
+    # the AUCROC scores are ordered by horizon, then by fold
+    for idx, aucroc in enumerate(scores[len(folds) :]):
+        results["aucroc"][idx % len(folds)] += aucroc
 
     output: dict = {
         "clf": {},
@@ -3,7 +3,6 @@ from typing import Tuple
 
 # third party
 import numpy as np
-import pandas as pd
 from lifelines import KaplanMeierFitter
 from xgbse.non_parametric import _get_conditional_probs_from_survival
 
@@ -22,6 +21,20 @@ from synthcity.plugins.core.models.survival_analysis.third_party.metrics import
 )
 
 
+def survival_structured_array(T: np.ndarray, E: np.ndarray) -> np.ndarray:
+    """Helper for building the (status, time) structured array of the survival metrics."""
+    T = np.asarray(T).reshape(-1)
+    E = np.asarray(E).reshape(-1)
+    if len(T) != len(E):
+        raise ValueError(f"Invalid survival data shapes {T.shape} {E.shape}")
+
+    structured = np.empty(len(T), dtype=[("status", "bool"), ("time", "<f8")])
+    structured["status"] = E
+    structured["time"] = T
+
+    return structured
+
+
 def evaluate_c_index(
     T_train: np.ndarray,
     Y_train: np.ndarray,
@@ -31,23 +44,10 @@ def evaluate_c_index(
     Time: float,
 ) -> float:
     """Helper for evaluating the C-INDEX metric."""
-    T_train = pd.Series(T_train)
-    Y_train = pd.Series(Y_train)
-    T_test = pd.Series(T_test)
-    Y_test = pd.Series(Y_test)
     Prediction = np.asarray(Prediction).squeeze()
 
-    Y_train_structured = [
-        (Y_train.iloc[i], T_train.iloc[i]) for i in range(len(Y_train))
-    ]
-    Y_train_structured = np.array(
-        Y_train_structured, dtype=[("status", "bool"), ("time", "<f8")]
-    )
-
-    Y_test_structured = [(Y_test.iloc[i], T_test.iloc[i]) for i in range(len(Y_test))]
-    Y_test_structured = np.array(
-        Y_test_structured, dtype=[("status", "bool"), ("time", "<f8")]
-    )
+    Y_train_structured = survival_structured_array(T_train, Y_train)
+    Y_test_structured = survival_structured_array(T_test, Y_test)
 
     # concordance_index_ipcw expects risk scores
     return concordance_index_ipcw(
@@ -64,22 +64,8 @@ def evaluate_brier_score(
     Time: float,
 ) -> float:
     """Helper for evaluating the Brier score."""
-    T_train = pd.Series(T_train)
-    Y_train = pd.Series(Y_train)
-    T_test = pd.Series(T_test)
-    Y_test = pd.Series(Y_test)
-
-    Y_train_structured = [
-        (Y_train.iloc[i], T_train.iloc[i]) for i in range(len(Y_train))
-    ]
-    Y_train_structured = np.array(
-        Y_train_structured, dtype=[("status", "bool"), ("time", "<f8")]
-    )
-
-    Y_test_structured = [(Y_test.iloc[i], T_test.iloc[i]) for i in range(len(Y_test))]
-    Y_test_structured = np.array(
-        Y_test_structured, dtype=[("status", "bool"), ("time", "<f8")]
-    )
+    Y_train_structured = survival_structured_array(T_train, Y_train)
+    Y_test_structured = survival_structured_array(T_test, Y_test)
 
     # brier_score expects survival scores
     return brier_score(
@@ -101,6 +87,18 @@ def km_survival_function(
     return kmf, surv_fn, hazards, constant_hazard
 
 
+def km_survival_at(kmf: KaplanMeierFitter, time_points: np.ndarray) -> np.ndarray:
+    """Evaluate the fitted Kaplan-Meier step function on a time grid.
+
+    Vectorized equivalent of `kmf.predict(t)` for each t: the survival estimate at the last time of the survival table before t, or NaN before the first time.
+    """
+    times = np.asarray(kmf.survival_function_.index, dtype=float)
+    survival = np.append(np.nan, kmf.survival_function_.values[:, 0])
+
+    pos = np.searchsorted(times, np.asarray(time_points, dtype=float), side="right")
+    return survival[pos]
+
+
 def nonparametric_distance(
     real: Tuple[np.ndarray, np.ndarray],
     syn: Tuple[np.ndarray, np.ndarray],
@@ -115,9 +113,6 @@ def nonparametric_distance(
 
     time_points = np.linspace(Tmin, Tmax, n_points)
 
-    opt: list = []
-    abs_opt: list = []
-
     real_kmf, real_surv, real_hazards, real_constant_hazard = km_survival_function(
         real_T, real_E
     )
@@ -128,19 +123,16 @@ def nonparametric_distance(
         syn_T, syn_E
     )
 
-    abs_opt = []
-    opt = []
-    for t in time_points:
-        syn_local_pred = syn_kmf.predict(t)
-        real_local_pred = real_kmf.predict(t)
+    syn_local_pred = km_survival_at(syn_kmf, time_points)
+    real_local_pred = km_survival_at(real_kmf, time_points)
 
-        if np.isnan(syn_local_pred):
-            raise RuntimeError("syn_local_pred contains NaNs")
-        if np.isnan(real_local_pred):
-            raise RuntimeError("real_local_pred contains NaNs")
+    if np.isnan(syn_local_pred).any():
+        raise RuntimeError("syn_local_pred contains NaNs")
+    if np.isnan(real_local_pred).any():
+        raise RuntimeError("real_local_pred contains NaNs")
 
-        abs_opt.append(abs(syn_local_pred - real_local_pred))
-        opt.append(syn_local_pred - real_local_pred)
+    abs_opt = np.abs(syn_local_pred - real_local_pred)
+    opt = syn_local_pred - real_local_pred
 
     auc_abs_opt = trapz(abs_opt, time_points) / Tmax
     auc_opt = trapz(opt, time_points) / Tmax
@@ -7,6 +7,9 @@ import numpy as np
 import pandas as pd
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 
+# synthcity relative
+from .misc import sample_from_groups
+
 
 def syn_cart(y: Any, X: Any, random_state: int = 0, **kwargs: Any) -> Dict[str, Any]:
     """
@@ -41,14 +44,11 @@ def syn_cart(y: Any, X: Any, random_state: int = 0, **kwargs: Any) -> Dict[str,
     # Map each training row to its leaf index
     leaf_ids = estimator.apply(X)
     # Collect y-values in each leaf
-    leaf_indexed_y: Dict[Any, Any] = {}
-    for lid, val in zip(leaf_ids, y):
-        if lid not in leaf_indexed_y:
-            leaf_indexed_y[lid] = []
-        leaf_indexed_y[lid].append(val)
-    # Convert to arrays
-    for lid in leaf_indexed_y:
-        leaf_indexed_y[lid] = np.array(leaf_indexed_y[lid])
+    order = np.argsort(leaf_ids, kind="stable")
+    unique_leaf_ids, starts = np.unique(leaf_ids[order], return_index=True)
+    leaf_indexed_y: Dict[Any, Any] = {
+        lid: y[idxs] for lid, idxs in zip(unique_leaf_ids, np.split(order, starts[1:]))
+    }
 
     model = {
         "name": "cart",
@@ -69,6 +69,7 @@ def generate_cart(
     Here, for each row in X_new, we:
       - identify the leaf node via .apply(...)
       - randomly sample from that leaf's empirical distribution (leaf_indexed_y).
+    The rows are sampled together, grouped by leaf.
 
     If the leaf is unknown (e.g. corner case), we fallback to sampling from the entire training distribution.
     """
@@ -84,21 +85,20 @@ def generate_cart(
     # For reproducibility
     rng = np.random.default_rng(random_state)
 
-    y_syn = []
-    # Precompute a global fallback if needed
-    all_vals = np.concatenate(list(leaf_indexed_y.values())) if leaf_indexed_y else []
-
-    for lid in leaf_ids:
-        if lid in leaf_indexed_y:
-            vals_in_leaf = leaf_indexed_y[lid]
-            idx = rng.integers(len(vals_in_leaf))
-            y_syn.append(vals_in_leaf[idx])
-        else:
-            # Fallback case
-            if len(all_vals) == 0:
-                y_syn.append(np.nan)
-            else:
-                idx = rng.integers(len(all_vals))
-                y_syn.append(all_vals[idx])
-
-    return np.array(y_syn)
+    if not leaf_indexed_y:
+        return np.full(len(leaf_ids), np.nan)
+
+    # Flatten the leaf distributions, and sample all the rows at once
+    train_leaf_ids = np.concatenate(
+        [np.full(len(vals), lid) for lid, vals in leaf_indexed_y.items()]
+    )
+    all_vals = np.concatenate(list(leaf_indexed_y.values()))
+
+    y_syn, found = sample_from_groups(train_leaf_ids, all_vals, leaf_ids, rng)
+
+    # Fallback case: sample from the entire training distribution
+    missing = ~found
+    if missing.any():
+        y_syn[missing] = all_vals[rng.integers(len(all_vals), size=missing.sum())]
+
+    return y_syn
@@ -7,6 +7,9 @@ import numpy as np
 import pandas as pd
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 
+# synthcity relative
+from .misc import sample_from_groups
+
 
 def syn_ctree(
     y: Any,
@@ -69,13 +72,11 @@ def syn_ctree(
 
     # For each training sample, find which leaf it ends in
     leaf_ids = tree.apply(X)  # shape (n_samples,)
-    unique_leaf_ids = np.unique(leaf_ids)
 
     # Build an index map: for each leaf id, which training indices are in that leaf?
-    leaf_index_map: List[np.ndarray] = []
-    for leaf_id in unique_leaf_ids:
-        idxs = np.where(leaf_ids == leaf_id)[0]
-        leaf_index_map.append(idxs)
+    order = np.argsort(leaf_ids, kind="stable")
+    _, starts = np.unique(leaf_ids[order], return_index=True)
+    leaf_index_map: List[np.ndarray] = np.split(order, starts[1:])
 
     model: Dict[str, Any] = {
         "name": "ctree",
@@ -107,8 +108,6 @@ def generate_ctree(
     rng = np.random.default_rng(random_state)
 
     tree = fitted_ctree["model"]
-    leaf_index_map = fitted_ctree["leaf_index_map"]
-    is_classification = fitted_ctree["is_classification"]
     train_X = fitted_ctree["train_X"]
     train_y = fitted_ctree["train_y"]
 
@@ -116,37 +115,18 @@ def generate_ctree(
     X_new = np.asarray(X_new)
     new_leaf_ids = tree.apply(X_new)
 
-    # Build a dict: leaf_id -> position in leaf_index_map
+    # The leaf of each training label. Both classification and regression
+    # draw uniformly from the training labels of the leaf.
     train_leaf_ids = tree.apply(train_X)
-    unique_leaf_ids = np.unique(train_leaf_ids)
-    leafid_to_pos = {leaf_id: i for i, leaf_id in enumerate(unique_leaf_ids)}
-
-    y_syn: List[Any] = []
-    for leaf_id in new_leaf_ids:
-        if leaf_id not in leafid_to_pos:
-            # fallback if leaf_id wasn't seen during training
-            # e.g. out-of-distribution input => just do a normal predict
-            y_syn.append(tree.predict(X_new[[0]])[0])
-            continue
-
-        pos = leafid_to_pos[leaf_id]
-        idxs_in_leaf = leaf_index_map[pos]
-
-        if len(idxs_in_leaf) == 0:
-            # fallback
-            y_syn.append(tree.predict(X_new[[0]])[0])
-            continue
-
-        # pull the actual training labels from this leaf
-        leaf_labels = train_y[idxs_in_leaf]
-
-        if is_classification:
-            # discrete random draw from leaf_labels
-            chosen_idx = rng.integers(0, len(leaf_labels))
-            y_syn.append(leaf_labels[chosen_idx])
+    y_syn, found = sample_from_groups(train_leaf_ids, train_y, new_leaf_ids, rng)
+
+    missing = ~found
+    if missing.any():
+        # fallback if leaf_id wasn't seen during training
+        # e.g. out-of-distribution input => just do a normal predict
+        if not found.any():
+            y_syn = np.asarray(tree.predict(X_new))
         else:
-            # numeric => random draw from leaf_labels
-            chosen_idx = rng.integers(0, len(leaf_labels))
-            y_syn.append(leaf_labels[chosen_idx])
+            y_syn[missing] = tree.predict(X_new[missing])
 
-    return np.array(y_syn)
+    return y_syn
@@ -1,7 +1,7 @@
 # methods/misc.py
 
 # stdlib
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 # third party
 import numpy as np
@@ -224,3 +224,54 @@ def generate_swr(
     # Return these pool values
     y_syn = pool[selected_idx]
     return y_syn
+
+
+###############################################################################
+# GROUPED SAMPLING (shared by the tree based methods)
+###############################################################################
+
+
+def sample_from_groups(
+    groups: np.ndarray,
+    values: np.ndarray,
+    new_groups: np.ndarray,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For each entry of new_groups, draw one of the values with the same group, uniformly.
+    All the draws are vectorized: the values are sorted by group once, and each
+    draw is an offset inside the slice of its group.
+
+    Args:
+        groups: 1D array with the group (for example, the tree leaf) of each value.
+        values: 1D array of values, same length as groups.
+        new_groups: 1D array of groups to sample from.
+        rng: numpy random generator.
+
+    Returns:
+        (samples, found): the sampled values, and the mask of the new_groups which
+        have at least one value. The samples of the other entries are undefined.
+    """
+    groups = np.asarray(groups)
+    values = np.asarray(values)
+    new_groups = np.asarray(new_groups)
+
+    if len(values) == 0:
+        return (
+            np.empty(len(new_groups), dtype=values.dtype),
+            np.zeros(len(new_groups), dtype=bool),
+        )
+
+    order = np.argsort(groups, kind="stable")
+    unique_groups, starts, counts = np.unique(
+        groups[order], return_index=True, return_counts=True
+    )
+
+    pos = np.searchsorted(unique_groups, new_groups)
+    pos = np.minimum(pos, len(unique_groups) - 1)
+    found = unique_groups[pos] == new_groups
+
+    offsets = (rng.random(len(new_groups)) * counts[pos]).astype(int)
+    samples = values[order[starts[pos] + offsets]]
+
+    return samples, found
@@ -68,6 +68,10 @@ def generate_pmm(
           (based on distance in predicted space).
        3) Randomly pick one neighbor among those k to get the actual y.
 
+    The predicted space is one dimensional: the training predictions are sorted,
+    and the k closest samples of a row are among the 2k sorted samples around
+    its insertion point. All the rows are matched at once.
+
     Args:
         fitted_pmm: dictionary from syn_pmm(...)
         X_new: shape (m, n_features) for which to generate new y
@@ -87,20 +91,30 @@ def generate_pmm(
     k = fitted_pmm["k"]
 
     # Predict for the new data
-    y_hat_new = regressor.predict(X_new)
-
-    # Container for synthetic outcomes
-    y_syn = np.empty(len(y_hat_new), dtype=y_train.dtype)
-
-    # PMM logic
-    for i, pred_val in enumerate(y_hat_new):
-        # Distance in predicted space
-        dist = np.abs(y_hat_train - pred_val)
-        # Indices of the k smallest distances
-        neighbor_idxs = np.argpartition(dist, kth=k)[:k]
-        # Pick one random neighbor among these k
-        chosen_idx = rng.choice(neighbor_idxs)
-        # Use that neighbor's actual y
-        y_syn[i] = y_train[chosen_idx]
-
-    return np.array(y_syn)
+    y_hat_new = np.asarray(regressor.predict(X_new)).ravel()
+
+    # Sort the training predictions
+    order = np.argsort(y_hat_train, kind="stable")
+    y_hat_sorted = np.asarray(y_hat_train)[order]
+    n_train = len(y_hat_sorted)
+    k = min(k, n_train)
+
+    # Candidate window of 2k sorted samples around each insertion point
+    window_size = min(2 * k, n_train)
+    pos = np.searchsorted(y_hat_sorted, y_hat_new)
+    start = np.clip(pos - k, 0, n_train - window_size)
+    window = start[:, None] + np.arange(window_size)[None, :]
+
+    # Distance in predicted space, and the k smallest distances of each row
+    dist = np.abs(y_hat_sorted[window] - y_hat_new[:, None])
+    if k < window_size:
+        neighbors = np.argpartition(dist, kth=k - 1, axis=1)[:, :k]
+    else:
+        neighbors = np.broadcast_to(np.arange(window_size), dist.shape)
+
+    # Pick one random neighbor among these k
+    rows = np.arange(len(y_hat_new))
+    chosen = neighbors[rows, rng.integers(0, k, size=len(y_hat_new))]
+
+    # Use that neighbor's actual y
+    return np.asarray(y_train)[order[window[rows, chosen]]]
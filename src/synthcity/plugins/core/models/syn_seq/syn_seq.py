@@ -1,13 +1,16 @@
 # stdlib
+import time
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # third party
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from pydantic import validate_arguments
 
 # synthcity absolute
+import synthcity.logger as log
 from synthcity.plugins.core.models.syn_seq.methods import (
     generate_cart,
     generate_ctree,
@@ -48,6 +51,40 @@ NUMERIC_MARKER = -777777777
 MISSING_MARKER = -999999999
 
 
+def _fit_column(
+    fit_func: Callable,
+    method_name: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    random_state: int,
+) -> Tuple[Optional[Dict[str, Any]], float]:
+    """
+    Fit the model of a single column. Module level, so it can run in the worker processes of `Syn_Seq.fit_col`.
+
+    The global numpy generator is reseeded for each column, so the fitted model doesn't depend on the scheduling of the columns.
+
+    Returns:
+        The fitted model(None if the fit failed) and the fit duration in seconds.
+    """
+    start = time.perf_counter()
+    if len(y) == 0:
+        warnings.warn("No training data available for this column! Model will be None")
+        return None, time.perf_counter() - start
+
+    np.random.seed(random_state)
+    try:
+        model = fit_func(y, X, random_state=random_state)
+        fitted: Optional[Dict[str, Any]] = {
+            "name": method_name,
+            "fitted_model": model,
+        }
+    except Exception as e:
+        warnings.warn(f"Failed to fit column with method {method_name}: {str(e)}")
+        fitted = None
+
+    return fitted, time.perf_counter() - start
+
+
 class Syn_Seq:
 
     """Synthetic Sequence Generator model.
@@ -60,14 +97,18 @@ class Syn_Seq:
     """
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
-    def __init__(self, random_state: int = 0, sampling_patience: int = 100) -> None:
+    def __init__(
+        self, random_state: int = 0, sampling_patience: int = 100, n_jobs: int = 1
+    ) -> None:
         """
         Args:
             random_state: Random seed.
             sampling_patience: Maximum number of attempts in generation.
+            n_jobs: Number of worker processes used for fitting the column models. -1 uses all the CPUs.
         """
         self.random_state = random_state
         self.sampling_patience = sampling_patience
+        self.n_jobs = n_jobs
         self.cat_distributions: Dict[str, Dict[Any, float]] = {}
         self._model_trained = False
         self._syn_order: List[str] = []
@@ -85,7 +126,9 @@ class Syn_Seq:
         **kwargs: Any,
     ) -> "Syn_Seq":
         """
-        Fit each column sequentially using metadata from the loader.
+        Fit the model of each column using metadata from the loader.
+        Each model only depends on the real predecessor columns, so the models are fitted
+        concurrently when `n_jobs` is not 1.
         For each _cat column in the training data, record its full distribution
         (casting values to int) and record the list of special values. Then, for base
         columns with special values, filter out rows whose value is special so that the
@@ -96,7 +139,7 @@ class Syn_Seq:
         if training_data.empty:
             raise ValueError("No data => cannot fit Syn_Seq aggregator")
 
-        print(info_dict)
+        log.debug(f"Syn_Seq aggregator: loader info {info_dict}")
         self._syn_order = info_dict.get("syn_order", list(training_data.columns))
         self._method_map = info_dict.get("method", {})
         self._varsel = info_dict.get("variable_selection", {})
@@ -118,49 +161,90 @@ class Syn_Seq:
                     idx = self._syn_order.index(col)
                     self._varsel[col] = self._syn_order[:idx]
 
-        print("[INFO] Syn_Seq aggregator: fitting columns...")
+        log.info("Syn_Seq aggregator: fitting columns...")
 
         first_col = self._syn_order[0]
         self._first_col_values[first_col] = training_data[first_col].dropna().values
-        print(f"Fitting '{first_col}' => stored values from real data. Done.")
-
-        np.random.seed(self.random_state)
-        for i, col in enumerate(self._syn_order[1:], start=1):
-            method_name = self._method_map.get(col, "cart")
-            preds_list = self._varsel.get(col, self._syn_order[:i])
-            y = training_data[col].values
-            X = training_data[preds_list].values
-            cat_col = col + "_cat"
-            if cat_col in preds_list:
-                numeric_indices = np.where(
-                    label_encoder[cat_col].classes_ == NUMERIC_MARKER
-                )[0]
+        log.info(f"Fitting '{first_col}' => stored values from real data.")
 
-                missing_indices = []
-                if MISSING_MARKER in label_encoder[cat_col].classes_:
-                    missing_indices = np.where(
-                        label_encoder[cat_col].classes_ == MISSING_MARKER
+        def _column_tasks() -> Iterator[Tuple[str, str, Any]]:
+            # The training matrices are built lazily, one column at a time, when the task is consumed.
+            for i, col in enumerate(self._syn_order[1:], start=1):
+                method_name = self._method_map.get(col, "cart")
+                preds_list = self._varsel.get(col, self._syn_order[:i])
+                y = training_data[col].values
+                X = training_data[preds_list].values
+                cat_col = col + "_cat"
+                if cat_col in preds_list:
+                    numeric_indices = np.where(
+                        label_encoder[cat_col].classes_ == NUMERIC_MARKER
                     )[0]
-                if len(numeric_indices) == 0:
-                    raise ValueError(
-                        f"Numeric marker {NUMERIC_MARKER} not found in {cat_col} classes"
+
+                    missing_indices = []
+                    if MISSING_MARKER in label_encoder[cat_col].classes_:
+                        missing_indices = np.where(
+                            label_encoder[cat_col].classes_ == MISSING_MARKER
+                        )[0]
+                    if len(numeric_indices) == 0:
+                        raise ValueError(
+                            f"Numeric marker {NUMERIC_MARKER} not found in {cat_col} classes"
+                        )
+                    numeric_label = numeric_indices[0]
+                    missing_label = (
+                        missing_indices[0] if len(missing_indices) > 0 else None
                     )
-                numeric_label = numeric_indices[0]
-                missing_label = missing_indices[0] if len(missing_indices) > 0 else None
-                mask = training_data[cat_col] == numeric_label
-                if missing_label is not None:
-                    mask &= training_data[cat_col] != missing_label
-                y = training_data.loc[mask, col].values
-                X = training_data.loc[mask, preds_list].values
-
-            print(f"Fitting '{col}' with '{method_name}' ... ", end="", flush=True)
-            try:
-                self._col_models[col] = self._fit_single_col(method_name, X, y)
-            except Exception as e:
-                print(f"Error fitting column {col} with {method_name}: {e}.", end=" ")
-                self._col_models[col] = None
-
-            print("Done!")
+                    mask = training_data[cat_col] == numeric_label
+                    if missing_label is not None:
+                        mask &= training_data[cat_col] != missing_label
+                    y = training_data.loc[mask, col].values
+                    X = training_data.loc[mask, preds_list].values
+
+                if method_name not in METHOD_MAP:
+                    log.error(
+                        f"Error fitting column {col}: unknown method {method_name}."
+                    )
+                    self._col_models[col] = None
+                    continue
+
+                fit_func, _ = METHOD_MAP[method_name]
+                yield col, method_name, delayed(_fit_column)(
+                    fit_func, method_name, X, y, self.random_state
+                )
+
+        if self.n_jobs == 1:
+            # fit each column as soon as its data is built
+            results: Iterable = (
+                (col, method_name, fn(*fn_args, **fn_kwargs))
+                for col, method_name, (fn, fn_args, fn_kwargs) in _column_tasks()
+            )
+        else:
+            columns: List[Tuple[str, str]] = []
+
+            def _dispatched() -> Iterator[Any]:
+                for col, method_name, task in _column_tasks():
+                    columns.append((col, method_name))
+                    yield task
+
+            # Parallel consumes the tasks lazily, at most pre_dispatch tasks ahead of the workers
+            fitted_columns = Parallel(n_jobs=self.n_jobs, pre_dispatch="2*n_jobs")(
+                _dispatched()
+            )
+            results = (
+                (col, method_name, fitted)
+                for (col, method_name), fitted in zip(columns, fitted_columns)
+            )
+
+        for col, method_name, (fitted, duration) in results:
+            self._col_models[col] = fitted
+            if fitted is None:
+                log.warning(f"Fitting '{col}' with '{method_name}' failed.")
+            else:
+                log.info(
+                    f"Fitting '{col}' with '{method_name}' done in {duration:.3f} seconds."
+                )
+
+        # The same global random state after the fit, whatever the number of jobs.
+        np.random.seed(self.random_state)
         self._model_trained = True
         return self
 
@@ -170,19 +254,9 @@ class Syn_Seq:
         """
         Fit a single column using the specified method.
         """
-        if len(y) == 0:
-            warnings.warn(
-                "No training data available for this column! Model will be None"
-            )
-            return None
-
         fit_func, _ = METHOD_MAP[method_name]
-        try:
-            model = fit_func(y, X, random_state=self.random_state)
-            return {"name": method_name, "fitted_model": model}
-        except Exception as e:
-            warnings.warn(f"Failed to fit column with method {method_name}: {str(e)}")
-            return None
+        fitted, _ = _fit_column(fit_func, method_name, X, y, self.random_state)
+        return fitted
 
     def generate_col(self, count: int, label_encoder: Any) -> pd.DataFrame:
         """
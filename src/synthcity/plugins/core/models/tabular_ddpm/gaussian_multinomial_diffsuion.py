@@ -7,7 +7,8 @@ Based on
 
 # stdlib
 import math
-from typing import Any, Optional, Tuple
+from functools import partial
+from typing import Any, List, Optional, Tuple
 
 # third party
 import numpy as np
@@ -777,6 +778,33 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
             "true_mean": true_mean,
         }
 
+    def ddim_timesteps(self, sampling_steps: Optional[int] = None) -> List[int]:
+        """The decreasing sub-sequence of timesteps visited by the DDIM sampler.
+
+        Args:
+            sampling_steps: The number of denoising steps. If None, all the `num_timesteps` timesteps are used.
+        """
+        if sampling_steps is None or sampling_steps >= self.num_timesteps:
+            return list(reversed(range(self.num_timesteps)))
+        if sampling_steps < 1:
+            raise ValueError(f"Invalid sampling_steps {sampling_steps}")
+
+        # Evenly spaced timesteps, from the last one downward: the chain always starts at num_timesteps - 1, and ends at 0 if sampling_steps > 1.
+        steps = np.linspace(self.num_timesteps - 1, 0, sampling_steps)
+        return sorted(set(np.round(steps).astype(int).tolist()), reverse=True)
+
+    def _ddim_alpha_bar_prev(
+        self, t: Tensor, t_prev: Optional[Tensor], shape: torch.Size
+    ) -> Tensor:
+        if t_prev is None:
+            return perm_and_expand(self.alphas_cumprod_prev, t, shape)
+
+        # t_prev < 0 is the end of the chain, where alpha_bar = 1.
+        alphas_cumprod_prev = torch.cat(
+            [self.alphas_cumprod.new_ones(1), self.alphas_cumprod]
+        )
+        return perm_and_expand(alphas_cumprod_prev, t_prev + 1, shape)
+
     @torch.no_grad()
     def gaussian_ddim_step(
         self,
@@ -784,6 +812,7 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
         x: Tensor,
         t: Tensor,
         eta: float = 0.0,
+        t_prev: Optional[Tensor] = None,
     ) -> Tensor:
         out = self.gaussian_p_mean_variance(
             model_out_num,
@@ -795,7 +824,7 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
         eps = self._predict_eps_from_xstart(x, t, out["pred_xstart"])
 
         alpha_bar = perm_and_expand(self.alphas_cumprod, t, x.shape)
-        alpha_bar_prev = perm_and_expand(self.alphas_cumprod_prev, t, x.shape)
+        alpha_bar_prev = self._ddim_alpha_bar_prev(t, t_prev, x.shape)
         sigma = eta or (
             eta
             * torch.sqrt((1 - alpha_bar_prev) / (1 - alpha_bar))
@@ -838,12 +867,17 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
 
     @torch.no_grad()
     def multinomial_ddim_step(
-        self, model_out_cat: Tensor, log_x_t: Tensor, t: Tensor, eta: float = 0.0
+        self,
+        model_out_cat: Tensor,
+        log_x_t: Tensor,
+        t: Tensor,
+        eta: float = 0.0,
+        t_prev: Optional[Tensor] = None,
     ) -> Tensor:
         log_x0 = self.predict_start(model_out_cat, log_x_t=log_x_t)
 
         alpha_bar = perm_and_expand(self.alphas_cumprod, t, log_x_t.shape)
-        alpha_bar_prev = perm_and_expand(self.alphas_cumprod_prev, t, log_x_t.shape)
+        alpha_bar_prev = self._ddim_alpha_bar_prev(t, t_prev, log_x_t.shape)
         sigma = eta or (
             eta
             * torch.sqrt((1 - alpha_bar_prev) / (1 - alpha_bar))
@@ -870,7 +904,16 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
         return out
 
     @torch.no_grad()
-    def sample_ddim(self, num_samples: int, cond: Any = None) -> Tensor:
+    def sample_ddim(
+        self, num_samples: int, cond: Any = None, sampling_steps: Optional[int] = None
+    ) -> Tensor:
+        """Deterministic DDIM sampling.
+
+        Args:
+            num_samples: The number of samples.
+            cond: Optional conditional.
+            sampling_steps: The number of denoising steps, evenly spaced over the `num_timesteps` of the diffusion. If None, all the timesteps are used.
+        """
         b = num_samples
         device = self.log_alpha.device
         z_norm = torch.randn((b, self.num_numerics), device=device)
@@ -883,23 +926,28 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
             )
             log_z = self.log_sample_categorical(uniform_logits)
 
-        for i in reversed(range(0, self.num_timesteps)):
+        timesteps = self.ddim_timesteps(sampling_steps)
+        for i, i_prev in zip(timesteps, timesteps[1:] + [-1]):
             debug(f"Sample timestep {i:4d}", end="\r")
             t = torch.full((b,), i, device=device, dtype=torch.long)
+            t_prev = torch.full((b,), i_prev, device=device, dtype=torch.long)
             model_out = self.denoise_fn(
                 torch.cat([z_norm, log_z], dim=1).float(), t, y=cond
             )
             model_out_num = model_out[:, : self.num_numerics]
             model_out_cat = model_out[:, self.num_numerics :]
-            z_norm = self.gaussian_ddim_step(model_out_num, z_norm, t)
+            z_norm = self.gaussian_ddim_step(model_out_num, z_norm, t, t_prev=t_prev)
             if has_cat:
-                log_z = self.multinomial_ddim_step(model_out_cat, log_z, t)
+                log_z = self.multinomial_ddim_step(
+                    model_out_cat, log_z, t, t_prev=t_prev
+                )
 
         z_ohe = torch.exp(log_z).round()
         z_cat = log_z
         if has_cat:
             z_cat = ohe_to_categories(z_ohe, self.num_classes)
-        sample = torch.cat([z_norm, z_cat], dim=1).cpu()
+        # Same output precision as the ancestral sampler.
+        sample = torch.cat([z_norm.double(), z_cat], dim=1).cpu()
         return sample
 
     @torch.no_grad()
@@ -941,10 +989,11 @@ class GaussianMultinomialDiffusion(torch.nn.Module):
         cond: Any = None,
         max_batch_size: int = 2000,
         ddim: bool = False,
+        sampling_steps: Optional[int] = None,
     ) -> Tensor:
-        if ddim:
+        if ddim or sampling_steps is not None:
             info("Sample using DDIM.")
-            sample_fn = self.sample_ddim
+            sample_fn = partial(self.sample_ddim, sampling_steps=sampling_steps)
         else:
             sample_fn = self.sample
 
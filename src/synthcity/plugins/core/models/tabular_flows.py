@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 # third party
 import pandas as pd
@@ -9,6 +9,7 @@ from torch import nn
 
 # synthcity absolute
 from synthcity.metrics.weighted_metrics import WeightedMetrics
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 # synthcity relative
@@ -75,6 +76,8 @@ class TabularFlows(nn.Module):
             Max number of iterations without any improvement before early stopping is trigged.
         patience_metric: WeightedMetrics
             Metric evaluator
+        callbacks: Sequence[Callback]
+            Optional training callbacks, forwarded to the flow model.
     """
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -103,6 +106,7 @@ class TabularFlows(nn.Module):
         n_iter_print: int = 10,
         patience: int = 10,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
     ) -> None:
         super(TabularFlows, self).__init__()
         self.columns = X.columns
@@ -130,6 +134,7 @@ class TabularFlows(nn.Module):
             n_iter_print=n_iter_print,
             patience=patience,
             patience_metric=patience_metric,
+            callbacks=callbacks,
         )
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 # third party
 import numpy as np
@@ -12,6 +12,7 @@ from sklearn.preprocessing import OneHotEncoder
 
 # synthcity absolute
 from synthcity.metrics.weighted_metrics import WeightedMetrics
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 from synthcity.utils.samplers import BaseSampler, ConditionalDatasetSampler
 
@@ -19,6 +20,9 @@ from synthcity.utils.samplers import BaseSampler, ConditionalDatasetSampler
 from .gan import GAN
 from .tabular_encoder import TabularEncoder
 
+# The maximum number of rows generated in a single pass by the inference sampling calibration.
+SAMPLE_PROB_MAX_ROWS = 100000
+
 
 class TabularGAN(torch.nn.Module):
     """
@@ -101,6 +105,8 @@ class TabularGAN(torch.nn.Module):
             CUDA/CPU
         adjust_inference_sampling: bool
             Adjust the marginal probabilities in the synthetic data to closer match the training set. Active only with the ConditionalSampler
+        callbacks: Sequence[Callback]
+            Optional training callbacks, forwarded to the GAN.
         # privacy settings
         dp_enabled: bool
             Train the discriminator with Differential Privacy guarantees
@@ -161,6 +167,7 @@ class TabularGAN(torch.nn.Module):
         device: Any = DEVICE,
         patience: int = 10,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
         n_iter_print: int = 50,
         n_iter_min: int = 100,
         adjust_inference_sampling: bool = False,
@@ -175,6 +182,8 @@ class TabularGAN(torch.nn.Module):
         self.columns = X.columns
         self.batch_size = batch_size
         self.sample_prob: Optional[np.ndarray] = None
+        # conditional probabilities of the synthetic data, for each conditional class. See _extract_sample_prob.
+        self._sample_prob_mat: Optional[np.ndarray] = None
         self._adjust_inference_sampling = adjust_inference_sampling
         n_units_conditional = 0
 
@@ -304,6 +313,7 @@ class TabularGAN(torch.nn.Module):
             device=device,
             patience=patience,
             patience_metric=patience_metric,
+            callbacks=callbacks,
             # privacy
             dp_enabled=dp_enabled,
             dp_epsilon=dp_epsilon,
@@ -363,6 +373,7 @@ class TabularGAN(torch.nn.Module):
         )
 
         # post processing
+        self._sample_prob_mat = None
         self.adjust_inference_sampling(self._adjust_inference_sampling)
 
         return self
@@ -375,7 +386,11 @@ class TabularGAN(torch.nn.Module):
 
         if enabled:
             real_prob = self.dataloader_sampler.conditional_probs()
-            sample_prob = self._extract_sample_prob()
+            # the calibration data only depends on the fitted generator, it is reused when the sampling is re-enabled
+            sample_prob = getattr(self, "_sample_prob_mat", None)
+            if sample_prob is None:
+                sample_prob = self._extract_sample_prob()
+                self._sample_prob_mat = sample_prob
 
             self.sample_prob = self._find_sample_p(real_prob, sample_prob)
         else:
@@ -406,31 +421,47 @@ class TabularGAN(torch.nn.Module):
         return self.model.generate(count, cond=cond)
 
     def _extract_sample_prob(self) -> Optional[np.ndarray]:
+        """The conditional probabilities of the synthetic data generated for each conditional class.
+
+        The classes are generated together, in batches of up to SAMPLE_PROB_MAX_ROWS rows, and the probabilities are the normalized sums of the discrete features of each class.
+
+        Returns:
+            np.ndarray with shape (conditional dimension, number of classes), or None if the model has no conditional.
+        """
         if self.predefined_conditional or self.dataloader_sampler is None:
             return None
 
-        if self.dataloader_sampler.conditional_dimension() == 0:
+        n_classes = self.dataloader_sampler.conditional_dimension()
+        if n_classes == 0:
             return None
 
-        prob_list = list()
         batch_size = 10000
 
-        for c in range(self.dataloader_sampler.conditional_dimension()):
-            cond = self.dataloader_sampler.sample_conditional_for_class(batch_size, c)
-            if cond is None:
-                continue
+        discrete_idx: List[int] = []
+        offset = 0
+        for column_info in self.encoder.layout():
+            if column_info.feature_type == "discrete":
+                discrete_idx.extend(
+                    range(offset, offset + column_info.output_dimensions)
+                )
+            offset += column_info.output_dimensions
 
-            data_cond = self.model.generate(batch_size, cond=cond)
+        prob_mat = np.zeros((len(discrete_idx), n_classes))
+        classes_per_pass = max(1, SAMPLE_PROB_MAX_ROWS // batch_size)
+        for start in range(0, n_classes, classes_per_pass):
+            classes = np.arange(start, min(start + classes_per_pass, n_classes))
 
-            syn_dataloader_sampler = ConditionalDatasetSampler(
-                pd.DataFrame(data_cond),
-                self.encoder.layout(),
-            )
+            cond = np.zeros((len(classes) * batch_size, n_classes))
+            cond[np.arange(len(cond)), np.repeat(classes, batch_size)] = 1
 
-            prob = syn_dataloader_sampler.conditional_probs()
-            prob_list.append(prob)
+            data_cond = self.model.generate(len(cond), cond=cond)
 
-        prob_mat = np.stack(prob_list, axis=-1)
+            freqs = (
+                data_cond[:, discrete_idx]
+                .reshape(len(classes), batch_size, len(discrete_idx))
+                .sum(axis=1)
+            )
+            prob_mat[:, classes] = (freqs / (freqs.sum(axis=1, keepdims=True) + 1e-8)).T
 
         return prob_mat
 
@@ -452,8 +483,25 @@ class TabularGAN(torch.nn.Module):
             ce = -np.sum(prob_real * f1, axis=1) + f2
             return np.mean(ce)
 
+        def kl_grad(
+            alpha: np.ndarray, prob_real: np.ndarray, prob_mat: np.ndarray
+        ) -> np.ndarray:
+            # analytic gradient of kl, instead of one finite difference per category.
+            weights = prob_mat * np.exp(alpha - alpha.max())[None, :]
+            norm = weights.sum(axis=-1, keepdims=True)
+            weights = np.divide(
+                weights, norm, out=np.zeros_like(weights), where=norm > 0
+            )
+            softmax = np.exp(alpha - logsumexp(alpha))
+            return -np.sum(prob_real[:, None] * weights, axis=0) + softmax
+
         try:
-            res = minimize(kl, np.ones(prob_mat.shape[-1]), (prob_real, prob_mat))
+            res = minimize(
+                kl,
+                np.ones(prob_mat.shape[-1]),
+                (prob_real, prob_mat),
+                jac=kl_grad,
+            )
         except Exception:
             return np.ones(prob_mat.shape[-1]) / prob_mat.shape[-1]
 
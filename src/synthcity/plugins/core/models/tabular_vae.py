@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 # third party
 import numpy as np
@@ -10,6 +10,7 @@ from sklearn.preprocessing import OneHotEncoder
 from torch import nn
 
 # synthcity absolute
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 from synthcity.utils.samplers import BaseSampler, ConditionalDatasetSampler
 
@@ -65,6 +66,8 @@ class TabularVAE(nn.Module):
             l2 (ridge) penalty for the weights.
         batch_size: int
             Batch size
+        generate_batch_size: int
+            The number of samples decoded at once during the generation
         random_state: int
             random_state used
         encoder_max_clusters: int
@@ -76,6 +79,8 @@ class TabularVAE(nn.Module):
             Minimum number of iterations to go through before starting early stopping
         patience: int
             Max number of iterations without any improvement before early stopping is trigged.
+        callbacks: Sequence[Callback]
+            Optional training callbacks, forwarded to the VAE.
     """
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -88,6 +93,7 @@ class TabularVAE(nn.Module):
         n_iter: int = 500,
         weight_decay: float = 1e-3,
         batch_size: int = 64,
+        generate_batch_size: int = 10000,
         random_state: int = 0,
         loss_strategy: str = "standard",
         encoder_max_clusters: int = 20,
@@ -114,6 +120,7 @@ class TabularVAE(nn.Module):
         n_iter_min: int = 100,
         n_iter_print: int = 10,
         patience: int = 20,
+        callbacks: Sequence[Callback] = (),
     ) -> None:
         super(TabularVAE, self).__init__()
         self.columns = X.columns
@@ -202,6 +209,7 @@ class TabularVAE(nn.Module):
             n_units_embedding=n_units_embedding,
             n_units_conditional=n_units_conditional,
             batch_size=batch_size,
+            generate_batch_size=generate_batch_size,
             n_iter=n_iter,
             lr=lr,
             weight_decay=weight_decay,
@@ -231,6 +239,7 @@ class TabularVAE(nn.Module):
             n_iter_print=n_iter_print,
             n_iter_min=n_iter_min,
             patience=patience,
+            callbacks=callbacks,
         )
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
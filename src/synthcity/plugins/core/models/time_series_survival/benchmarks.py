@@ -1,11 +1,12 @@
 # stdlib
 import copy
 import hashlib
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Generator, List
 
 # third party
 import numpy as np
 import optuna
+from joblib import Parallel, delayed
 from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import StratifiedKFold, train_test_split
 
@@ -139,6 +140,102 @@ def search_hyperparams(
     return args
 
 
+def _split_ts_folds(
+    static: np.ndarray,
+    temporal: np.ndarray,
+    observation_times: np.ndarray,
+    T: np.ndarray,
+    Y: np.ndarray,
+    n_folds: int,
+    random_state: int,
+) -> List[tuple]:
+    """Split the data into (static_train, static_test, temporal_train, temporal_test, observation_times_train, observation_times_test, T_train, T_test, Y_train, Y_test) folds."""
+    if n_folds == 1:
+        return [
+            tuple(
+                train_test_split(
+                    static, temporal, observation_times, T, Y, random_state=random_state
+                )
+            )
+        ]
+
+    skf = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
+
+    folds: List[tuple] = []
+    for train_index, test_index in skf.split(temporal, Y):
+        folds.append(
+            (
+                static[train_index],
+                static[test_index],
+                temporal[train_index],
+                temporal[test_index],
+                observation_times[train_index],
+                observation_times[test_index],
+                T[train_index],
+                T[test_index],
+                Y[train_index],
+                Y[test_index],
+            )
+        )
+
+    return folds
+
+
+def _get_ts_surv_metrics(
+    estimator: Any,
+    pretrained: bool,
+    cv_idx: int,
+    static_train: np.ndarray,
+    static_test: np.ndarray,
+    temporal_train: np.ndarray,
+    temporal_test: np.ndarray,
+    observation_times_train: np.ndarray,
+    observation_times_test: np.ndarray,
+    T_train: np.ndarray,
+    T_test: np.ndarray,
+    Y_train: np.ndarray,
+    Y_test: np.ndarray,
+    time_horizons: list,
+) -> tuple:
+    """Train the model on a fold, and evaluate the C-INDEX and the Brier score over all the horizons."""
+    train_max = T_train.max()
+    T_test[T_test > train_max] = train_max
+
+    if pretrained:
+        model = estimator[cv_idx]
+    else:
+        model = copy.deepcopy(estimator)
+
+        model.fit(
+            static_train, temporal_train, observation_times_train, T_train, Y_train
+        )
+
+    pred = model.predict(
+        static_test, temporal_test, observation_times_test, time_horizons
+    ).to_numpy()
+
+    c_index = 0.0
+    brier_score = 0.0
+
+    for k in range(len(time_horizons)):
+        eval_horizon = min(time_horizons[k], np.max(T_test) - 1)
+
+        def get_score(fn: Callable) -> float:
+            return fn(
+                T_train,
+                Y_train,
+                pred[:, k],
+                T_test,
+                Y_test,
+                eval_horizon,
+            ) / (len(time_horizons))
+
+        c_index += get_score(evaluate_c_index)
+        brier_score += get_score(evaluate_brier_score)
+
+    return c_index, brier_score
+
+
 def evaluate_ts_survival_model(
     estimator: Any,
     static: np.ndarray,
@@ -151,9 +248,12 @@ def evaluate_ts_survival_model(
     metrics: List[str] = ["c_index", "brier_score"],
     random_state: int = 0,
     pretrained: bool = False,
+    n_jobs: int = 1,
 ) -> Dict:
     """Helper for evaluating survival analysis tasks.
 
+    The folds are independent, and are evaluated in parallel when `n_jobs` is not 1.
+
     Args:
         model_name: str
             The model to evaluate
@@ -179,6 +279,8 @@ def evaluate_ts_survival_model(
             Random random_state
         pretrained: bool
             If the estimator was trained or not
+        n_jobs: int
+            Number of worker processes for the folds evaluation. -1 uses all the CPUs.
     """
 
     supported_metrics = ["c_index", "brier_score"]
@@ -196,138 +298,30 @@ def evaluate_ts_survival_model(
 
         results[metric] = np.zeros(n_folds)
 
-    def _get_surv_metrics(
-        cv_idx: int,
-        static_train: np.ndarray,
-        static_test: np.ndarray,
-        temporal_train: np.ndarray,
-        temporal_test: np.ndarray,
-        observation_times_train: np.ndarray,
-        observation_times_test: np.ndarray,
-        T_train: np.ndarray,
-        T_test: np.ndarray,
-        Y_train: np.ndarray,
-        Y_test: np.ndarray,
-        time_horizons: list,
-    ) -> tuple:
-        train_max = T_train.max()
-        T_test[T_test > train_max] = train_max
+    folds = _split_ts_folds(
+        static, temporal, observation_times, T, Y, n_folds, random_state
+    )
 
-        if pretrained:
-            model = estimator[cv_idx]
-        else:
-            model = copy.deepcopy(estimator)
+    def _tasks() -> Generator:
+        for cv_idx, fold in enumerate(folds):
+            local_time_horizons = [t for t in time_horizons if t > np.min(fold[7])]
 
-            model.fit(
-                static_train, temporal_train, observation_times_train, T_train, Y_train
+            yield delayed(_get_ts_surv_metrics)(
+                estimator, pretrained, cv_idx, *fold, local_time_horizons
             )
-        try:
-            pred = model.predict(
-                static_test, temporal_test, observation_times_test, time_horizons
-            ).to_numpy()
-        except BaseException as e:
-            raise e
-
-        c_index = 0.0
-        brier_score = 0.0
 
-        for k in range(len(time_horizons)):
-            eval_horizon = min(time_horizons[k], np.max(T_test) - 1)
-
-            def get_score(fn: Callable) -> float:
-                return fn(
-                    T_train,
-                    Y_train,
-                    pred[:, k],
-                    T_test,
-                    Y_test,
-                    eval_horizon,
-                ) / (len(time_horizons))
-
-            c_index += get_score(evaluate_c_index)
-            brier_score += get_score(evaluate_brier_score)
-
-        return c_index, brier_score
-
-    if n_folds == 1:
-        cv_idx = 0
-        (
-            static_train,
-            static_test,
-            temporal_train,
-            temporal_test,
-            observation_times_train,
-            observation_times_test,
-            T_train,
-            T_test,
-            Y_train,
-            Y_test,
-        ) = train_test_split(
-            static, temporal, observation_times, T, Y, random_state=random_state
-        )
-        local_time_horizons = [t for t in time_horizons if t > np.min(T_test)]
+    if n_jobs == 1:
+        scores = [fn(*fn_args, **fn_kwargs) for fn, fn_args, fn_kwargs in _tasks()]
+    else:
+        scores = Parallel(n_jobs=n_jobs)(_tasks())
 
-        c_index, brier_score = _get_surv_metrics(
-            cv_idx,
-            static_train,
-            static_test,
-            temporal_train,
-            temporal_test,
-            observation_times_train,
-            observation_times_test,
-            T_train,
-            T_test,
-            Y_train,
-            Y_test,
-            local_time_horizons,
-        )
+    for cv_idx, (c_index, brier_score) in enumerate(scores):
         for metric in metrics:
             if metric == "c_index":
                 results[metric][cv_idx] = c_index
             elif metric == "brier_score":
                 results[metric][cv_idx] = brier_score
 
-    else:
-        skf = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
-
-        cv_idx = 0
-        for train_index, test_index in skf.split(temporal, Y):
-            static_train = static[train_index]
-            temporal_train = temporal[train_index]
-            observation_times_train = observation_times[train_index]
-            Y_train = Y[train_index]
-            T_train = T[train_index]
-
-            static_test = static[test_index]
-            temporal_test = temporal[test_index]
-            observation_times_test = observation_times[test_index]
-            Y_test = Y[test_index]
-            T_test = T[test_index]
-
-            local_time_horizons = [t for t in time_horizons if t > np.min(T_test)]
-
-            c_index, brier_score = _get_surv_metrics(
-                cv_idx,
-                static_train,
-                static_test,
-                temporal_train,
-                temporal_test,
-                observation_times_train,
-                observation_times_test,
-                T_train,
-                T_test,
-                Y_train,
-                Y_test,
-                local_time_horizons,
-            )
-            for metric in metrics:
-                if metric == "c_index":
-                    results[metric][cv_idx] = c_index
-                elif metric == "brier_score":
-                    results[metric][cv_idx] = brier_score
-
-            cv_idx += 1
-
     output: dict = {
         "clf": {},
         "str": {},
@@ -1,5 +1,5 @@
 # stdlib
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 # third party
 import numpy as np
@@ -7,12 +7,14 @@ import torch
 from pydantic import validate_arguments
 from torch import Tensor, nn
 from torch.optim import Adam
-from torch.utils.data import DataLoader, TensorDataset, sampler
+from torch.utils.data import sampler
 from tqdm import tqdm
 
 # synthcity absolute
 import synthcity.logger as log
+from synthcity.utils.callbacks import Callback, CallbackHookMixin
 from synthcity.utils.constants import DEVICE
+from synthcity.utils.tensor_loader import TensorDataLoader
 
 # synthcity relative
 from .mlp import MLP
@@ -118,7 +120,7 @@ class Decoder(nn.Module):
         return torch.cat([X, cond], dim=1)
 
 
-class VAE(nn.Module):
+class VAE(nn.Module, CallbackHookMixin):
     """
     .. inheritance-diagram:: synthcity.plugins.core.models.vae.VAE
         :parts: 1
@@ -133,6 +135,8 @@ class VAE(nn.Module):
             Number of units in the latent space
         batch_size: int
             Training batch size
+        generate_batch_size: int
+            The number of samples decoded at once by `generate`
         n_iter: int
             Number of training iterations
         random_state: int
@@ -185,6 +189,8 @@ class VAE(nn.Module):
             Minimum number of iterations to go through before starting early stopping
         patience: int
             Max number of iterations without any improvement before early stopping is trigged.
+        callbacks: Sequence[Callback]
+            Optional training callbacks. The latest validation loss is exposed to them as `valid_score`.
     """
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -194,6 +200,7 @@ class VAE(nn.Module):
         n_units_embedding: int,
         n_units_conditional: int = 0,
         batch_size: int = 100,
+        generate_batch_size: int = 10000,
         n_iter: int = 500,
         random_state: int = 0,
         lr: float = 2e-4,
@@ -224,14 +231,18 @@ class VAE(nn.Module):
         n_iter_min: int = 100,
         n_iter_print: int = 10,
         patience: int = 20,
+        callbacks: Sequence[Callback] = (),
     ) -> None:
-        super(VAE, self).__init__()
+        nn.Module.__init__(self)
+        CallbackHookMixin.__init__(self, callbacks)
+        self.valid_score: Optional[float] = None
 
         if loss_strategy not in ["standard", "robust_divergence"]:
             raise ValueError(f"invalid loss strategy {loss_strategy}")
 
         self.device = device
         self.batch_size = batch_size
+        self.generate_batch_size = generate_batch_size
         self.n_iter = n_iter
         self.loss_factor = loss_factor
         self.lr = lr
@@ -308,9 +319,6 @@ class VAE(nn.Module):
     def generate(self, count: int, cond: Optional[np.ndarray] = None) -> np.ndarray:
         self.decoder.eval()
 
-        steps = count // self.batch_size + 1
-        data = []
-
         condt: Optional[torch.Tensor] = None
         if cond is None and self.n_units_conditional > 0:
             # sample from the original conditional
@@ -328,23 +336,26 @@ class VAE(nn.Module):
         if cond is not None:
             condt = self._check_tensor(cond)
 
-        for idx in range(steps):
-            mean = torch.zeros(self.batch_size, self.n_units_embedding)
-            std = torch.ones(self.batch_size, self.n_units_embedding)
-            noise = torch.normal(mean=mean, std=std).to(self.device)
+        batch_size = getattr(self, "generate_batch_size", self.batch_size)
+        data: Optional[np.ndarray] = None
+
+        with torch.inference_mode():
+            # At least one step, for the output shape when count = 0.
+            for start in range(0, max(count, 1), batch_size):
+                end = min(start + batch_size, count)
 
-            condt_mb: Optional[torch.Tensor] = None
-            if condt is not None:
-                condt_mb = condt[
-                    idx * self.batch_size : min((idx + 1) * self.batch_size, count)
-                ]
-                noise = noise[: len(condt_mb)]
+                noise = torch.randn(
+                    end - start, self.n_units_embedding, device=self.device
+                )
+                condt_mb: Optional[torch.Tensor] = None
+                if condt is not None:
+                    condt_mb = condt[start:end]
 
-            fake = self.decoder(noise, condt_mb)
-            data.append(fake.detach().cpu().numpy())
+                fake = self.decoder(noise, condt_mb).cpu().numpy()
+                if data is None:
+                    data = np.empty((count, fake.shape[1]), dtype=fake.dtype)
+                data[start:end] = fake
 
-        data = np.concatenate(data, axis=0)
-        data = data[:count]
         return data
 
     def _reparameterize(self, mu: Tensor, logvar: Tensor) -> Tensor:
@@ -393,7 +404,11 @@ class VAE(nn.Module):
         best_loss = np.inf
         best_state_dict = None
         patience = 0
+        self.on_fit_begin()
         for epoch in tqdm(range(self.n_iter)):
+            self.valid_score = None
+            self.on_epoch_begin()
+            early_stop = False
             self.train()
             for id_, data in enumerate(loader):
                 cond_mb: Optional[torch.Tensor] = None
@@ -441,6 +456,7 @@ class VAE(nn.Module):
                 )
 
                 log.debug(f"[{epoch}/{self.n_iter}] Loss: {val_loss}")
+                self.valid_score = val_loss
                 if val_loss >= best_loss:
                     patience += 1
                 else:
@@ -448,13 +464,18 @@ class VAE(nn.Module):
                     best_state_dict = self.state_dict()
                     patience = 0
 
-                if patience >= self.patience and epoch >= self.n_iter_min:
-                    log.debug(f"[{epoch}/{self.n_iter}] Early stopping")
-                    break
+                early_stop = patience >= self.patience and epoch >= self.n_iter_min
+
+            self.on_epoch_end()
+            if early_stop:
+                log.debug(f"[{epoch}/{self.n_iter}] Early stopping")
+                break
 
         if best_state_dict is not None:
             self.load_state_dict(best_state_dict)
 
+        self.on_fit_end()
+
         return self
 
     def _check_tensor(self, X: Tensor) -> Tensor:
@@ -463,17 +484,15 @@ class VAE(nn.Module):
         else:
             return torch.from_numpy(np.asarray(X)).to(self.device)
 
-    def _dataloader(self, X: Tensor, cond: Optional[torch.Tensor] = None) -> DataLoader:
-        if cond is None:
-            dataset = TensorDataset(X)
-        else:
-            dataset = TensorDataset(X, cond)
+    def _dataloader(
+        self, X: Tensor, cond: Optional[torch.Tensor] = None
+    ) -> TensorDataLoader:
+        tensors = (X,) if cond is None else (X, cond)
 
-        return DataLoader(
-            dataset,
+        return TensorDataLoader(
+            *tensors,
             sampler=self.dataloader_sampler,
             batch_size=self.batch_size,
-            pin_memory=False,
         )
 
     def _loss_function(
@@ -14,6 +14,7 @@ from pydantic import ConfigDict, validate_arguments
 # synthcity absolute
 import synthcity.logger as log
 from synthcity.metrics.plots import plot_marginal_comparison, plot_tsne
+from synthcity.plugins.core.batching import generation_batcher
 from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import (
     DataLoader,
@@ -28,16 +29,30 @@ from synthcity.plugins.core.distribution import (
     FloatDistribution,
     IntegerDistribution,
 )
-from synthcity.plugins.core.schema import Schema
+from synthcity.plugins.core.schema import CompiledConstraints, Schema
 from synthcity.plugins.core.serializable import Serializable
 from synthcity.utils.constants import DEVICE
 from synthcity.utils.reproducibility import enable_reproducible_results
-from synthcity.utils.serialization import load_from_file, save_to_file
+from synthcity.utils.serialization import (
+    load_from_dir,
+    load_from_file,
+    save_to_dir,
+    save_to_file,
+)
 
 PLUGIN_NAME_NOT_SET: str = "plugin_name_not_set"
 PLUGIN_TYPE_NOT_SET: str = "plugin_type_not_set"
 
 
+def _same_constraints(
+    left: Optional[Constraints], right: Optional[Constraints]
+) -> bool:
+    if left is None or right is None:
+        return left is right
+
+    return repr(left.rules) == repr(right.rules)
+
+
 class Plugin(Serializable, metaclass=ABCMeta):
     """
     .. inheritance-diagram:: synthcity.plugins.core.plugin.Plugin
@@ -99,6 +114,7 @@ class Plugin(Serializable, metaclass=ABCMeta):
         self._schema: Optional[Schema] = None
         self._training_schema: Optional[Schema] = None
         self._data_encoders: Optional[Dict] = None
+        self._compiled_constraints: Optional[CompiledConstraints] = None
 
         self.sampling_strategy = sampling_strategy
         self.sampling_patience = sampling_patience
@@ -224,6 +240,7 @@ class Plugin(Serializable, metaclass=ABCMeta):
         enable_reproducible_results(self.random_state)
 
         self.data_info = X.info()
+        self._compiled_constraints = None
 
         self._schema = Schema(
             data=X,
@@ -270,11 +287,11 @@ class Plugin(Serializable, metaclass=ABCMeta):
         """
         ...
 
-    @validate_arguments
+    @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def generate(
         self,
         count: Optional[int] = None,
-        constraints: Optional[Constraints] = None,
+        constraints: Optional[Union[CompiledConstraints, Constraints]] = None,
         random_state: Optional[int] = None,
         **kwargs: Any,
     ) -> DataLoader:
@@ -287,8 +304,8 @@ class Plugin(Serializable, metaclass=ABCMeta):
                 Optional Generation Conditional. The conditional can be used only if the model was trained using a conditional too.
                 If provided, it must have `count` length.
                 Not all models support conditionals. The conditionals can be used in VAEs or GANs to speed-up the generation under some constraints. For model agnostic solutions, check out the `constraints` parameter.
-            constraints: optional Constraints.
-                Optional constraints to apply on the generated data. If none, the reference schema constraints are applied. The constraints are model agnostic, and will filter the output of the generative model.
+            constraints: optional Constraints or CompiledConstraints.
+                Optional constraints to apply on the generated data. If none, the reference schema constraints are applied. The constraints are model agnostic, and will filter the output of the generative model. See `compile_constraints` for reusing the same constraints across calls.
                 The constraints are a list of rules. Each rule is a tuple of the form (<feature>, <operation>, <value>).
 
                 Valid Operations:
@@ -339,14 +356,10 @@ class Plugin(Serializable, metaclass=ABCMeta):
         if count is None:
             count = self.data_info["len"]
 
-        # We use the training schema for the generation
-        gen_constraints = self.training_schema().as_constraints()
-        if constraints is not None:
-            gen_constraints = gen_constraints.extend(constraints)
+        compiled = self._get_compiled_constraints(constraints)
 
-        syn_schema = Schema.from_constraints(gen_constraints)
-
-        X_syn = self._generate(count=count, syn_schema=syn_schema, **kwargs)
+        # We use the training schema for the generation
+        X_syn = self._generate(count=count, syn_schema=compiled.syn_schema, **kwargs)
 
         if X_syn.is_tabular():
             if self.compress_dataset:
@@ -355,9 +368,7 @@ class Plugin(Serializable, metaclass=ABCMeta):
                 X_syn = X_syn.decode(self._data_encoders)
 
         # The dataset is decompressed here, we can use the public schema
-        gen_constraints = self.schema().as_constraints()
-        if constraints is not None:
-            gen_constraints = gen_constraints.extend(constraints)
+        gen_constraints = compiled.output_constraints
 
         if not X_syn.satisfies(gen_constraints) and self.strict:
             raise RuntimeError(
@@ -369,6 +380,92 @@ class Plugin(Serializable, metaclass=ABCMeta):
 
         return X_syn
 
+    @validate_arguments
+    def compile_constraints(
+        self, constraints: Optional[Constraints] = None
+    ) -> CompiledConstraints:
+        """Precompile generation constraints, for reusing them across `generate` calls.
+
+        Usage example:
+            >>> compiled = syn_model.compile_constraints(constraints)
+            >>> for _ in range(10):
+            >>>     syn_model.generate(count=100, constraints=compiled)
+
+        Args:
+            constraints: optional Constraints.
+                The user constraints, see `generate`. Later changes to this object don't affect the compiled constraints.
+
+        Returns:
+            CompiledConstraints, which can be passed as the `constraints` argument of `generate`.
+        """
+        if constraints is not None:
+            constraints = Constraints(rules=list(constraints.rules))
+
+        training_schema = self.training_schema()
+        user_rules = constraints.rules if constraints is not None else []
+
+        return CompiledConstraints(
+            constraints=constraints,
+            syn_schema=Schema.from_constraints(
+                Constraints(rules=training_schema.as_constraints().rules + user_rules)
+            ),
+            output_constraints=Constraints(
+                rules=self.schema().as_constraints().rules + user_rules
+            ),
+            training_schema=training_schema,
+        )
+
+    def _get_compiled_constraints(
+        self, constraints: Optional[Union[CompiledConstraints, Constraints]]
+    ) -> CompiledConstraints:
+        """The compiled constraints for a `generate` call, memoized until the user constraints change or the plugin is re-fitted."""
+        if isinstance(constraints, CompiledConstraints):
+            if constraints.training_schema is self.training_schema():
+                return constraints
+            # compiled before a re-fit, or for another plugin
+            return self.compile_constraints(constraints.constraints)
+
+        cached = getattr(self, "_compiled_constraints", None)
+        if (
+            cached is not None
+            and cached.training_schema is self.training_schema()
+            and _same_constraints(cached.constraints, constraints)
+        ):
+            return cached
+
+        compiled = self.compile_constraints(constraints)
+        self._compiled_constraints = compiled
+        return compiled
+
+    async def agenerate(
+        self,
+        count: Optional[int] = None,
+        constraints: Optional[Union[CompiledConstraints, Constraints]] = None,
+        random_state: Optional[int] = None,
+        **kwargs: Any,
+    ) -> DataLoader:
+        """Asynchronous synthetic data generation method.
+
+        The generation runs outside of the event loop. The concurrent calls on the same plugin are coalesced into a single `generate` call, and the output is split back between the callers. Use a `GenerationBatcher` for tuning the batching window.
+
+        Args:
+            count: optional int.
+                The number of samples to generate. If None, it generated len(reference_dataset) samples.
+            constraints: optional Constraints or CompiledConstraints.
+                Optional constraints to apply on the generated data. See `generate`.
+            random_state: optional int.
+                Optional random seed to use. The seeded calls are not coalesced.
+
+        Returns:
+            <count> synthetic samples
+        """
+        if not self.fitted:
+            raise RuntimeError("Fit the generator first")
+
+        return await generation_batcher(self).agenerate(
+            count, constraints=constraints, random_state=random_state, **kwargs
+        )
+
     @abstractmethod
     def _generate(
         self,
@@ -526,6 +623,37 @@ class Plugin(Serializable, metaclass=ABCMeta):
 
         return self._training_schema
 
+    @validate_arguments
+    def save_to_dir(self, path: Path) -> dict:
+        """Persist the plugin to a directory, in a format optimized for loading.
+
+        The tensors are stored separately from the rest of the plugin, and are memory-mapped by `load_from_dir`.
+
+        Args:
+            path: Path.
+                The output directory.
+
+        Returns:
+            The metadata of the saved plugin.
+        """
+        return save_to_dir(path, self)
+
+    @staticmethod
+    @validate_arguments
+    def load_from_dir(path: Path, mmap: bool = True) -> Any:
+        """Load a plugin persisted with `save_to_dir`.
+
+        Args:
+            path: Path.
+                The plugin directory.
+            mmap: bool.
+                Memory-map the tensors instead of reading them in memory.
+
+        Returns:
+            The loaded plugin.
+        """
+        return load_from_dir(path, mmap=mmap)
+
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def plot(
         self,
@@ -691,6 +819,11 @@ class PluginLoader:
         """Load serialized plugin"""
         return Plugin.load(buff)
 
+    @validate_arguments
+    def load_from_dir(self, path: Path, mmap: bool = True) -> Any:
+        """Load plugin persisted with `Plugin.save_to_dir`"""
+        return Plugin.load_from_dir(path, mmap=mmap)
+
     @validate_arguments
     def get(self, name: str, *args: Any, **kwargs: Any) -> Any:
         """Create a new object from a plugin.
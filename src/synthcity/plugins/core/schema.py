@@ -357,3 +357,32 @@ class Schema(BaseModel):
                 log.error(f"Exception occurred while processing column '{col}': {e}")
                 raise
         return feature_domain
+
+
+class CompiledConstraints:
+    """Generation constraints, precompiled for a fitted plugin by `Plugin.compile_constraints`.
+
+    Holds the objects derived from the plugin schemas and the user constraints, which `Plugin.generate` would otherwise rebuild on every call.
+
+    Constructor Args:
+        constraints: Optional[Constraints]
+            The user constraints.
+        syn_schema: Schema
+            The schema used by the generative model, built from the training schema and the user constraints.
+        output_constraints: Constraints
+            The constraints checked on the decoded output, from the public schema and the user constraints.
+        training_schema: Schema
+            The training schema of the plugin, used for detecting a re-fit.
+    """
+
+    def __init__(
+        self,
+        constraints: Optional[Constraints],
+        syn_schema: Schema,
+        output_constraints: Constraints,
+        training_schema: Schema,
+    ) -> None:
+        self.constraints = constraints
+        self.syn_schema = syn_schema
+        self.output_constraints = output_constraints
+        self.training_schema = training_schema
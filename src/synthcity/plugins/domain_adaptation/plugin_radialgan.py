@@ -34,6 +34,25 @@ from synthcity.utils.constants import DEVICE
 from synthcity.utils.reproducibility import clear_cache, enable_reproducible_results
 
 
+def _grouped_forward(
+    models: Dict[Any, nn.Module], keys: List, inputs: List[torch.Tensor]
+) -> List[torch.Tensor]:
+    """Evaluate models[keys[idx]](inputs[idx]) for each idx, with a single call per model on the concatenated inputs of its key.
+
+    The models must process the rows independently(no batch normalization).
+    """
+    outputs: List[torch.Tensor] = list(inputs)
+    for key in dict.fromkeys(keys):
+        positions = [idx for idx, item in enumerate(keys) if item == key]
+        output = models[key](torch.concat([inputs[idx] for idx in positions]))
+        for idx, chunk in zip(
+            positions, torch.split(output, [len(inputs[idx]) for idx in positions])
+        ):
+            outputs[idx] = chunk
+
+    return outputs
+
+
 class RadialGAN(nn.Module):
     """
     .. inheritance-diagram:: synthcity.plugins.domain_adaptation.plugin_radialgan.RadialGAN
@@ -256,20 +275,37 @@ class RadialGAN(nn.Module):
             raise ValueError("Invalid domain weights")
 
         batch_per_domain = count // len(domains) + 1
-        out = torch.tensor([]).to(self.device)
-        out_domains = []
+
+        # The noise is drawn for each (target, source) pair, then each generator and each mapper runs once, on the rows of all its pairs.
+        targets = []
+        sources = []
+        noises = []
         for target_domain in domains:
             for src_domain in self.domain_weights:
                 src_batch_size = int(batch_per_domain * self.domain_weights[src_domain])
-                fixed_noise = torch.randn(
-                    src_batch_size, self.n_units_latent, device=self.device
+                targets.append(target_domain)
+                sources.append(src_domain)
+                noises.append(
+                    torch.randn(src_batch_size, self.n_units_latent, device=self.device)
                 )
-                domain_generated = self.generators[src_domain](fixed_noise)
-                if src_domain != target_domain:
-                    domain_generated = self.mappers[target_domain](domain_generated)
 
-                out = torch.concat([out, domain_generated])
-                out_domains.extend([target_domain] * len(domain_generated))
+        generated = _grouped_forward(self.generators, sources, noises)
+
+        mapped_pairs = [
+            idx for idx in range(len(targets)) if sources[idx] != targets[idx]
+        ]
+        mapped = _grouped_forward(
+            self.mappers,
+            [targets[idx] for idx in mapped_pairs],
+            [generated[idx] for idx in mapped_pairs],
+        )
+        for idx, domain_generated in zip(mapped_pairs, mapped):
+            generated[idx] = domain_generated
+
+        out = torch.concat(generated)
+        out_domains = []
+        for target_domain, domain_generated in zip(targets, generated):
+            out_domains.extend([target_domain] * len(domain_generated))
 
         return out, out_domains
 
@@ -299,23 +335,25 @@ class RadialGAN(nn.Module):
 
         noise = torch.randn(batch_size, self.n_units_latent, device=self.device)
 
-        errs = []
-        for other_domain in self.domains:
-            if other_domain == domain:
-                continue
-
-            fake = self.generators[other_domain](
-                noise
-            )  # generate fake data for <other_domain>
-            fake = self.mappers[domain](fake)  # remap data to domain <domain>
+        other_domains = [
+            other_domain for other_domain in self.domains if other_domain != domain
+        ]
+        if len(other_domains) == 0:
+            return 0
 
-            # Calculate M's loss based on this output
-            errM = nn.MSELoss()(fake, real_X)
+        # generate fake data for the other domains, and remap it to <domain> in a single pass
+        fake = torch.concat(
+            [self.generators[other_domain](noise) for other_domain in other_domains]
+        )
+        fake = self.mappers[domain](fake)
 
-            errs.append(errM)
+        # Calculate M's loss for each other domain
+        errs = ((fake.view(len(other_domains), *real_X.shape) - real_X) ** 2).mean(
+            dim=tuple(range(1, real_X.dim() + 1))
+        )
 
         # Calculate gradients for M
-        errM = 0.1 * torch.sqrt(torch.stack(errs)).mean()
+        errM = 0.1 * torch.sqrt(errs).mean()
         errM.backward()
 
         # Update M
@@ -344,9 +382,11 @@ class RadialGAN(nn.Module):
 
         noise = torch.randn(batch_size, self.n_units_latent, device=self.device)
 
+        generated = self.generators[domain](noise)  # generate fake data
+
         errs = []
         for other_domain in self.domains:
-            fake = self.generators[domain](noise)  # generate fake data
+            fake = generated
             if other_domain != domain:
                 fake = self.mappers[other_domain](
                     fake
@@ -394,52 +434,60 @@ class RadialGAN(nn.Module):
             real_labels = self.true_labels_generator(X).to(self.device).squeeze()
             real_output = self.discriminators[domain](real_X).squeeze().float()
 
-            # Train with all-fake batch
-            errD_fakes = []
-            penalties = []
+            # Train with all-fake batch: generate fake data for each domain, remap the other domains data to <domain>, and score all of it in a single pass
+            fakes = []
             for other_domain in self.domains:
                 noise = torch.randn(batch_size, self.n_units_latent, device=self.device)
-
-                fake = self.generators[other_domain](
-                    noise
-                )  # generate fake data for domain <other_domain>
-
-                if other_domain != domain:
-                    fake = self.mappers[domain](
-                        fake
-                    )  # remap the generate data to domain <domain>
-
-                fake_labels = (
-                    self.fake_labels_generator(fake).to(self.device).squeeze().float()
+                fakes.append(self.generators[other_domain](noise))
+
+            mapped_idx = [
+                idx
+                for idx, other_domain in enumerate(self.domains)
+                if other_domain != domain
+            ]
+            if len(mapped_idx) > 0:
+                mapped = self.mappers[domain](
+                    torch.concat([fakes[idx] for idx in mapped_idx])
                 )
-                fake_output = self.discriminators[domain](fake.detach()).squeeze()
-
-                # Compute errors. Some fake inputs might be marked as real for privacy guarantees.
+                for idx, mapped_fake in zip(
+                    mapped_idx, torch.split(mapped, batch_size)
+                ):
+                    fakes[idx] = mapped_fake
+
+            fake = torch.concat(fakes)
+            fake_labels = (
+                self.fake_labels_generator(fake).to(self.device).squeeze().float()
+            )
+            fake_output = self.discriminators[domain](fake.detach()).view(-1)
 
-                real_real_output = real_output[(real_labels * real_output) != 0]
-                real_fake_output = fake_output[(fake_labels * fake_output) != 0]
-                errD_real = torch.mean(
-                    torch.concat((real_real_output, real_fake_output))
-                )
+            # Compute errors. Some fake inputs might be marked as real for privacy guarantees.
 
-                fake_real_output = real_output[((1 - real_labels) * real_output) != 0]
-                fake_fake_output = fake_output[((1 - fake_labels) * fake_output) != 0]
+            real_real_output = real_output[(real_labels * real_output) != 0]
+            real_fake_output = fake_output[(fake_labels * fake_output) != 0]
+            errD_real = torch.mean(torch.concat((real_real_output, real_fake_output)))
 
-                errD_fake = torch.mean(
-                    torch.concat((fake_real_output, fake_fake_output))
+            fake_real_output = real_output[((1 - real_labels) * real_output) != 0]
+            errD_fakes = []
+            for domain_fake_output, domain_fake_labels in zip(
+                torch.split(fake_output, batch_size),
+                torch.split(fake_labels.view(-1), batch_size),
+            ):
+                fake_fake_output = domain_fake_output[
+                    ((1 - domain_fake_labels) * domain_fake_output) != 0
+                ]
+                errD_fakes.append(
+                    torch.mean(torch.concat((fake_real_output, fake_fake_output)))
                 )
 
-                penalty = self._loss_gradient_penalty(
-                    domain=domain,
-                    real_samples=real_X,
-                    fake_samples=fake,
-                    batch_size=batch_size,
-                )
-                errD_fakes.append(errD_fake)
-                penalties.append(penalty)
+            # the rows are independent: the penalty of the stacked batches is the mean of the domains penalties
+            penalty = self._loss_gradient_penalty(
+                domain=domain,
+                real_samples=real_X.repeat(len(self.domains), 1),
+                fake_samples=fake,
+                batch_size=len(fake),
+            )
 
             errD_fake = torch.stack(errD_fakes)
-            penalty = torch.stack(penalties)
             errD = -errD_real + errD_fake.mean()
 
             self.discriminators[domain].optimizer.zero_grad()
@@ -538,10 +586,7 @@ class RadialGAN(nn.Module):
         interpolated = (
             alpha * real_samples + ((1 - alpha) * fake_samples)
         ).requires_grad_(True)
-        if batch_size > 1:
-            d_interpolated = self.discriminators[domain](interpolated).squeeze()
-        else:
-            d_interpolated = self.discriminators[domain](interpolated)[0, :]
+        d_interpolated = self.discriminators[domain](interpolated).view(-1)
 
         labels = torch.ones((len(interpolated),), device=self.device)
 
@@ -10,7 +10,6 @@ from typing import Any, List
 # third party
 import numpy as np
 import pandas as pd
-from pgmpy.sampling import BayesianModelSampling
 
 # try block to maintain support for both pgmpy < 1.0.0 and >= 1.0.0
 try:
@@ -41,6 +40,9 @@ except AttributeError:
 # synthcity absolute
 from synthcity.plugins.core.dataloader import DataLoader
 from synthcity.plugins.core.distribution import CategoricalDistribution, Distribution
+from synthcity.plugins.core.models.bayesian_network_sampler import (
+    BayesianNetworkSampler,
+)
 from synthcity.plugins.core.models.tabular_encoder import TabularEncoder
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
@@ -196,12 +198,16 @@ class BayesianNetworkPlugin(Plugin):
         network = BayesianNetwork(dag)
         network.fit(df)
 
-        self.model = BayesianModelSampling(network)
+        self.sampler = BayesianNetworkSampler(network)
         return self
 
     def _generate(self, count: int, syn_schema: Schema, **kwargs: Any) -> pd.DataFrame:
+        # the plugins serialized by the previous versions hold a BayesianModelSampling, which references the network
+        if getattr(self, "sampler", None) is None:
+            self.sampler = BayesianNetworkSampler(self.model.model)
+
         def _sample(count: int) -> pd.DataFrame:
-            vals = self.model.forward_sample(size=count, show_progress=False)
+            vals = self.sampler.sample(count)
 
             return self._encode_decode(vals)
 
@@ -4,7 +4,7 @@ Reference: "Modeling Tabular Data using Conditional GAN", Xu, Lei et al.
 
 # stdlib
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 # third party
 import numpy as np
@@ -26,6 +26,7 @@ from synthcity.plugins.core.distribution import (
 from synthcity.plugins.core.models.tabular_gan import TabularGAN
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 
@@ -81,6 +82,8 @@ class CTGANPlugin(Plugin):
             Max number of iterations without any improvement before early stopping is trigged.
         patience_metric: Optional[WeightedMetrics]
             If not None, the metric is used for evaluation the criterion for early stopping.
+        callbacks: Sequence[Callback]
+            Optional training callbacks, for example `OptunaPruning` for multi-fidelity hyperparameter searches.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -129,6 +132,7 @@ class CTGANPlugin(Plugin):
         device: Any = DEVICE,
         patience: int = 5,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
         n_iter_print: int = 50,
         n_iter_min: int = 100,
         adjust_inference_sampling: bool = False,
@@ -179,6 +183,7 @@ class CTGANPlugin(Plugin):
         self.device = device
         self.patience = patience
         self.patience_metric = patience_metric
+        self.callbacks = callbacks
         self.n_iter_min = n_iter_min
         self.n_iter_print = n_iter_print
         self.adjust_inference_sampling = adjust_inference_sampling
@@ -271,6 +276,7 @@ class CTGANPlugin(Plugin):
             device=self.device,
             patience=self.patience,
             patience_metric=self.patience_metric,
+            callbacks=self.callbacks,
             n_iter_min=self.n_iter_min,
             n_iter_print=self.n_iter_print,
             adjust_inference_sampling=self.adjust_inference_sampling,
@@ -86,6 +86,8 @@ class TabDDPMPlugin(Plugin):
         >>> plugin = Plugins().get("ddpm", n_iter=100, is_classification=True)
         >>> plugin.fit(X)
         >>> plugin.generate(50)
+        >>> # faster DDIM sampling, using 50 denoising steps
+        >>> plugin.generate(50, sampling_steps=50)
 
     """
 
@@ -234,7 +236,14 @@ class TabDDPMPlugin(Plugin):
         return self
 
     def _generate(self, count: int, syn_schema: Schema, **kwargs: Any) -> DataLoader:
+        """Generate synthetic data.
+
+        Optionally, a condition can be given as the keyword argument `cond`.
+
+        The keyword argument `sampling_steps` switches to the deterministic DDIM sampler, which runs only `sampling_steps` denoising steps, evenly spaced over the `num_timesteps` of the diffusion. Fewer steps trade quality for speed.
+        """
         cond = kwargs.pop("cond", None)
+        sampling_steps = kwargs.pop("sampling_steps", None)
 
         if self.is_classification and cond is None:
             # randomly generate labels following the distribution of the training data
@@ -244,7 +253,7 @@ class TabDDPMPlugin(Plugin):
             raise ValueError("The length of cond is less than the required count")
 
         def callback(count):  # type: ignore
-            df = self.model.generate(count, cond=cond)
+            df = self.model.generate(count, cond=cond, sampling_steps=sampling_steps)
             df = self.encoder.inverse_transform(df)
             if self.is_classification:
                 df = df.join(pd.Series(cond, name=self.target_name))
@@ -1,6 +1,6 @@
 # stdlib
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 # third party
 import pandas as pd
@@ -19,6 +19,7 @@ from synthcity.plugins.core.models.flows import NormalizingFlows
 from synthcity.plugins.core.models.tabular_flows import TabularFlows
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 
@@ -84,6 +85,8 @@ class NormalizingFlowsPlugin(Plugin):
             Max number of iterations without any improvement before training early stopping is trigged.
         patience_metric: Optional[WeightedMetrics]
             If not None, the metric is used for evaluation the criterion for training early stopping.
+        callbacks: Sequence[Callback]
+            Optional training callbacks, for example `OptunaPruning` for multi-fidelity hyperparameter searches.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -131,6 +134,7 @@ class NormalizingFlowsPlugin(Plugin):
         n_iter_print: int = 50,
         patience: int = 5,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
         # core plugin arguments
         workspace: Path = Path("workspace"),
         compress_dataset: bool = False,
@@ -178,6 +182,7 @@ class NormalizingFlowsPlugin(Plugin):
         self.n_iter_print = n_iter_print
         self.patience = patience
         self.patience_metric = patience_metric
+        self.callbacks = callbacks
 
     @staticmethod
     def name() -> str:
@@ -238,6 +243,7 @@ class NormalizingFlowsPlugin(Plugin):
                 n_iter_print=self.n_iter_print,
                 patience=self.patience,
                 patience_metric=self.patience_metric,
+                callbacks=self.callbacks,
                 device=self.device,
             )
         else:
@@ -260,6 +266,7 @@ class NormalizingFlowsPlugin(Plugin):
                 n_iter_print=self.n_iter_print,
                 patience=self.patience,
                 patience_metric=self.patience_metric,
+                callbacks=self.callbacks,
                 device=self.device,
             )
 
@@ -4,7 +4,7 @@ Reference: Akrami, Haleh, Anand A. Joshi, Jian Li, Sergül Aydöre, and Richard
 
 # stdlib
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 # third party
 import numpy as np
@@ -25,6 +25,7 @@ from synthcity.plugins.core.distribution import (
 from synthcity.plugins.core.models.tabular_vae import TabularVAE
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 
@@ -61,10 +62,14 @@ class RTVAEPlugin(Plugin):
             l2 (ridge) penalty for the weights.
         batch_size: int
             Batch size
+        generate_batch_size: int
+            The number of samples decoded at once during the generation
         random_state: int
             random_state used
         encoder_max_clusters: int
             The max number of clusters to create for continuous columns when encoding
+        callbacks: Sequence[Callback]
+            Optional training callbacks, for example `OptunaPruning` for multi-fidelity hyperparameter searches. The validation loss is reported as `valid_score`.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -96,6 +101,7 @@ class RTVAEPlugin(Plugin):
         lr: float = 1e-3,
         weight_decay: float = 1e-5,
         batch_size: int = 200,
+        generate_batch_size: int = 10000,
         random_state: int = 0,
         decoder_n_layers_hidden: int = 3,
         decoder_n_units_hidden: int = 500,
@@ -111,6 +117,7 @@ class RTVAEPlugin(Plugin):
         n_iter_print: int = 50,
         n_iter_min: int = 100,
         patience: int = 5,
+        callbacks: Sequence[Callback] = (),
         device: Any = DEVICE,
         # core plugin arguments
         workspace: Path = Path("workspace"),
@@ -139,6 +146,7 @@ class RTVAEPlugin(Plugin):
         self.lr = lr
         self.weight_decay = weight_decay
         self.batch_size = batch_size
+        self.generate_batch_size = generate_batch_size
         self.random_state = random_state
         self.data_encoder_max_clusters = data_encoder_max_clusters
         self.dataloader_sampler = dataloader_sampler
@@ -149,6 +157,7 @@ class RTVAEPlugin(Plugin):
         self.n_iter_print = n_iter_print
         self.n_iter_min = n_iter_min
         self.patience = patience
+        self.callbacks = callbacks
 
     @staticmethod
     def name() -> str:
@@ -195,6 +204,7 @@ class RTVAEPlugin(Plugin):
             cond=cond,
             n_units_embedding=self.n_units_embedding,
             batch_size=self.batch_size,
+            generate_batch_size=self.generate_batch_size,
             lr=self.lr,
             weight_decay=self.weight_decay,
             n_iter=self.n_iter,
@@ -218,6 +228,7 @@ class RTVAEPlugin(Plugin):
             n_iter_min=self.n_iter_min,
             n_iter_print=self.n_iter_print,
             patience=self.patience,
+            callbacks=self.callbacks,
             device=self.device,
         )
         self.model.fit(X.dataframe(), **kwargs)
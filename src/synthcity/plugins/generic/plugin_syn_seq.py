@@ -31,6 +31,8 @@ class Syn_SeqPlugin(Plugin):
         sampling_strategy: str.
             Sampling strategy to use for generating synthetic data. Options are 'marginal' or 'joint'.
             Default is 'marginal'.
+        n_jobs: int. Default = 1.
+            Number of worker processes used for fitting the column models. -1 uses all the CPUs.
 
 
     Example:
@@ -66,6 +68,7 @@ class Syn_SeqPlugin(Plugin):
         random_state: int = 0,
         compress_dataset: bool = False,
         sampling_strategy: str = "marginal",
+        n_jobs: int = 1,
         **kwargs: Any
     ) -> None:
         super().__init__(
@@ -74,6 +77,7 @@ class Syn_SeqPlugin(Plugin):
             compress_dataset=compress_dataset,
             sampling_strategy=sampling_strategy,
         )
+        self.n_jobs = n_jobs
         self.model: Optional[Syn_Seq] = None
 
     def _fit(self, X: DataLoader, *args: Any, **kwargs: Any) -> "Syn_SeqPlugin":
@@ -82,6 +86,7 @@ class Syn_SeqPlugin(Plugin):
         self.model = Syn_Seq(
             random_state=self.random_state,
             sampling_patience=self.sampling_patience,
+            n_jobs=self.n_jobs,
         )
 
         # cast explicitly to Syn_Seq to make sure mypy doesn't think it can be None
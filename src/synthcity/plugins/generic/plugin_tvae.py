@@ -1,6 +1,6 @@
 # stdlib
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 # third party
 import numpy as np
@@ -21,6 +21,7 @@ from synthcity.plugins.core.distribution import (
 from synthcity.plugins.core.models.tabular_vae import TabularVAE
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 
@@ -56,6 +57,8 @@ class TVAEPlugin(Plugin):
             l2 (ridge) penalty for the weights.
         batch_size: int
             Batch size
+        generate_batch_size: int
+            The number of samples decoded at once during the generation
         random_state: int
             random_state used
         encoder_max_clusters: int
@@ -67,6 +70,8 @@ class TVAEPlugin(Plugin):
             Minimum number of iterations to go through before starting early stopping
         patience: int
             Max number of iterations without any improvement before early stopping is trigged.
+        callbacks: Sequence[Callback]
+            Optional training callbacks, for example `OptunaPruning` for multi-fidelity hyperparameter searches. The validation loss is reported as `valid_score`.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -98,6 +103,7 @@ class TVAEPlugin(Plugin):
         lr: float = 1e-3,
         weight_decay: float = 1e-5,
         batch_size: int = 200,
+        generate_batch_size: int = 10000,
         random_state: int = 0,
         decoder_n_layers_hidden: int = 3,
         decoder_n_units_hidden: int = 500,
@@ -114,6 +120,7 @@ class TVAEPlugin(Plugin):
         n_iter_print: int = 50,
         n_iter_min: int = 100,
         patience: int = 5,
+        callbacks: Sequence[Callback] = (),
         # core plugin arguments
         device: Any = DEVICE,
         workspace: Path = Path("workspace"),
@@ -142,6 +149,7 @@ class TVAEPlugin(Plugin):
         self.lr = lr
         self.weight_decay = weight_decay
         self.batch_size = batch_size
+        self.generate_batch_size = generate_batch_size
         self.random_state = random_state
         self.data_encoder_max_clusters = data_encoder_max_clusters
         self.dataloader_sampler = dataloader_sampler
@@ -152,6 +160,7 @@ class TVAEPlugin(Plugin):
         self.n_iter_print = n_iter_print
         self.n_iter_min = n_iter_min
         self.patience = patience
+        self.callbacks = callbacks
 
     @staticmethod
     def name() -> str:
@@ -198,6 +207,7 @@ class TVAEPlugin(Plugin):
             cond=cond,
             n_units_embedding=self.n_units_embedding,
             batch_size=self.batch_size,
+            generate_batch_size=self.generate_batch_size,
             lr=self.lr,
             weight_decay=self.weight_decay,
             n_iter=self.n_iter,
@@ -221,6 +231,7 @@ class TVAEPlugin(Plugin):
             n_iter_min=self.n_iter_min,
             n_iter_print=self.n_iter_print,
             patience=self.patience,
+            callbacks=self.callbacks,
             device=self.device,
         )
         self.model.fit(X.dataframe(), **kwargs)
@@ -7,7 +7,7 @@ Paper link: https://ieeexplore.ieee.org/document/9034117
 """
 # stdlib
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 # third party
 import pandas as pd
@@ -28,6 +28,7 @@ from synthcity.plugins.core.distribution import (
 from synthcity.plugins.core.models.tabular_gan import TabularGAN
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
+from synthcity.utils.callbacks import Callback
 from synthcity.utils.constants import DEVICE
 
 
@@ -87,6 +88,8 @@ class AdsGANPlugin(Plugin):
             Max number of iterations without any improvement before training early stopping is trigged.
         patience_metric: Optional[WeightedMetrics]
             If not None, the metric is used for evaluation the criterion for training early stopping.
+        callbacks: Sequence[Callback]
+            Optional training callbacks, for example `OptunaPruning` for multi-fidelity hyperparameter searches.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -139,6 +142,7 @@ class AdsGANPlugin(Plugin):
         # early stopping
         patience: int = 5,
         patience_metric: Optional[WeightedMetrics] = None,
+        callbacks: Sequence[Callback] = (),
         n_iter_print: int = 50,
         n_iter_min: int = 100,
         # core plugin arguments
@@ -190,6 +194,7 @@ class AdsGANPlugin(Plugin):
         self.device = device
         self.patience = patience
         self.patience_metric = patience_metric
+        self.callbacks = callbacks
         self.n_iter_min = n_iter_min
         self.n_iter_print = n_iter_print
         self.adjust_inference_sampling = adjust_inference_sampling
@@ -268,6 +273,7 @@ class AdsGANPlugin(Plugin):
             device=self.device,
             patience=self.patience,
             patience_metric=self.patience_metric,
+            callbacks=self.callbacks,
             n_iter_min=self.n_iter_min,
             n_iter_print=self.n_iter_print,
             adjust_inference_sampling=self.adjust_inference_sampling,
@@ -13,6 +13,7 @@ import pandas as pd
 
 # Necessary packages
 import torch
+from joblib import Parallel, delayed
 
 # Necessary packages
 from pydantic import validate_arguments
@@ -35,7 +36,83 @@ from synthcity.plugins.core.serializable import Serializable
 from synthcity.utils.constants import DEVICE
 
 
+def _fit_teacher(
+    template: Any, model_args: dict, X: np.ndarray, y: np.ndarray, tidx: int
+) -> Any:
+    """Train the teacher <tidx> on its partition of the stacked teacher datasets.
+
+    Module level, so it can run in the worker processes of `Teachers.fit`. The worker processes receive the datasets as memory-mapped arrays, and only read the partition of their teacher.
+    """
+    model = template(**model_args)
+    model.fit(X[tidx], y)
+
+    return model
+
+
+def _fit_batched_logistic(
+    X: np.ndarray,
+    y: np.ndarray,
+    C: float = 1.0,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Train a batch of L2-regularized logistic regressions with a single batched Newton solve.
+
+    The objective of each model is the same as `LogisticRegression(C=C)`: the log-loss of its dataset plus the L2 penalty on the coefficients, without penalty on the intercept.
+
+    Args:
+        X: np.ndarray
+            The stacked datasets, with shape (n_models, n_samples, n_features).
+        y: np.ndarray
+            The binary labels, shared by all the models, with shape (n_samples,).
+        C: float
+            Inverse of the regularization strength.
+        max_iter: int
+            Maximum number of Newton iterations.
+        tol: float
+            Tolerance on the largest update of the weights.
+
+    Returns:
+        The coefficients (n_models, n_features) and the intercepts (n_models,).
+    """
+    n_models, n_samples, n_features = X.shape
+    Xb = np.concatenate([X, np.ones((n_models, n_samples, 1))], axis=2)
+
+    XbT = Xb.transpose(0, 2, 1)
+
+    # the tiny penalty on the intercept keeps the separable datasets solvable
+    penalty = np.eye(n_features + 1) / C
+    penalty[-1, -1] = 1e-10
+
+    w = np.zeros((n_models, n_features + 1))
+    for _ in range(max_iter):
+        proba = 1 / (1 + np.exp(-(Xb @ w[..., None])[..., 0]))
+        grad = (XbT @ (proba - y)[..., None])[..., 0] + w @ penalty
+        hess = XbT @ (Xb * (proba * (1 - proba))[..., None]) + penalty
+        step = np.linalg.solve(hess, grad[..., None])[..., 0]
+        w -= step
+        if np.abs(step).max() < tol:
+            break
+
+    return w[:, :-1], w[:, -1]
+
+
 class Teachers(Serializable):
+    """Ensemble of PATE teachers, each one trained on a disjoint partition of the real data.
+
+    Args:
+        n_teachers: int
+            Number of teachers.
+        samples_per_teacher: int
+            Number of real samples in the partition of each teacher.
+        lamda: float
+            PATE noise size.
+        template: str
+            Model to use for the teachers. Can be linear, batched_linear or xgboost. batched_linear trains the linear teachers with a single batched Newton solve.
+        n_jobs: int
+            Number of worker processes for training and querying the teachers. -1 uses all the CPUs. The linear teachers are always queried with a single matrix product.
+    """
+
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
@@ -43,12 +120,15 @@ class Teachers(Serializable):
         samples_per_teacher: int,
         lamda: float = 1e-3,  # PATE noise size
         template: str = "xgboost",
+        n_jobs: int = 1,
     ) -> None:
         super().__init__()
 
         self.samples_per_teacher = samples_per_teacher
         self.n_teachers = n_teachers
         self.lamda = lamda
+        self.template = template
+        self.n_jobs = n_jobs
         self.model_args: dict = {}
         if template == "xgboost":
             self.model_template = XGBClassifier
@@ -66,11 +146,11 @@ class Teachers(Serializable):
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def fit(self, X: np.ndarray, generator: Any) -> Any:
-        # 1. train teacher models
-        self.teacher_models: list = []
-
+        # 1. build the teacher datasets.
+        # The random draws happen here, in the teacher order, so the ensemble doesn't depend on n_jobs.
         permutations = np.random.permutation(len(X))
 
+        x_teachers = []
         for tidx in range(self.n_teachers):
             teacher_idx = permutations[
                 int(tidx * self.samples_per_teacher) : int(
@@ -84,30 +164,74 @@ class Teachers(Serializable):
             idx = np.random.permutation(len(teacher_X[:, 0]))
             x_mb = teacher_X[idx[: self.samples_per_teacher], :]
 
-            x_comb = np.concatenate((x_mb, g_mb), axis=0)
-            y_comb = np.concatenate(
-                (
-                    np.ones(
-                        [
-                            len(teacher_X),
-                        ]
-                    ),
-                    np.zeros(
-                        [
-                            len(teacher_X),
-                        ]
-                    ),
+            x_teachers.append(np.concatenate((x_mb, g_mb), axis=0))
+
+        x_comb = np.stack(
+            x_teachers
+        )  # (n_teachers, 2 * samples_per_teacher, n_features)
+        y_comb = np.concatenate(
+            (
+                np.ones(
+                    [
+                        self.samples_per_teacher,
+                    ]
                 ),
-                axis=0,
-            )
+                np.zeros(
+                    [
+                        self.samples_per_teacher,
+                    ]
+                ),
+            ),
+            axis=0,
+        )
 
-            model = self.model_template(**self.model_args)
-            model.fit(x_comb, y_comb)
+        # 2. train teacher models
+        self.teacher_models: list = []
+        self.coef: Optional[np.ndarray] = None
+        self.intercept: Optional[np.ndarray] = None
+
+        if self.template == "batched_linear":
+            self.coef, self.intercept = _fit_batched_logistic(x_comb, y_comb)
+            return self
+
+        if self.n_jobs == 1 or self.n_teachers <= 1:
+            self.teacher_models = [
+                _fit_teacher(self.model_template, self.model_args, x_comb, y_comb, tidx)
+                for tidx in range(self.n_teachers)
+            ]
+        else:
+            # The stacked datasets are memory-mapped once, and shared by the workers.
+            self.teacher_models = Parallel(n_jobs=self.n_jobs, mmap_mode="r")(
+                delayed(_fit_teacher)(
+                    self.model_template, self.model_args, x_comb, y_comb, tidx
+                )
+                for tidx in range(self.n_teachers)
+            )
 
-            self.teacher_models.append(model)
+        if self.model_template is LogisticRegression:
+            self.coef = np.vstack([model.coef_ for model in self.teacher_models])
+            self.intercept = np.concatenate(
+                [model.intercept_ for model in self.teacher_models]
+            )
 
         return self
 
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        """The labels predicted by the teachers, with shape (n_teachers, batch_size)."""
+        if self.coef is not None and self.intercept is not None:
+            # linear teachers: the same decision function as LogisticRegression.predict, for all the teachers at once.
+            scores = self.coef @ x.T + self.intercept[:, None]
+            return (scores > 0).astype(int)
+
+        if self.n_jobs == 1 or self.n_teachers <= 1:
+            predictions = [teacher.predict(x) for teacher in self.teacher_models]
+        else:
+            predictions = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(teacher.predict)(x) for teacher in self.teacher_models
+            )
+
+        return np.vstack(predictions)
+
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def pate_lamda(self, x: np.ndarray) -> Tuple[int, int, int]:
         """Returns PATE_lambda(x).
@@ -120,13 +244,7 @@ class Teachers(Serializable):
           - out: label after adding laplace noise.
         """
 
-        predictions = []
-
-        for tidx, teacher in enumerate(self.teacher_models):
-            y_pred = teacher.predict(x)
-            predictions.append(y_pred)
-
-        y_hat = np.vstack(predictions)  # (n_teachers, batch_size)
+        y_hat = self._predict(x)  # (n_teachers, batch_size)
 
         n0 = np.sum(y_hat == 0, axis=0)  # (batch_size, )
         n1 = np.sum(y_hat == 1, axis=0)  # (batch_size, )
@@ -172,6 +290,7 @@ class PATEGAN(Serializable):
         lamda: float = 1e-3,
         alpha: int = 100,
         encoder: Any = None,
+        n_jobs: int = 1,
     ) -> None:
         super().__init__()
 
@@ -201,6 +320,7 @@ class PATEGAN(Serializable):
         self.alpha = alpha
         self.encoder_max_clusters = encoder_max_clusters
         self.encoder = encoder
+        self.n_jobs = n_jobs
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def fit(
@@ -267,6 +387,7 @@ class PATEGAN(Serializable):
                 samples_per_teacher=self.samples_per_teacher,
                 lamda=self.lamda,
                 template=self.teacher_template,
+                n_jobs=self.n_jobs,
             )
             teachers.fit(np.asarray(X_train_enc), self.model)
 
@@ -374,7 +495,7 @@ class PATEGANPlugin(Plugin):
         clipping_value: int, default 0
             Gradients clipping value. Zero disables the feature
         teacher_template: str
-            Model to use for the teachers. Can be linear, xgboost.
+            Model to use for the teachers. Can be linear, batched_linear, xgboost. batched_linear trains all the linear teachers with a single batched solve.
         epsilon: float
             Differential privacy parameter
         delta: float
@@ -383,6 +504,8 @@ class PATEGANPlugin(Plugin):
             Noise size
         encoder_max_clusters: int
             The max number of clusters to create for continuous columns when encoding
+        n_jobs: int
+            Number of worker processes used for training and querying the teachers. -1 uses all the CPUs.
         # Core Plugin arguments
         workspace: Path.
             Optional Path for caching intermediary results.
@@ -435,6 +558,7 @@ class PATEGANPlugin(Plugin):
         lamda: float = 1e-3,
         alpha: int = 100,
         encoder: Any = None,
+        n_jobs: int = 1,
         # core plugin arguments
         device: Any = DEVICE,
         workspace: Path = Path("workspace"),
@@ -477,6 +601,7 @@ class PATEGANPlugin(Plugin):
             epsilon=epsilon,
             delta=delta,
             lamda=lamda,
+            n_jobs=n_jobs,
         )
 
     @staticmethod
@@ -6,17 +6,14 @@ from collections import namedtuple
 from itertools import combinations, product
 from math import ceil
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # third party
 import numpy as np
 import pandas as pd
 from pgmpy.factors.discrete.CPD import TabularCPD
-from pgmpy.sampling import BayesianModelSampling
 from pydantic import validate_arguments
 from scipy.optimize import fsolve
-from sklearn.cluster import KMeans
-from sklearn.metrics import normalized_mutual_info_score
 from sklearn.preprocessing import LabelEncoder
 from tqdm import tqdm
 
@@ -30,6 +27,9 @@ except ImportError:
 import synthcity.logger as log
 from synthcity.plugins.core.dataloader import DataLoader
 from synthcity.plugins.core.distribution import Distribution
+from synthcity.plugins.core.models.bayesian_network_sampler import (
+    BayesianNetworkSampler,
+)
 from synthcity.plugins.core.plugin import Plugin
 from synthcity.plugins.core.schema import Schema
 from synthcity.plugins.core.serializable import Serializable
@@ -37,6 +37,9 @@ from synthcity.utils.reproducibility import enable_reproducible_results
 
 network_edge = namedtuple("network_edge", ["feature", "parents"])
 
+# Upper bound for the size of the contingency tables computed in a single pass.
+MAX_CONTINGENCY_CELLS = 2**22
+
 
 def usefulness_minus_target(
     k: int,
@@ -68,6 +71,126 @@ def usefulness_minus_target(
     return usefulness - target_usefulness
 
 
+class ContingencyMutualInformation:
+    """Normalized mutual information between the columns of an integer encoded dataset, computed from their contingency tables.
+
+    Each column is discretized into at most `n_bins` equal-width bins. The parents of a node are represented by the cells of their joint histogram, which are cached for each parent set, and the scores of many candidate nodes are computed from one `np.bincount` call.
+
+    Args:
+        data: pd.DataFrame
+            The integer encoded dataset.
+        n_bins: int
+            The maximum number of bins for each column.
+    """
+
+    def __init__(self, data: pd.DataFrame, n_bins: int) -> None:
+        self.n_rows = len(data)
+        self.columns = {col: idx for idx, col in enumerate(data.columns)}
+
+        codes = []
+        for col in data.columns:
+            col_codes, col_values = pd.factorize(data[col], sort=True)
+            if len(col_values) > n_bins:
+                col_codes = col_codes * n_bins // len(col_values)
+            codes.append(col_codes)
+
+        self.codes = np.stack(codes, axis=1).astype(np.int64)
+        self.cardinality = self.codes.max(axis=0) + 1 if self.n_rows > 0 else []
+
+        self._parents_cache: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _parents(self, parents: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """The joint histogram cell of each row, and the histogram, for a parent set."""
+        key = tuple(sorted(parents))
+        if key not in self._parents_cache:
+            cells = np.zeros(self.n_rows, dtype=np.int64)
+            for parent in sorted(parents):
+                idx = self.columns[parent]
+                # Keep the cell ids dense, to avoid overflows for large parent sets.
+                _, cells = np.unique(
+                    cells * self.cardinality[idx] + self.codes[:, idx],
+                    return_inverse=True,
+                )
+            self._parents_cache[key] = (cells, np.bincount(cells))
+
+        return self._parents_cache[key]
+
+    def _contingency(
+        self, cells: np.ndarray, n_cells: int, candidates: List[str]
+    ) -> np.ndarray:
+        """The contingency tables of the parent cells and each candidate, with shape (n_candidates, n_cells, n_bins)."""
+        idxs = [self.columns[candidate] for candidate in candidates]
+        n_bins = int(max(self.cardinality[idxs]))
+        table_size = n_cells * n_bins
+
+        if table_size * len(idxs) <= MAX_CONTINGENCY_CELLS:
+            offsets = np.arange(len(idxs), dtype=np.int64) * table_size
+            joint = (cells * n_bins)[:, None] + self.codes[:, idxs] + offsets
+            counts = np.bincount(joint.ravel(), minlength=table_size * len(idxs))
+            return counts.reshape(len(idxs), n_cells, n_bins)
+
+        return np.stack(
+            [
+                np.bincount(
+                    cells * n_bins + self.codes[:, idx], minlength=table_size
+                ).reshape(n_cells, n_bins)
+                for idx in idxs
+            ]
+        )
+
+    def scores(self, parents: List[str], candidates: List[str]) -> np.ndarray:
+        """The normalized mutual information between the parents and each candidate.
+
+        The normalization uses the arithmetic mean of the entropies, like `sklearn.metrics.normalized_mutual_info_score`.
+
+        Args:
+            parents: List[str]
+                The parent set.
+            candidates: List[str]
+                The candidate nodes.
+
+        Returns:
+            np.ndarray: The score of each candidate.
+        """
+        if len(candidates) == 0:
+            return np.zeros(0)
+        if len(parents) == 0:
+            return np.zeros(len(candidates))
+
+        cells, parent_counts = self._parents(parents)
+        contingency = self._contingency(cells, len(parent_counts), candidates)
+        candidate_counts = contingency.sum(axis=1)
+
+        n = self.n_rows
+        log_n = np.log(n)
+
+        def _entropy(counts: np.ndarray) -> np.ndarray:
+            p = counts / n
+            return -np.sum(p * np.log(np.where(counts > 0, p, 1)), axis=-1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            outer = parent_counts[None, :, None] * candidate_counts[:, None, :]
+            terms = np.where(
+                contingency > 0,
+                contingency / n * (np.log(contingency) - np.log(outer) + log_n),
+                0,
+            )
+        mi = np.clip(terms.sum(axis=(1, 2)), 0, None)
+
+        h_parents = _entropy(parent_counts)
+        h_candidates = _entropy(candidate_counts)
+        normalizer = (h_parents + h_candidates) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nmi = np.where(mi > 0, mi / normalizer, 0.0)
+
+        # A single cell for both the parents and the candidate is a perfect match.
+        n_candidate_values = (candidate_counts > 0).sum(axis=1)
+        nmi[(len(parent_counts) == 1) & (n_candidate_values == 1)] = 1.0
+
+        return nmi
+
+
 class PrivBayes(Serializable):
     """PrivBayes is a differentially private method for releasing high-dimensional data.
 
@@ -135,7 +258,7 @@ class PrivBayes(Serializable):
         log.info(f"[PrivBayes] network is valid = {self.network.check_model()}")
 
         # create the model
-        self.model = BayesianModelSampling(self.network)
+        self.sampler = BayesianNetworkSampler(self.network)
 
         log.info("[PrivBayes] done training")
         return self
@@ -143,7 +266,10 @@ class PrivBayes(Serializable):
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def sample(self, count: int) -> pd.DataFrame:
         log.debug(f"[PrivBayes] sample {count} examples")
-        samples = self.model.forward_sample(size=count, show_progress=True)
+        # the models serialized by the previous versions have no sampler
+        if getattr(self, "sampler", None) is None:
+            self.sampler = BayesianNetworkSampler(self.network)
+        samples = self.sampler.sample(count)
 
         log.debug(f"[PrivBayes] decode {count} examples")
         return self._decode(samples)
@@ -176,15 +302,19 @@ class PrivBayes(Serializable):
         for col in data.columns:
             if col not in self.encoders:
                 continue
-            inversed = self.encoders[col]["model"].inverse_transform(data[col])
             if self.encoders[col]["type"] == "categorical":
-                data[col] = inversed
+                data[col] = self.encoders[col]["model"].inverse_transform(data[col])
             elif self.encoders[col]["type"] == "continuous":
-                output = []
-                for interval in inversed:
-                    output.append(np.random.uniform(interval.left, interval.right))
-
-                data[col] = output
+                # uniform sample inside the interval of each code
+                intervals = self.encoders[col]["model"].classes_
+                left = np.asarray(
+                    [interval.left for interval in intervals], dtype=float
+                )
+                right = np.asarray(
+                    [interval.right for interval in intervals], dtype=float
+                )
+                codes = np.asarray(data[col], dtype=int)
+                data[col] = np.random.uniform(left[codes], right[codes])
             else:
                 raise RuntimeError(f"Invalid encoder {self.encoders[col]}")
 
@@ -205,6 +335,8 @@ class PrivBayes(Serializable):
         nodes = set(data.columns)
         nodes_selected = set()
 
+        mi_engine = ContingencyMutualInformation(data, self.n_bins)
+
         # Init network
         network = []
         root = np.random.choice(data.columns)
@@ -223,6 +355,13 @@ class PrivBayes(Serializable):
 
             num_parents = min(len(nodes_selected), self.K)
 
+            self._cache_mutual_information(
+                mi_engine,
+                candidates=nodes_remaining,
+                parent_candidates=nodes_selected,
+                parent_limit=num_parents,
+            )
+
             for candidate, split in product(
                 nodes_remaining, range(len(nodes_selected) - num_parents + 1)
             ):
@@ -402,11 +541,16 @@ class PrivBayes(Serializable):
             return distribution / summation
 
     def _calculate_sensitivity(
-        self, data: pd.DataFrame, child: str, parents: List[str]
+        self,
+        data: pd.DataFrame,
+        child: str,
+        parents: List[str],
+        attr_to_is_binary: Optional[dict] = None,
     ) -> float:
         """Sensitivity function for Bayesian network construction. PrivBayes Lemma 4.1"""
         num_tuples = len(data)
-        attr_to_is_binary = {attr: data[attr].unique().size <= 2 for attr in data}
+        if attr_to_is_binary is None:
+            attr_to_is_binary = (data.nunique() <= 2).to_dict()
 
         if attr_to_is_binary[child] or (
             len(parents) == 1 and attr_to_is_binary[parents[0]]
@@ -428,6 +572,28 @@ class PrivBayes(Serializable):
         num_attributes = len(data.columns)
         return (num_attributes - 1) * sensitivity / self.epsilon
 
+    def _cache_mutual_information(
+        self,
+        engine: ContingencyMutualInformation,
+        candidates: set,
+        parent_candidates: set,
+        parent_limit: int,
+    ) -> None:
+        """Score all the candidates against each parent set, and store the missing scores in the MI cache."""
+        for parents in combinations(sorted(parent_candidates), parent_limit):
+            parents_key = tuple(sorted(parents))
+            missing = [
+                candidate
+                for candidate in sorted(candidates)
+                if parents_key not in self.mi_cache.get(candidate, {})
+            ]
+            if len(missing) == 0:
+                continue
+
+            scores = engine.scores(list(parents), missing)
+            for candidate, score in zip(missing, scores):
+                self.mi_cache.setdefault(candidate, {})[parents_key] = float(score)
+
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _evaluate_parent_mutual_information(
         self,
@@ -451,7 +617,7 @@ class PrivBayes(Serializable):
 
         for other_parents in combinations(parent_candidates[split:], parent_limit):
             parents = list(other_parents)
-            parents_key = "_".join(sorted(parents))
+            parents_key = tuple(sorted(parents))
 
             if parents_key in self.mi_cache[candidate]:
                 score = self.mi_cache[candidate][parents_key]
@@ -468,19 +634,12 @@ class PrivBayes(Serializable):
     def mutual_info_score(
         self, data: pd.DataFrame, parents: List[str], candidate: str
     ) -> float:
-        """Cluster the source columns, and compute the mutual information between the target and the clusters."""
+        """Discretize the columns, and compute the normalized mutual information between the joint histogram of the parents and the candidate."""
         if len(parents) == 0:
             return 0
 
-        src = data[parents]
-        src_cluster = KMeans(n_clusters=10).fit(src)
-
-        src_bins = src_cluster.predict(src)
-        target = data[candidate]
-        target_bins, _ = pd.cut(target, bins=self.n_bins, retbins=True)
-        target_bins = LabelEncoder().fit_transform(target_bins)
-
-        return normalized_mutual_info_score(src_bins, target_bins)
+        engine = ContingencyMutualInformation(data[parents + [candidate]], self.n_bins)
+        return float(engine.scores(parents, [candidate])[0])
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _exponential_mechanism(
@@ -491,8 +650,11 @@ class PrivBayes(Serializable):
     ) -> List:
         """Applied in Exponential Mechanism to sample outcomes."""
         delta_array = []
+        attr_to_is_binary = (data.nunique() <= 2).to_dict()
         for (candidate, parents) in parents_pair_list:
-            sensitivity = self._calculate_sensitivity(data, candidate, parents)
+            sensitivity = self._calculate_sensitivity(
+                data, candidate, parents, attr_to_is_binary
+            )
             delta = self._calculate_delta(data, sensitivity)
             delta_array.append(delta)
 
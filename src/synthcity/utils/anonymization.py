@@ -1,8 +1,11 @@
 # stdlib
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 
 # third party
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from pydantic import validate_arguments
 from sklearn.preprocessing import LabelEncoder
 
@@ -11,13 +14,151 @@ from synthcity.metrics.eval_privacy import kAnonymization
 from synthcity.plugins.core.dataloader import GenericDataLoader
 
 
+class _MondrianEngine:
+    """NumPy implementation of the Mondrian partitioning used by DatasetAnonymization.
+
+    The columns are encoded once: the categorical features as integer codes, the numerical features as float arrays, and the sensitive column as integer codes. A partition is an array of row positions, in ascending order, and the spans, the median splits and the k-anonymity, l-diversity and t-closeness checks run on the encoded arrays, using vectorized counts.
+
+    Each partition is identified by its (depth, path) key in the partitioning tree, where path holds the left/right decisions as bits. The keys order the partitions like the breadth-first traversal, so independent subtrees can be processed separately and merged back in the same order.
+    """
+
+    def __init__(
+        self,
+        X: pd.DataFrame,
+        feature_columns: List,
+        sensitive_column: str,
+        categoricals: List,
+        k_threshold: int,
+        l_diversity: int,
+        t_threshold: float,
+    ) -> None:
+        self.k_threshold = k_threshold
+        self.l_diversity = l_diversity
+        self.t_threshold = t_threshold
+
+        self.is_categorical = []
+        self.values = []
+        scale = []
+        for column in feature_columns:
+            if column in categoricals:
+                codes, uniques = pd.factorize(X[column], use_na_sentinel=False)
+                self.values.append(codes.astype(np.int64))
+                scale.append(len(uniques))
+                self.is_categorical.append(True)
+            else:
+                values = X[column].to_numpy(dtype=float)
+                self.values.append(values)
+                scale.append(np.nanmax(values) - np.nanmin(values))
+                self.is_categorical.append(False)
+        self.scale = np.asarray(scale, dtype=float)
+
+        codes, uniques = pd.factorize(X[sensitive_column], use_na_sentinel=False)
+        self.sensitive = codes.astype(np.int64)
+        self.n_sensitive = len(uniques)
+        # the t-closeness is checked only for the categorical sensitive columns, and ignores the missing values
+        self.check_t_closeness = sensitive_column in categoricals
+        self.sensitive_valid = np.asarray(pd.notna(uniques))
+        self.sensitive_freqs = np.bincount(
+            self.sensitive, minlength=self.n_sensitive
+        ) / float(len(X))
+
+    def _spans(self, rows: np.ndarray) -> np.ndarray:
+        spans = np.zeros(len(self.values))
+        for idx, (values, is_categorical) in enumerate(
+            zip(self.values, self.is_categorical)
+        ):
+            part = values[rows]
+            if is_categorical:
+                spans[idx] = np.count_nonzero(np.bincount(part))
+            else:
+                spans[idx] = np.nanmax(part) - np.nanmin(part)
+
+        # constant columns cannot be split
+        return np.divide(
+            spans, self.scale, out=np.zeros_like(spans), where=self.scale > 0
+        )
+
+    def _split(self, rows: np.ndarray, idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        part = self.values[idx][rows]
+        if self.is_categorical[idx]:
+            # the first half of the categories, in the order of their first appearance in the partition
+            codes, first = np.unique(part, return_index=True)
+            codes = codes[np.argsort(first)]
+            is_left = np.zeros(codes.max() + 1, dtype=bool)
+            is_left[codes[: len(codes) // 2]] = True
+            left = is_left[part]
+            return rows[left], rows[~left]
+
+        median = np.nanmedian(part)
+        return rows[part < median], rows[part >= median]
+
+    def _is_valid(self, rows: np.ndarray) -> bool:
+        if len(rows) < self.k_threshold:
+            return False
+
+        counts = np.bincount(self.sensitive[rows], minlength=self.n_sensitive)
+        present = counts > 0
+        if np.count_nonzero(present) < self.l_diversity:
+            return False
+
+        if not self.check_t_closeness:
+            return True
+
+        present &= self.sensitive_valid
+        if not present.any():
+            return True
+
+        distance = np.abs(
+            counts[present] / (len(rows) + 1e-8) - self.sensitive_freqs[present]
+        )
+        return bool(distance.max() <= self.t_threshold)
+
+    def split(self, rows: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Split the partition along the widest feature which gives two valid partitions, if any."""
+        for idx in np.argsort(-self._spans(rows), kind="stable"):
+            left, right = self._split(rows, idx)
+            if self._is_valid(left) and self._is_valid(right):
+                return left, right
+
+        return None
+
+    def run(
+        self, queue: deque, max_pending: Optional[int] = None
+    ) -> List[Tuple[Tuple[int, int], np.ndarray]]:
+        """Process the (key, rows) partitions from the queue, until it is empty or it holds more than <max_pending> partitions.
+
+        Returns the (key, rows) final partitions.
+        """
+        finished = []
+        while queue and (max_pending is None or len(queue) <= max_pending):
+            (depth, path), rows = queue.popleft()
+            children = self.split(rows)
+            if children is None:
+                finished.append(((depth, path), rows))
+                continue
+
+            left, right = children
+            queue.append(((depth + 1, 2 * path), left))
+            queue.append(((depth + 1, 2 * path + 1), right))
+
+        return finished
+
+
+def _mondrian_subtree(
+    engine: _MondrianEngine, key: Tuple[int, int], rows: np.ndarray
+) -> List[Tuple[Tuple[int, int], np.ndarray]]:
+    return engine.run(deque([(key, rows)]))
+
+
 class DatasetAnonymization:
     """Dataset Anonymization helper based on the k-Anonymization, l-Diversity and t-Closeness methods.
 
     k-Anonymity states that every individual in one dataset partition is indistinguishable from at least k - 1 other individuals.
     l-Diversity uses a stronger privacy definition and claims that every generalized block has to contain at least l different sensitive values.
     An equivalence class is said to have t-closeness if the distance between the distribution of a sensitive attribute in this class and the distribution of the attribute in the whole table is no more than a threshold t. A table is said to have t-closeness if all equivalence classes have t-closeness.
-    For that, we measure the Kolmogorov-Smirnov distance between the empirical probability distribution of the sensitive attribute over the entire dataset vs. the distribution over the partition."""
+    For that, we measure the Kolmogorov-Smirnov distance between the empirical probability distribution of the sensitive attribute over the entire dataset vs. the distribution over the partition.
+
+    The partitioning runs on the NumPy encoded dataset. With n_jobs != 1(-1 uses all the CPUs), the partitioning tree is expanded until there are enough pending partitions, and the remaining subtrees are processed in parallel worker processes."""
 
     @validate_arguments
     def __init__(
@@ -27,6 +168,7 @@ class DatasetAnonymization:
         t_threshold: float = 0.2,
         categorical_limit: int = 5,
         max_partitions: Optional[int] = None,
+        n_jobs: int = 1,
     ) -> None:
         if k_threshold < 1:
             raise ValueError(
@@ -46,6 +188,7 @@ class DatasetAnonymization:
 
         self.categorical_limit = categorical_limit
         self.max_partitions = max_partitions
+        self.n_jobs = n_jobs
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def is_anonymous(self, X: pd.DataFrame, sensitive_features: List[str] = []) -> bool:
@@ -107,65 +250,30 @@ class DatasetAnonymization:
         X, encoders = self._setup(X)
         features = self._get_features(X, [sensitive_column])
 
-        partitions = self._partition_dataset(X, features, sensitive_column)
-
-        def agg_categorical_column(series: pd.Series) -> list:
-            # TODO
-            return [series.mean()]
-
-        def agg_numerical_column(series: pd.Series) -> list:
-            return [series.mean()]
-
-        categoricals = self._get_categoricals(X)
+        partitions = self._partition_rows(X, features, sensitive_column)
+        if self.max_partitions is not None:
+            partitions = partitions[: self.max_partitions + 1]
 
-        rows = []
-        for i, partition in enumerate(partitions):
-            if self.max_partitions is not None and i > self.max_partitions:
-                break
-
-            X_part = X.loc[partition]
-
-            X_part_cat = X_part[[c for c in X_part.columns if c in categoricals]]
-            X_part_num = X_part[[c for c in X_part.columns if c not in categoricals]]
-
-            num_agg = X_part_num.agg(agg_numerical_column)
-            cat_agg = X_part_cat.agg(agg_categorical_column)
-
-            aggregations = []
-
-            if len(num_agg) > 0:
-                aggregations.append(num_agg)
-            if len(cat_agg) > 0:
-                aggregations.append(cat_agg)
-
-            grouped_columns = pd.concat(
-                aggregations,
-                axis=1,
-            )
+        if len(partitions) == 0:
+            return self._tear_down(pd.DataFrame([]), encoders)
 
-            if set(grouped_columns.columns) != set(X_part.columns):
-                raise RuntimeError(
-                    f"Invalid columns {set(grouped_columns.columns)} != {set(X_part.columns)}"
-                )
-            grouped_columns = grouped_columns[X_part.columns]
+        positions = np.concatenate(partitions)
+        partition_ids = np.repeat(
+            np.arange(len(partitions)), [len(rows) for rows in partitions]
+        )
+        X_parts = X.iloc[positions]
 
-            sensitive_counts = X_part.groupby(sensitive_column).agg(
-                {sensitive_column: "count"}
-            )
-            values = grouped_columns.iloc[0].to_dict()
+        # Each row is replaced by the means of its partition, and the rows are sorted by the sensitive value within each partition.
+        means = X_parts.groupby(partition_ids).mean()[X.columns].to_numpy()
 
-            for sensitive_value, count in sensitive_counts[sensitive_column].items():
-                if count == 0:
-                    continue
-                values.update(
-                    {
-                        sensitive_column: sensitive_value,
-                    }
-                )
-                for cnt in range(count):
-                    rows.append(values.copy())
+        sensitive = X_parts[sensitive_column].to_numpy()
+        observed = np.asarray(pd.notna(sensitive))
+        sensitive = sensitive[observed]
+        partition_ids = partition_ids[observed]
+        order = np.lexsort((sensitive, partition_ids))
 
-        result = pd.DataFrame(rows)
+        result = pd.DataFrame(means[partition_ids[order]], columns=X.columns)
+        result[sensitive_column] = sensitive[order]
 
         return self._tear_down(result, encoders)
 
@@ -233,29 +341,43 @@ class DatasetAnonymization:
         sensitive_column: str,
     ) -> List:
         """Learn a list of valid partitions that covers the entire dataframe."""
-        finished_partitions = []
-        partitions = [X.index]
-
-        scale = self._get_spans(X, X.index)
-        categoricals = self._get_categoricals(X)
-        freqs = self._get_frequencies(X, sensitive_column)
-
-        while partitions:
-            partition = partitions.pop(0)
-            spans = self._get_spans(X[feature_columns], partition, scale)
-            for column, span in sorted(spans.items(), key=lambda x: -x[1]):
-                lp, rp = self._split(X, partition, column, categoricals)
-                if not self._is_partition_anonymous(
-                    X, lp, sensitive_column, freqs, categoricals
-                ) or not self._is_partition_anonymous(
-                    X, rp, sensitive_column, freqs, categoricals
-                ):
-                    continue
-                partitions.extend((lp, rp))
-                break
-            else:
-                finished_partitions.append(partition)
-        return finished_partitions
+        return [
+            X.index[rows]
+            for rows in self._partition_rows(X, feature_columns, sensitive_column)
+        ]
+
+    def _partition_rows(
+        self,
+        X: pd.DataFrame,
+        feature_columns: List,
+        sensitive_column: str,
+    ) -> List[np.ndarray]:
+        """Learn the partitions, as arrays of row positions."""
+        engine = _MondrianEngine(
+            X,
+            feature_columns,
+            sensitive_column,
+            self._get_categoricals(X),
+            k_threshold=self.k_threshold,
+            l_diversity=self.l_diversity,
+            t_threshold=self.t_threshold,
+        )
+
+        queue: deque = deque([((0, 0), np.arange(len(X)))])
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            finished = engine.run(queue)
+        else:
+            # expand the top of the tree, then dispatch the pending subtrees to the workers
+            finished = engine.run(queue, max_pending=4 * n_jobs)
+            for subtree in Parallel(n_jobs=n_jobs)(
+                delayed(_mondrian_subtree)(engine, key, rows) for key, rows in queue
+            ):
+                finished.extend(subtree)
+
+        finished.sort(key=lambda item: item[0])
+
+        return [rows for _, rows in finished]
 
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _get_frequencies(self, X: pd.DataFrame, sensitive_column: str) -> Dict:
@@ -162,12 +162,31 @@ class EarlyStopping(Callback):
 
 
 class OptunaPruning(Callback):
+    """Report the intermediate validation scores of a model to an Optuna trial.
+
+    The scores are reported only for the epochs where the model was evaluated, and the trial is stopped with `optuna.TrialPruned` if the study pruner decides so.
+    Used by multi-fidelity searches, with pruners such as successive halving or Hyperband.
+    """
+
     def __init__(self, trial: optuna.Trial) -> None:
         self.trial = trial
         self._steps = 0
 
-    def on_epoch_end(self, model: ValidationMixin) -> None:
-        self.trial.report(model.valid_score, self._steps)
+    def on_fit_begin(self, model: Any) -> None:
+        pass
+
+    def on_fit_end(self, model: Any) -> None:
+        pass
+
+    def on_epoch_begin(self, model: Any) -> None:
+        pass
+
+    def on_epoch_end(self, model: Any) -> None:
+        score = getattr(model, "valid_score", None)
+        if score is None:
+            return
+
+        self.trial.report(float(score), self._steps)
+        self._steps += 1
         if self.trial.should_prune():
             raise optuna.TrialPruned()
-        self._steps += 1
@@ -1,14 +1,65 @@
 # stdlib
-from typing import Dict, List
+import copy
+from typing import Any, Dict, List, Optional
 
 # third party
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from pydantic import validate_arguments
+from sklearn.metrics import r2_score, roc_auc_score
+from sklearn.model_selection import KFold, StratifiedKFold
 from sklearn.preprocessing import LabelEncoder
 from xgboost import XGBClassifier, XGBRegressor
 
-# synthcity relative
-from .evaluation import evaluate_classifier, evaluate_regression
+
+def _column_model(is_categorical: bool, n_jobs: int) -> Any:
+    if is_categorical:
+        return XGBClassifier(
+            tree_method="approx",
+            n_jobs=n_jobs,
+            verbosity=0,
+            depth=3,
+        )
+
+    return XGBRegressor(n_jobs=n_jobs)
+
+
+def _redundancy_score(
+    model: Any,
+    X: pd.DataFrame,
+    y: pd.Series,
+    is_categorical: bool,
+    score_threshold: float,
+    n_folds: int = 3,
+    seed: int = 0,
+) -> float:
+    """Cross-validated AUCROC(classification) or R^2(regression) of the model predicting y from X, using the folds of evaluate_classifier/evaluate_regression.
+
+    The scores are at most 1, so the evaluation stops as soon as the remaining folds cannot bring the mean score to <score_threshold>. Returns -inf if the model cannot be evaluated.
+    """
+    if is_categorical:
+        folds = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=seed)
+        metric = roc_auc_score
+    else:
+        folds = KFold(n_splits=n_folds, shuffle=True, random_state=seed)
+        metric = r2_score
+
+    try:
+        scores = []
+        for train_index, test_index in folds.split(X, y):
+            fold_model = copy.deepcopy(model)
+            fold_model.fit(X.iloc[train_index], y.iloc[train_index])
+            scores.append(
+                metric(y.iloc[test_index], fold_model.predict(X.iloc[test_index]))
+            )
+
+            if sum(scores) + n_folds - len(scores) < score_threshold * n_folds:
+                break
+    except BaseException:
+        return -np.inf
+
+    return float(np.mean(scores)) if len(scores) == n_folds else -np.inf
 
 
 @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -17,7 +68,28 @@ def compress_dataset(
     cat_limit: int = 10,
     impute: bool = True,
     score_threshold: float = 0.98,
+    n_jobs: int = -1,
+    n_samples: Optional[int] = 10000,
+    random_state: int = 0,
 ) -> pd.DataFrame:
+    """Drop the columns which can be predicted from the other columns, and merge the groups of low cardinality categorical columns.
+
+    Args:
+        df: pd.DataFrame
+            The dataset to compress.
+        cat_limit: int
+            The maximum number of unique values of a categorical column.
+        impute: bool
+            Fill the missing values with 0.
+        score_threshold: float
+            The minimum cross-validated AUCROC/R^2 of a column model, for the column to be redundant.
+        n_jobs: int
+            The CPU budget of the column models, shared between the parallel evaluations and the XGBoost threads. -1 uses all the CPUs.
+        n_samples: Optional[int]
+            The number of rows used for evaluating the column models. None uses all the rows. The models of the redundant columns are fitted on all the rows.
+        random_state: int
+            The seed of the rows subsample.
+    """
     df = df.copy()
     original_dtypes = df.infer_objects().dtypes
 
@@ -39,42 +111,69 @@ def compress_dataset(
         df[col] = encoders[col].transform(df[col])
 
     # compress
+    is_categorical = {
+        column: len(df[column].unique()) < cat_limit for column in covariates
+    }
+
+    sample = df
+    if n_samples is not None and len(df) > n_samples:
+        rows = np.random.default_rng(random_state).choice(
+            len(df), n_samples, replace=False
+        )
+        sample = df.iloc[np.sort(rows)]
+
+    # Screen all the columns against all the other columns, in parallel under the CPU budget.
+    # A column which is not redundant given all the other columns is not redundant given a subset of them.
+    n_cpus = effective_n_jobs(n_jobs)
+    n_workers = max(1, min(n_cpus, len(covariates)))
+    n_threads = max(1, n_cpus // n_workers)
+
+    tasks = [
+        delayed(_redundancy_score)(
+            _column_model(is_categorical[column], n_threads),
+            sample.drop(columns=[column]),
+            sample[column],
+            is_categorical[column],
+            score_threshold,
+        )
+        for column in covariates
+    ]
+    if n_workers == 1:
+        scores = [fn(*args, **kwargs) for fn, args, kwargs in tasks]
+    else:
+        scores = Parallel(n_jobs=n_workers, prefer="threads")(tasks)
+
     compressers = {}
-    for column in covariates:
-        X = df[covariates].drop(columns=redundant + [column])
-        y = df[column]
+    for column, score in zip(covariates, scores):
+        if score < score_threshold:
+            continue
 
-        if len(df[column].unique()) < cat_limit:
-            model = model = XGBClassifier(
-                tree_method="approx",
-                n_jobs=2,
-                verbosity=0,
-                depth=3,
+        # the screening included the columns marked as redundant since
+        if len(redundant) > 0:
+            score = _redundancy_score(
+                _column_model(is_categorical[column], n_cpus),
+                sample.drop(columns=redundant + [column]),
+                sample[column],
+                is_categorical[column],
+                score_threshold,
             )
-            try:
-                score = evaluate_classifier(model, X, y)["clf"]["aucroc"][0]
-            except BaseException:
+            if score < score_threshold:
                 continue
 
-        else:
-            model = XGBRegressor()
+        X = df[covariates].drop(columns=redundant + [column])
+        y = df[column]
 
-            try:
-                score = evaluate_regression(model, X, y)["clf"]["r2"][0]
-            except BaseException:
-                continue
+        redundant.append(column)
+        model = _column_model(is_categorical[column], n_cpus)
+        model.fit(X, y)
 
-        if score >= score_threshold:
-            redundant.append(column)
-            model.fit(X, y)
-
-            src_cols = X.columns
-            compressers[column] = {
-                "cols": list(src_cols),
-                "model": model,
-                "min": y.min(),
-                "max": y.max(),
-            }
+        src_cols = X.columns
+        compressers[column] = {
+            "cols": list(src_cols),
+            "model": model,
+            "min": y.min(),
+            "max": y.max(),
+        }
     df = df.drop(columns=redundant)
     covariates = df.columns
 
@@ -82,31 +181,41 @@ def compress_dataset(
     compressers_categoricals = {}
     categoricals: List[List[str]] = [[]]
 
+    # the values of the current group, packed in a single integer code
+    group_codes = np.zeros(len(df), dtype=np.int64)
     for column in covariates:
         if len(df[column].unique()) > cat_limit:
             continue
 
         categoricals[-1].append(column)
 
-        if len(df[categoricals[-1]].drop_duplicates()) >= cat_limit:
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        group_codes, group_uniques = pd.factorize(group_codes * len(uniques) + codes)
+
+        if len(group_uniques) >= cat_limit:
             categoricals.append([])
+            group_codes = np.zeros(len(df), dtype=np.int64)
 
     for cats in categoricals:
         if len(cats) <= 1:
             continue
         cat_types = df[cats].infer_objects().dtypes
 
-        aggr = df[cats].astype(str).agg(" ".join, 1)
+        # the group values are encoded as the lexicographic rank of their tuples
+        encoded = np.zeros(len(df), dtype=np.int64)
+        for col in cats:
+            codes, uniques = pd.factorize(df[col], sort=True, use_na_sentinel=False)
+            encoded = pd.factorize(encoded * len(uniques) + codes, sort=True)[0]
+
+        values = df[cats].groupby(encoded).first().reset_index(drop=True)
 
-        encoder = LabelEncoder().fit(aggr)
-        encoded = encoder.transform(aggr)
         encoded_col = " ".join(cats)
         df[encoded_col] = encoded
         df = df.drop(columns=cats)
 
         compressers_categoricals[encoded_col] = {
             "cols": cats,
-            "model": encoder,
+            "model": values,
             "types": cat_types,
         }
 
@@ -144,15 +253,24 @@ def decompress_dataset(
         src_cols = context["compressers_categoricals"][cat_group]["cols"]
         dtypes = context["compressers_categoricals"][cat_group]["types"]
 
-        df[cat_group] = encoder.inverse_transform(df[cat_group])
-        decoded = df[cat_group].str.split(" ", n=-1, expand=True)
+        if isinstance(encoder, LabelEncoder):
+            # contexts created by the previous versions, encoding the joined strings
+            df[cat_group] = encoder.inverse_transform(df[cat_group])
+            decoded = df[cat_group].str.split(" ", n=-1, expand=True)
 
-        if decoded.shape[1] != len(src_cols):
-            raise ValueError(
-                f"Invalid decoding shape {decoded.shape} expected {len(src_cols)}"
-            )
+            if decoded.shape[1] != len(src_cols):
+                raise ValueError(
+                    f"Invalid decoding shape {decoded.shape} expected {len(src_cols)}"
+                )
+
+            df[src_cols] = decoded.astype(dtypes.reset_index(drop=True))
+        else:
+            codes = np.asarray(df[cat_group], dtype=np.int64)
+            if ((codes < 0) | (codes >= len(encoder))).any():
+                raise ValueError(f"Invalid codes for the categories {cat_group}")
 
-        df[src_cols] = decoded.astype(dtypes.reset_index(drop=True))
+            decoded = encoder.iloc[codes]
+            df[src_cols] = decoded.set_index(df.index).astype(dtypes)
         df = df.drop(columns=[cat_group])
 
     # decompress redundant
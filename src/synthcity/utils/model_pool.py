@@ -0,0 +1,334 @@
+# stdlib
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+# synthcity absolute
+import synthcity.logger as log
+from synthcity.utils.serialization import DIR_METADATA_FILE, load, load_from_dir
+
+
+def model_fingerprint(path: Union[str, Path]) -> str:
+    """Cheap fingerprint of a persisted model, based on the size and the modification time of its files.
+
+    Args:
+        path: A model file(`save`/`save_to_file`) or a model directory(`save_to_dir`).
+
+    Returns:
+        str: The hex digest of the fingerprint.
+    """
+    path = Path(path)
+    files = sorted(path.iterdir()) if path.is_dir() else [path]
+
+    digest = hashlib.sha256()
+    for fpath in files:
+        stat = fpath.stat()
+        digest.update(f"{fpath.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+    return digest.hexdigest()
+
+
+def model_disk_size(path: Union[str, Path]) -> int:
+    """The size in bytes of a persisted model, used as an estimate of its memory footprint."""
+    path = Path(path)
+    if path.is_dir():
+        return sum(fpath.stat().st_size for fpath in path.iterdir() if fpath.is_file())
+
+    return path.stat().st_size
+
+
+def load_model(
+    path: Union[str, Path],
+    custom_model: Optional[Callable[[], Any]] = None,
+    mmap: bool = True,
+) -> Any:
+    """Load a persisted model, regardless of the persistence format.
+
+    Args:
+        path: A model directory created by `save_to_dir`, or a file containing the output of `save`/`save_to_file`.
+        custom_model: Optional factory for the instance to restore the model into. Required for the checkpoints of the plugins from `serialization.unloadable_plugins`(for example, `dpgan`) saved with `save`. The directories created by `save_to_dir` don't need it.
+        mmap: Memory-map the tensors of the model directories.
+
+    Returns:
+        The loaded model.
+    """
+    path = Path(path)
+    if path.is_dir() and (path / DIR_METADATA_FILE).exists():
+        return load_from_dir(path, mmap=mmap)
+
+    with open(path, "rb") as f:
+        buff = f.read()
+
+    if custom_model is not None:
+        return load(buff, custom_model())
+
+    model = load(buff)
+    if isinstance(model, dict) and "custom_model_state" in model:
+        raise ValueError(
+            f"{path} is a checkpoint of a plugin which is not loadable with cloudpickle. Provide the custom_model factory, or persist the plugin using save_to_dir"
+        )
+
+    return model
+
+
+class _PoolEntry:
+    def __init__(self, key: Tuple[str, str], model: Any, size: int) -> None:
+        self.key = key
+        self.model = model
+        self.size = size
+        # Serializes the calls on the same model: the plugins and the torch modules are not reentrant.
+        self.lock = threading.Lock()
+
+
+class GeneratorPool:
+    """In-process pool of fitted generators, for serving synthetic data requests against many persisted models.
+
+    The models are keyed by their path and hash, loaded on the first request, and kept warm for the following ones. The least recently used models are evicted when the pool exceeds its memory budget or its maximum number of models.
+
+    The pool is thread-safe: concurrent requests for the same model trigger a single load, and the `generate` calls on the same model are serialized, while different models can generate in parallel.
+
+    Args:
+        memory_budget: Optional[int]
+            The memory budget of the pool, in bytes. The footprint of a model is estimated by its size on disk. If None, the memory is not bounded.
+        max_models: Optional[int]
+            The maximum number of models kept in the pool. If None, the number of models is not bounded.
+        mmap: bool
+            Memory-map the tensors of the models persisted with `save_to_dir`.
+
+    Example:
+        >>> pool = GeneratorPool(memory_budget=2 * 1024 ** 3)
+        >>> pool.preload(["models/adsgan", "models/dpgan"])
+        >>> pool.generate("models/adsgan", count=100).dataframe()
+        >>> pool.stats()
+    """
+
+    def __init__(
+        self,
+        memory_budget: Optional[int] = None,
+        max_models: Optional[int] = None,
+        mmap: bool = True,
+    ) -> None:
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError(f"Invalid memory budget {memory_budget}")
+        if max_models is not None and max_models <= 0:
+            raise ValueError(f"Invalid max_models {max_models}")
+
+        self.memory_budget = memory_budget
+        self.max_models = max_models
+        self.mmap = mmap
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], _PoolEntry]" = OrderedDict()
+        self._loading: Dict[Tuple[str, str], threading.Lock] = {}
+        self._memory = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_time = 0.0
+
+    def _key(
+        self, path: Union[str, Path], model_hash: Optional[str]
+    ) -> Tuple[str, str]:
+        path = Path(path).resolve()
+        if model_hash is None:
+            model_hash = model_fingerprint(path)
+
+        return (str(path), model_hash)
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[_PoolEntry]:
+        # Must be called with the pool lock held.
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        # Must be called with the pool lock held.
+        entry = self._entries.pop(key)
+        self._memory -= entry.size
+
+    def _insert(self, entry: _PoolEntry) -> None:
+        # Must be called with the pool lock held.
+        for key in list(self._entries):
+            # A newer version of the same model replaces the stale one.
+            if key[0] == entry.key[0] and key != entry.key:
+                log.debug(f"[pool] dropping stale model {key}")
+                self._remove(key)
+
+        self._entries[entry.key] = entry
+        self._memory += entry.size
+
+        while len(self._entries) > 1 and (
+            (self.memory_budget is not None and self._memory > self.memory_budget)
+            or (self.max_models is not None and len(self._entries) > self.max_models)
+        ):
+            lru_key = next(iter(self._entries))
+            log.debug(f"[pool] evicting model {lru_key}")
+            self._remove(lru_key)
+            self._evictions += 1
+
+        if self.memory_budget is not None and self._memory > self.memory_budget:
+            log.warning(
+                f"[pool] model {entry.key[0]} of {entry.size} bytes exceeds the memory budget {self.memory_budget}"
+            )
+
+    def _get_entry(
+        self,
+        path: Union[str, Path],
+        model_hash: Optional[str] = None,
+        custom_model: Optional[Callable[[], Any]] = None,
+    ) -> _PoolEntry:
+        key = self._key(path, model_hash)
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self._hits += 1
+                return entry
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given model, the others wait for it.
+        with load_lock:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    self._hits += 1
+                    return entry
+
+            try:
+                start = time.perf_counter()
+                model = load_model(key[0], custom_model=custom_model, mmap=self.mmap)
+                duration = time.perf_counter() - start
+
+                entry = _PoolEntry(key, model, model_disk_size(key[0]))
+
+                with self._lock:
+                    self._misses += 1
+                    self._load_time += duration
+                    self._insert(entry)
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+        log.debug(f"[pool] loaded model {key[0]} in {duration:.3f} seconds")
+        return entry
+
+    def get(
+        self,
+        path: Union[str, Path],
+        model_hash: Optional[str] = None,
+        custom_model: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Get a model from the pool, loading it if necessary.
+
+        The returned model is shared between the users of the pool. Use `generate` for thread-safe sampling.
+
+        Args:
+            path: Union[str, Path]
+                A model directory created by `save_to_dir`, or a file containing the output of `save`/`save_to_file`.
+            model_hash: Optional[str]
+                The hash of the model, for example from a model registry. If None, a fingerprint of the files is used, so an updated model is reloaded.
+            custom_model: Optional[Callable]
+                Factory for the instance to restore the model into, required for the `save` checkpoints of the plugins from `serialization.unloadable_plugins`.
+
+        Returns:
+            The loaded model.
+        """
+        return self._get_entry(path, model_hash, custom_model).model
+
+    def generate(
+        self,
+        path: Union[str, Path],
+        count: Optional[int] = None,
+        model_hash: Optional[str] = None,
+        custom_model: Optional[Callable[[], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Generate synthetic data using a model from the pool.
+
+        The calls on the same model are serialized, the calls on different models run concurrently.
+
+        Args:
+            path: Union[str, Path]
+                The model path, see `get`.
+            count: Optional[int]
+                The number of samples to generate.
+            model_hash: Optional[str]
+                The hash of the model, see `get`.
+            custom_model: Optional[Callable]
+                The model factory, see `get`.
+            kwargs: Any
+                Forwarded to the `generate` method of the model.
+
+        Returns:
+            The output of the `generate` method of the model.
+        """
+        entry = self._get_entry(path, model_hash, custom_model)
+
+        with entry.lock:
+            return entry.model.generate(count=count, **kwargs)
+
+    def preload(
+        self,
+        paths: Iterable[Union[str, Path]],
+        custom_model: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Load a list of models in the pool, before serving the requests.
+
+        Args:
+            paths: Iterable
+                The model paths, see `get`.
+            custom_model: Optional[Callable]
+                The model factory, see `get`.
+        """
+        for path in paths:
+            self._get_entry(path, custom_model=custom_model)
+
+    def evict(self, path: Union[str, Path]) -> None:
+        """Remove all the versions of a model from the pool."""
+        path = str(Path(path).resolve())
+
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == path:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all the models from the pool."""
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        path = str(Path(path).resolve())
+
+        with self._lock:
+            return any(key[0] == path for key in self._entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> dict:
+        """The usage statistics of the pool.
+
+        Returns:
+            dict with the number of hits, misses and evictions, the hit rate, the number of loaded models, their estimated memory footprint in bytes and the total loading time in seconds.
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / requests if requests > 0 else 0.0,
+                "models": len(self._entries),
+                "memory": self._memory,
+                "memory_budget": self.memory_budget,
+                "load_time": self._load_time,
+            }
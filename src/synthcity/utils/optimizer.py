@@ -1,4 +1,5 @@
 # stdlib
+import inspect
 from pathlib import Path
 from typing import Any, Optional, Tuple, Type
 
@@ -19,6 +20,41 @@ from synthcity.utils.serialization import (
 
 threshold = 10
 
+multi_fidelity_pruners = ["successive_halving", "hyperband"]
+
+
+def create_multi_fidelity_pruner(
+    name: str,
+    reduction_factor: int = 3,
+) -> optuna.pruners.BasePruner:
+    """Helper for creating the Optuna pruner used by multi-fidelity searches.
+
+    The pruner consumes the intermediate validation scores reported by the training loops through the `OptunaPruning` callback, and stops the unpromising trials after a fraction of their budget.
+
+    Args:
+        name: str
+            successive_halving/hyperband
+        reduction_factor: int
+            The fraction of trials promoted to the next rung is 1 / reduction_factor.
+    """
+    if name == "successive_halving":
+        return optuna.pruners.SuccessiveHalvingPruner(
+            min_resource="auto", reduction_factor=reduction_factor
+        )
+    elif name == "hyperband":
+        return optuna.pruners.HyperbandPruner(
+            min_resource=1, max_resource="auto", reduction_factor=reduction_factor
+        )
+
+    raise ValueError(
+        f"Unknown multi-fidelity pruner {name}. Available: {multi_fidelity_pruners}"
+    )
+
+
+def supports_training_callbacks(model_template: Type) -> bool:
+    """Check if a plugin accepts training callbacks, and thus can report intermediate scores."""
+    return "callbacks" in inspect.signature(model_template.__init__).parameters
+
 
 def search_parameters(
     model_template: Type,
@@ -31,7 +67,34 @@ def search_parameters(
     dry_run: bool = False,
     workspace: Path = Path("workspace"),
     predefined_params: dict = {},
+    multi_fidelity: Optional[str] = None,
 ) -> Optional[dict]:
+    """Search the hyperparameters of a plugin with Optuna, using the detection score as objective.
+
+    Args:
+        model_template: Type
+            The plugin class to optimize.
+        X: pd.DataFrame
+            The reference dataset.
+        n_trials: int
+            Maximum number of trials.
+        timeout: int
+            Maximum search duration, in seconds.
+        n_iter_min: int
+            The number of training iterations used for each trial.
+        random_state: int
+            Random seed.
+        fail_score: int
+            The score used for the failed trials.
+        dry_run: bool
+            If True, return the best cached trial without running a new search.
+        workspace: Path
+            Path for caching intermediary results.
+        predefined_params: dict
+            Fixed plugin arguments, not included in the search.
+        multi_fidelity: Optional[str]
+            None, "successive_halving" or "hyperband". If set, the plugins which accept training callbacks report their intermediate validation scores to the trial, and the bad configurations are stopped early by the selected pruner. The plugins without callbacks support are trained with the full budget.
+    """
     direction = "minimize"
     metric = "detection_mlp"
 
@@ -42,18 +105,40 @@ def search_parameters(
 
     experiment_name = dataframe_cols_hash(X)
     study_name = f"hpo_tl_{model_template.name()}_{experiment_name}_metric_{metric}"
+    trial_pruner = None
+    if multi_fidelity is not None:
+        trial_pruner = create_multi_fidelity_pruner(multi_fidelity)
+        if not supports_training_callbacks(model_template):
+            log.info(
+                f"[HPO] {model_template.name()} doesn't report intermediate scores. Multi-fidelity pruning disabled"
+            )
+
     study, pruner = create_study(
         study_name=study_name,
         direction=direction,
+        pruner=trial_pruner,
     )
 
-    def evaluate_args(**kwargs: Any) -> float:
+    def evaluate_args(trial: Optional[optuna.Trial] = None, **kwargs: Any) -> float:
         kwargs["random_state"] = random_state
         kwargs["n_iter"] = n_iter_min
 
         for key in predefined_params:
             kwargs[key] = predefined_params[key]
 
+        if (
+            trial is not None
+            and multi_fidelity is not None
+            and supports_training_callbacks(model_template)
+        ):
+            # imported here to avoid a circular import with synthcity.metrics
+            # synthcity absolute
+            from synthcity.utils.callbacks import OptunaPruning
+
+            kwargs["callbacks"] = list(kwargs.get("callbacks", [])) + [
+                OptunaPruning(trial)
+            ]
+
         model = model_template(**kwargs)
         log.info(f"[HPO] Evaluate {model_template.name()} for {kwargs}")
 
@@ -61,6 +146,9 @@ def search_parameters(
             model.fit(X_target_train)
 
             X_fake = model.generate(len(X_target_test))
+        except optuna.TrialPruned:
+            log.info(f"[HPO] Trial {kwargs} pruned")
+            raise
         except BaseException:
             return fail_score
 
@@ -97,12 +185,11 @@ def search_parameters(
         args = model_template.sample_hyperparameters_optuna(trial)
         pruner.check_trial(trial)
 
-        score = evaluate_args(**args)
+        score = evaluate_args(trial, **args)
         pruner.report_score(score)
 
         return score
 
-    study.optimize(objective, n_trials=n_trials, timeout=timeout)
     try:
         study.optimize(objective, n_trials=n_trials, timeout=timeout)
     except EarlyStoppingExceeded:
@@ -189,6 +276,7 @@ def create_study(
     load_if_exists: bool = True,
     storage_type: str = "redis",
     patience: int = threshold,
+    pruner: Optional[optuna.pruners.BasePruner] = None,
 ) -> Tuple[optuna.Study, ParamRepeatPruner]:
     """Helper for creating a new study.
 
@@ -203,6 +291,8 @@ def create_study(
             redis/none
         patience: int
             How many trials without improvement to accept.
+        pruner: Optional[optuna.pruners.BasePruner]
+            Optional Optuna pruner for the intermediate trial scores, for example from `create_multi_fidelity_pruner`.
 
     """
 
@@ -221,12 +311,14 @@ def create_study(
             study_name=study_name,
             storage=storage_obj,
             load_if_exists=load_if_exists,
+            pruner=pruner,
         )
     except BaseException as e:
         log.debug(f"create_study failed {e}")
         study = optuna.create_study(
             direction=direction,
             study_name=study_name,
+            pruner=pruner,
         )
 
     return study, ParamRepeatPruner(study, patience=patience)
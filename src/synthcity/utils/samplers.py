@@ -102,10 +102,8 @@ class ConditionalDatasetSampler(BaseSampler):
         self._train_idx, self._test_idx = train_test_split(
             indices, train_size=train_size
         )
-        self._train_mapping = {
-            old_idx: new_idx for new_idx, old_idx in enumerate(self._train_idx)
-        }
         self._num_items = len(indices)
+        self._train_mapping = self._position_mapping(self._train_idx)
 
         self._internal_setup(data, output_info)
 
@@ -178,7 +176,7 @@ class ConditionalDatasetSampler(BaseSampler):
         self,
         cat_feats: np.ndarray,
         cat_values: np.ndarray,
-    ) -> List[int]:
+    ) -> np.ndarray:
         """Sample data from original training data satisfying the sampled conditional vector.
 
         Returns:
@@ -187,11 +185,17 @@ class ConditionalDatasetSampler(BaseSampler):
         if len(cat_values) != len(cat_feats):
             raise ValueError(f"Invalid categorical features {cat_values}")
 
-        idx = []
-        for c, o in zip(cat_feats, cat_values):
-            idx.append(np.random.choice(self._categorical_value_to_row_[c][o]))
+        category_id = self._categorical_feat_offset[np.asarray(cat_feats, dtype=int)]
+        category_id = category_id + np.asarray(cat_values, dtype=int)
+
+        start = self._category_row_ptr[category_id]
+        counts = self._category_row_ptr[category_id + 1] - start
+        if np.any(counts == 0):
+            raise ValueError("Cannot sample rows for an empty category")
 
-        return idx
+        offset = (np.random.random_sample(len(category_id)) * counts).astype(int)
+
+        return self._category_rows[start + np.minimum(offset, counts - 1)]
 
     def conditional_dimension(self) -> int:
         """Return the total number of categories."""
@@ -203,8 +207,7 @@ class ConditionalDatasetSampler(BaseSampler):
     def __iter__(self) -> Generator:
         np.random.shuffle(self._train_idx)
 
-        for idx in self._train_idx:
-            yield self._train_mapping[idx]
+        yield from self._train_mapping[self._train_idx].tolist()
 
     def __len__(self) -> int:
         return len(self._train_idx)
@@ -225,25 +228,38 @@ class ConditionalDatasetSampler(BaseSampler):
         )
 
         data = np.asarray(data)
-        # Store the row id for each category in each categorical column.
-        # For example _rid_by_cat_cols[a][b] is a list of all rows with the
-        # a-th discrete column equal value b.
-        self._categorical_value_to_row_ = []
+        # Store the row ids for each category, as a CSR table over the conditional vector:
+        # the rows with the category c are _category_rows[_category_row_ptr[c] : _category_row_ptr[c + 1]].
+        category_rows = []
+        category_ids = []
 
-        # Compute _rid_by_cat_cols
         st = 0
+        current_cond_st = 0
         for column_info in output_info:
             if is_discrete_column(column_info):
-                rid_by_cat = []
-                for j in range(column_info.output_dimensions):
-                    rid_by_cat.append(np.nonzero(data[:, st + j])[0])
-                self._categorical_value_to_row_.append(rid_by_cat)
+                rows, cols = np.nonzero(
+                    data[:, st : st + column_info.output_dimensions]
+                )
+                order = np.argsort(cols, kind="stable")
+                category_rows.append(rows[order])
+                category_ids.append(current_cond_st + cols[order])
+
+                current_cond_st += column_info.output_dimensions
 
             st += column_info.output_dimensions
 
         if st != data.shape[1]:
             raise RuntimeError(f"Invalid offset {st} {data.shape}")
 
+        self._category_rows = np.concatenate(
+            [np.zeros(0, dtype=int)] + category_rows
+        ).astype(int)
+        self._category_row_ptr = np.zeros(current_cond_st + 1, dtype=int)
+        if len(category_ids) > 0:
+            self._category_row_ptr[1:] = np.cumsum(
+                np.bincount(np.concatenate(category_ids), minlength=current_cond_st)
+            )
+
         # Prepare an interval matrix for efficiently sample conditional vector
         max_category = max(
             [
@@ -312,10 +328,21 @@ class ConditionalDatasetSampler(BaseSampler):
             categoricals, categoricals_vals
         )
 
-        self._train_idx = [idx for idx in sampling_indices if idx in self._train_idx]
-        self._train_mapping = {
-            old_idx: new_idx for new_idx, old_idx in enumerate(self._train_idx)
-        }
+        is_train = np.zeros(self._num_items, dtype=bool)
+        is_train[self._train_idx] = True
+
+        self._train_idx = sampling_indices[is_train[sampling_indices]]
+        self._train_mapping = self._position_mapping(self._train_idx)
+
+    def _position_mapping(self, train_idx: np.ndarray) -> np.ndarray:
+        """Lookup table from a row index to its last position in train_idx."""
+        mapping = np.full(self._num_items, -1, dtype=int)
+
+        reversed_idx = np.asarray(train_idx, dtype=int)[::-1]
+        rows, first = np.unique(reversed_idx, return_index=True)
+        mapping[rows] = len(reversed_idx) - 1 - first
+
+        return mapping
 
     def train_test(self) -> Tuple:
         return self._train_idx, self._test_idx
@@ -1,12 +1,19 @@
 # stdlib
 import hashlib
+import json
+import pickle
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # third party
 import cloudpickle
 import pandas as pd
+import torch
 from opacus import PrivacyEngine
+from opacus.optimizers import DPOptimizer
+
+# synthcity absolute
+from synthcity.version import MAJOR_VERSION
 
 # The list of plugins that are not simply loadable with cloudpickle
 unloadable_plugins: List[str] = [
@@ -159,6 +166,182 @@ def load_from_file(path: Union[str, Path]) -> Any:
         return cloudpickle.load(f)
 
 
+# Directory persistence format: the tensors are stored separately from the rest of the object graph, and are memory-mapped at load time.
+DIR_FORMAT_VERSION = 1
+DIR_METADATA_FILE = "metadata.json"
+DIR_OBJECTS_FILE = "objects.pkl"
+DIR_TENSORS_FILE = "tensors.pt"
+
+
+def _rebuild_dp_optimizer(
+    cls: type,
+    optimizer: torch.optim.Optimizer,
+    noise_multiplier: float,
+    max_grad_norm: float,
+    expected_batch_size: Optional[int],
+    loss_reduction: str,
+    secure_mode: bool,
+) -> DPOptimizer:
+    return cls(
+        optimizer,
+        noise_multiplier=noise_multiplier,
+        max_grad_norm=max_grad_norm,
+        expected_batch_size=expected_batch_size,
+        loss_reduction=loss_reduction,
+        secure_mode=secure_mode,
+    )
+
+
+class _TensorExtractingPickler(cloudpickle.Pickler):
+    """cloudpickle Pickler which stores the dense tensors out-of-band, in a dictionary.
+
+    The same tensor object is stored only once, so the sharing between the modules and the optimizers is preserved.
+    """
+
+    def __init__(self, file: Any, tensors: Dict[str, torch.Tensor]) -> None:
+        super().__init__(file)
+        self.tensors = tensors
+        self._keys: Dict[int, Tuple[str, torch.Tensor]] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        if type(obj) not in (torch.Tensor, torch.nn.Parameter):
+            return None
+        if obj.layout != torch.strided:
+            return None
+
+        if id(obj) not in self._keys:
+            key = str(len(self._keys))
+            self._keys[id(obj)] = (key, obj)
+            self.tensors[key] = obj.detach()
+
+        key, _ = self._keys[id(obj)]
+        return (
+            "tensor",
+            key,
+            isinstance(obj, torch.nn.Parameter),
+            obj.requires_grad and obj.is_leaf,
+        )
+
+    def reducer_override(self, obj: Any) -> Any:
+        # The DPOptimizer can't be restored from its __dict__, rebuild it from the wrapped optimizer.
+        if isinstance(obj, DPOptimizer):
+            return _rebuild_dp_optimizer, (
+                type(obj),
+                obj.original_optimizer,
+                obj.noise_multiplier,
+                obj.max_grad_norm,
+                obj.expected_batch_size,
+                obj.loss_reduction,
+                obj.secure_mode,
+            )
+        return super().reducer_override(obj)
+
+
+class _TensorInjectingUnpickler(pickle.Unpickler):
+    def __init__(self, file: Any, tensors: Dict[str, torch.Tensor]) -> None:
+        super().__init__(file)
+        self.tensors = tensors
+        self._cache: Dict[str, torch.Tensor] = {}
+
+    def persistent_load(self, pid: tuple) -> torch.Tensor:
+        tag, key, is_parameter, requires_grad = pid
+        if tag != "tensor":
+            raise pickle.UnpicklingError(f"Unsupported persistent id {tag}")
+
+        if key not in self._cache:
+            tensor = self.tensors[key]
+            if is_parameter:
+                tensor = torch.nn.Parameter(tensor, requires_grad=requires_grad)
+            elif requires_grad:
+                tensor = tensor.requires_grad_(True)
+            self._cache[key] = tensor
+
+        return self._cache[key]
+
+
+def save_to_dir(path: Union[str, Path], model: Any) -> dict:
+    """
+    Persist a model object to a directory, using a format optimized for loading.
+
+    The tensors of the object(PyTorch parameters, buffers and optimizer states) are stored in a single `torch.save` archive, which is memory-mapped at load time. The rest of the object graph(encoders, schema, hyperparameters) is serialized with cloudpickle, without the tensor payloads.
+
+    Args:
+        path: The output directory. Created if it doesn't exist.
+        model: The object to persist, usually a fitted Plugin.
+
+    Returns:
+        dict: The metadata of the saved object.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    tensors: Dict[str, torch.Tensor] = {}
+    with open(path / DIR_OBJECTS_FILE, "wb") as f:
+        _TensorExtractingPickler(f, tensors).dump(model)
+
+    torch.save(tensors, path / DIR_TENSORS_FILE)
+
+    metadata = {
+        "source": "synthcity",
+        "format_version": DIR_FORMAT_VERSION,
+        "version": MAJOR_VERSION,
+        "class_name": model.__class__.__qualname__,
+        "module_name": model.__class__.__module__,
+        "plugin_name": model.name() if hasattr(model, "name") else None,
+        "n_tensors": len(tensors),
+        "tensors_bytes": sum(
+            tensor.element_size() * tensor.nelement() for tensor in tensors.values()
+        ),
+    }
+    with open(path / DIR_METADATA_FILE, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    return metadata
+
+
+def load_metadata_from_dir(path: Union[str, Path]) -> dict:
+    """Read the metadata of a model persisted with `save_to_dir`, without loading the model."""
+    path = Path(path)
+
+    with open(path / DIR_METADATA_FILE) as f:
+        metadata = json.load(f)
+
+    if metadata.get("source") != "synthcity":
+        raise ValueError(f"Invalid synthcity model directory {path}")
+
+    if metadata["format_version"] != DIR_FORMAT_VERSION:
+        raise RuntimeError(
+            f"Invalid model format version. Current version is {DIR_FORMAT_VERSION}, but the model was saved using version {metadata['format_version']}"
+        )
+
+    if metadata["version"] != MAJOR_VERSION:
+        raise RuntimeError(
+            f"Invalid synthcity API version. Current version is {MAJOR_VERSION}, but the model was saved using version {metadata['version']}"
+        )
+
+    return metadata
+
+
+def load_from_dir(path: Union[str, Path], mmap: bool = True) -> Any:
+    """
+    Load a model persisted with `save_to_dir`.
+
+    Args:
+        path: The model directory.
+        mmap: If True, the tensors are memory-mapped from disk instead of being read in memory. The pages are loaded lazily, and are shared between the processes loading the same model.
+
+    Returns:
+        The loaded model.
+    """
+    path = Path(path)
+    load_metadata_from_dir(path)
+
+    tensors = torch.load(str(path / DIR_TENSORS_FILE), mmap=mmap)
+
+    with open(path / DIR_OBJECTS_FILE, "rb") as f:
+        return _TensorInjectingUnpickler(f, tensors).load()
+
+
 def dataframe_hash(df: pd.DataFrame) -> str:
     """Dataframe hashing, used for caching/backups"""
     cols = sorted(list(df.columns))
@@ -0,0 +1,102 @@
+# stdlib
+import math
+from typing import Any, Generator, List, Optional
+
+# third party
+import numpy as np
+import torch
+from torch.utils.data import Sampler, TensorDataset
+
+
+class TensorDataLoader:
+    """Batch iterator over in-memory tensors, a lightweight replacement of `torch.utils.data.DataLoader(TensorDataset(...))`.
+
+    The torch DataLoader collates each batch from per-row `__getitem__` calls, which dominates the epoch time of the small tabular models. Here, the rows of an epoch are gathered once, using the epoch's index order, and the batches are contiguous slices of the result.
+
+    The iteration protocol matches the torch DataLoader: each batch is a list with one tensor per input tensor, and `len` is the number of batches. The `dataset` attribute is kept for the Opacus privacy accounting.
+
+    Args:
+        tensors: torch.Tensor
+            The tensors to iterate over, with the same first dimension.
+        batch_size: int
+            The number of rows per batch.
+        sampler: Optional[torch.utils.data.sampler.Sampler]
+            Optional sampler for the row indices of each epoch(for example, `ConditionalDatasetSampler` or `ImbalancedDatasetSampler`). Mutually exclusive with `shuffle`.
+        shuffle: bool
+            Iterate over a random permutation of the rows at each epoch.
+        drop_last: bool
+            Drop the last incomplete batch.
+        generator: Optional[torch.Generator]
+            Optional random generator for the shuffling.
+    """
+
+    def __init__(
+        self,
+        *tensors: torch.Tensor,
+        batch_size: int = 1,
+        sampler: Optional[Sampler] = None,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        generator: Optional[torch.Generator] = None,
+    ) -> None:
+        if len(tensors) == 0:
+            raise ValueError("At least one tensor is required")
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch_size {batch_size}")
+        if sampler is not None and shuffle:
+            raise ValueError("sampler option is mutually exclusive with shuffle")
+
+        self.dataset = TensorDataset(*tensors)
+        self.tensors = tensors
+        self.batch_size = batch_size
+        self.sampler = sampler
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.generator = generator
+
+    def _num_samples(self) -> int:
+        if self.sampler is not None:
+            return len(self.sampler)
+
+        return len(self.dataset)
+
+    def _indices(self) -> Optional[torch.Tensor]:
+        """The row order of the next epoch. None for the sequential order."""
+        device = self.tensors[0].device
+        if self.sampler is not None:
+            indices = np.fromiter(
+                (int(idx) for idx in self.sampler),
+                dtype=np.int64,
+            )
+            return torch.from_numpy(indices).to(device)
+
+        if self.shuffle:
+            return torch.randperm(len(self.dataset), generator=self.generator).to(
+                device
+            )
+
+        return None
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return self._num_samples() // self.batch_size
+
+        return math.ceil(self._num_samples() / self.batch_size)
+
+    def __iter__(self) -> Generator[List[torch.Tensor], Any, None]:
+        # Same draw as the base seed of the torch DataLoader iterators: the seeded trainings keep their random streams, and their results.
+        torch.empty((), dtype=torch.int64).random_()
+
+        indices = self._indices()
+        if indices is None:
+            tensors = self.tensors
+        else:
+            tensors = tuple(tensor.index_select(0, indices) for tensor in self.tensors)
+
+        num_samples = len(tensors[0])
+        for start in range(0, num_samples, self.batch_size):
+            end = start + self.batch_size
+            if end > num_samples and self.drop_last:
+                return
+
+            yield [tensor[start:end] for tensor in tensors]
@@ -1,11 +1,12 @@
 # stdlib
 import sys
-from typing import Type
+from typing import Any, Type
 
 # third party
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 from sklearn.datasets import load_iris
 from torchvision import datasets
 
@@ -176,3 +177,25 @@ def test_image_support_detection() -> None:
         for k in score:
             assert score[k] >= 0
             assert not np.isnan(score[k])
+
+
+def test_image_detection_parallel_folds(tmp_path: Any) -> None:
+    X1 = ImageDataLoader((torch.rand(120, 32, 32), torch.zeros(120)), height=32)
+    X2 = ImageDataLoader((torch.rand(120, 32, 32) ** 4, torch.zeros(120)), height=32)
+
+    scores = []
+    for n_jobs in [1, 2]:
+        evaluator = SyntheticDetectionMLP(
+            n_jobs=n_jobs,
+            n_iter=5,
+            patience=2,
+            use_cache=False,
+            workspace=tmp_path,
+        )
+        score = evaluator.evaluate(X1, X2)
+        assert 0 <= score["mean"] <= 1
+        scores.append(score["mean"])
+
+    assert scores[1] == pytest.approx(scores[0], abs=0.05)
+    # the shared memory map is removed
+    assert not any(path.is_dir() for path in tmp_path.iterdir())
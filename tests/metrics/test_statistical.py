@@ -6,6 +6,7 @@ from typing import Any, Tuple, Type
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 from lifelines.datasets import load_rossi
 from sklearn.datasets import load_iris
 from torchvision import datasets
@@ -319,3 +320,41 @@ def test_image_support() -> None:
         for k in score:
             assert score[k] >= 0, evaluator
             assert not np.isnan(score[k]), evaluator
+
+
+def test_fid_streaming(tmp_path: Any) -> None:
+    X = ImageDataLoader((torch.rand(300, 8, 8), torch.zeros(300)), height=8)
+    X_syn = ImageDataLoader((torch.rand(200, 8, 8) ** 2, torch.zeros(200)), height=8)
+
+    # the streaming statistics match the full batch ones
+    evaluator = FrechetInceptionDistance(batch_size=64, use_cache=False)
+    mu, cov = evaluator._fit_gaussian_streaming(X)
+    ref_mu, ref_cov = evaluator._fit_gaussian(X.numpy().reshape(len(X), -1))
+    assert np.allclose(mu, ref_mu)
+    assert np.allclose(cov, ref_cov)
+
+    score = evaluator.evaluate(X, X_syn)["score"]
+    ref_score = evaluator._calculate_frechet_distance(
+        *evaluator._fit_gaussian(X.numpy().reshape(len(X), -1)),
+        *evaluator._fit_gaussian(X_syn.numpy().reshape(len(X_syn), -1)),
+    )
+    assert np.isclose(score, ref_score)
+
+    # feature space
+    evaluator = FrechetInceptionDistance(
+        feature_extractor="convnet", batch_size=64, use_cache=False
+    )
+    mu, cov = evaluator._fit_gaussian_streaming(X)
+    assert mu.shape == (64,)
+    assert cov.shape == (64, 64)
+
+    score = evaluator.evaluate(X, X_syn)["score"]
+    assert score > 0
+    assert evaluator.evaluate(X, X_syn)["score"] == score
+    assert evaluator.evaluate(X, X)["score"] < score
+
+    # local checkpoint
+    path = tmp_path / "extractor.pt"
+    torch.save(evaluator._feature_extractor, path)
+    evaluator = FrechetInceptionDistance(feature_extractor=path, use_cache=False)
+    assert np.isclose(evaluator.evaluate(X, X_syn)["score"], score)
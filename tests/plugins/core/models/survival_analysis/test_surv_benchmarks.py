@@ -0,0 +1,37 @@
+# third party
+import numpy as np
+import pytest
+from lifelines.datasets import load_rossi
+
+# synthcity absolute
+from synthcity.plugins.core.models.survival_analysis.benchmarks import (
+    evaluate_survival_model,
+)
+from synthcity.plugins.core.models.survival_analysis.surv_coxph import (
+    CoxPHSurvivalAnalysis,
+)
+
+
+@pytest.mark.parametrize("n_folds", [1, 3])
+def test_evaluate_survival_model(n_folds: int) -> None:
+    df = load_rossi()
+
+    X = df.drop(["week", "arrest"], axis=1)
+    Y = df["arrest"]
+    T = df["week"]
+    time_horizons = np.linspace(T.min(), T.max(), num=5)[1:-1].tolist()
+
+    score = evaluate_survival_model(
+        CoxPHSurvivalAnalysis(), X, T, Y, time_horizons, n_folds=n_folds
+    )
+    for metric in ["c_index", "brier_score", "aucroc"]:
+        assert metric in score["clf"]
+        assert metric in score["str"]
+    assert score["clf"]["c_index"][0] > 0.5
+    assert score["clf"]["brier_score"][0] < 0.5
+    assert score["clf"]["aucroc"][0] > 0.5
+
+    parallel_score = evaluate_survival_model(
+        CoxPHSurvivalAnalysis(), X, T, Y, time_horizons, n_folds=n_folds, n_jobs=2
+    )
+    assert parallel_score == score
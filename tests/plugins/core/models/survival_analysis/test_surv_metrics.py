@@ -4,8 +4,10 @@ from lifelines.datasets import load_rossi
 
 # synthcity absolute
 from synthcity.plugins.core.models.survival_analysis.metrics import (
+    km_survival_at,
     km_survival_function,
     nonparametric_distance,
+    survival_structured_array,
 )
 
 
@@ -22,6 +24,30 @@ def test_km_surv_function() -> None:
     assert constant_hazard < 1
 
 
+def test_km_survival_at() -> None:
+    df = load_rossi()
+
+    kmf, _, _, _ = km_survival_function(df["week"], df["arrest"])
+
+    time_points = np.linspace(-1, df["week"].max() + 5, 200)
+    pred = km_survival_at(kmf, time_points)
+
+    assert pred.shape == time_points.shape
+    assert np.isnan(pred[time_points < 0]).all()
+    expected = [kmf.predict(t) for t in time_points[time_points >= 0]]
+    assert np.allclose(pred[time_points >= 0], expected)
+
+
+def test_survival_structured_array() -> None:
+    df = load_rossi()
+
+    structured = survival_structured_array(df["week"], df["arrest"])
+
+    assert len(structured) == len(df)
+    assert (structured["time"] == df["week"].values).all()
+    assert (structured["status"] == df["arrest"].values.astype(bool)).all()
+
+
 def test_nonparametric_distance() -> None:
     df = load_rossi()
 
@@ -85,3 +85,51 @@ def test_methods_numeric_output(method_name: str) -> None:
     assert np.issubdtype(
         y_syn.dtype, np.number
     ), f"Method '{method_name}': output dtype {y_syn.dtype} is not numeric"
+
+
+@pytest.mark.parametrize("k", [1, 5, 200])
+def test_pmm_matches_nearest_neighbors(k: int) -> None:
+    """
+    Test that PMM draws each value among the k closest training predictions.
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(100, 3))
+    y = X @ np.array([1.0, -2.0, 0.5]) + rng.normal(size=100)
+    X_new = rng.normal(size=(300, 3))
+
+    fitted_model = syn_pmm(y, X, k=k)
+    y_syn = generate_pmm(fitted_model, X_new, random_state=1)
+    assert y_syn.shape == (300,)
+
+    y_hat_new = fitted_model["model"].predict(X_new)
+    for pred_val, value in zip(y_hat_new, y_syn):
+        dist = np.abs(fitted_model["y_hat"] - pred_val)
+        kth_dist = np.sort(dist)[min(k, len(dist)) - 1]
+        chosen = np.where(y == value)[0]
+        assert (dist[chosen] <= kth_dist + 1e-12).any()
+
+
+@pytest.mark.parametrize("method_name", ["cart", "ctree"])
+def test_tree_methods_sample_from_leaves(method_name: str) -> None:
+    """
+    Test that the tree methods draw each value from the training labels of its leaf.
+    """
+    syn_func, gen_func = METHOD_PAIRS[method_name]
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 2))
+    y = np.round(X[:, 0] * 10 + rng.normal(size=200), 1)
+
+    fitted_model = syn_func(y, X, random_state=0, max_depth=3)
+    X_new = rng.normal(size=(1000, 2))
+    y_syn = gen_func(fitted_model, X_new, random_state=0)
+    assert y_syn.shape == (1000,)
+
+    tree = fitted_model["estimator" if method_name == "cart" else "model"]
+    train_leaves = tree.apply(X)
+    for leaf, value in zip(tree.apply(X_new), y_syn):
+        assert value in y[train_leaves == leaf]
+
+    # All the values of a leaf can be drawn
+    leaf = train_leaves[0]
+    drawn = set(y_syn[tree.apply(X_new) == leaf])
+    assert len(drawn) > 1
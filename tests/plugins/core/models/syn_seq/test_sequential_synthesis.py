@@ -125,3 +125,27 @@ def test_sequential_synthesis_not_fitted() -> None:
     syn_seq = Syn_Seq()
     with pytest.raises(RuntimeError, match="Syn_Seq aggregator not yet fitted"):
         syn_seq.generate_col(3, label_encoder={})
+
+
+def test_sequential_synthesis_parallel_fit() -> None:
+    """
+    Test that the column models fitted in worker processes generate the same
+    data as the sequentially fitted models.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 4)), columns=["A", "B", "C", "D"])
+    loader_info: Dict[str, Any] = {
+        "syn_order": ["A", "B", "C", "D"],
+        "method": {"B": "norm", "C": "pmm", "D": "rf"},
+    }
+
+    outputs = []
+    for n_jobs in [1, 2]:
+        syn_seq = Syn_Seq(random_state=3, n_jobs=n_jobs)
+        syn_seq.fit_col(DummyLoader(df), label_encoder={}, loader_info=loader_info)
+        assert all(syn_seq._col_models[col] is not None for col in ["B", "C", "D"])
+
+        np.random.seed(0)
+        outputs.append(syn_seq.generate_col(50, label_encoder={}))
+
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
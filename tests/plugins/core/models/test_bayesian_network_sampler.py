@@ -0,0 +1,70 @@
+# third party
+import numpy as np
+import pandas as pd
+from pgmpy.factors.discrete import TabularCPD
+from pgmpy.sampling import BayesianModelSampling
+
+try:
+    # third party
+    from pgmpy.models import DiscreteBayesianNetwork as BayesianNetwork
+except ImportError:
+    from pgmpy.models import BayesianNetwork
+
+# synthcity absolute
+from synthcity.plugins.core.models.bayesian_network_sampler import (
+    BayesianNetworkSampler,
+)
+
+
+def test_sampler_distribution() -> None:
+    network = BayesianNetwork([("diff", "grade"), ("intel", "grade")])
+    network.add_cpds(
+        TabularCPD("diff", 2, [[0.6], [0.4]]),
+        TabularCPD("intel", 2, [[0.7], [0.3]]),
+        TabularCPD(
+            "grade",
+            3,
+            [[0.3, 0.05, 0.9, 0.5], [0.4, 0.25, 0.08, 0.3], [0.3, 0.7, 0.02, 0.2]],
+            ["intel", "diff"],
+            [2, 2],
+        ),
+    )
+
+    np.random.seed(0)
+    samples = BayesianNetworkSampler(network).sample(200000)
+
+    assert list(samples.columns) == list(network.nodes())
+    assert len(samples) == 200000
+
+    freqs = samples.groupby(["intel", "diff", "grade"]).size() / len(samples)
+    for (intel, diff, grade), freq in freqs.items():
+        expected = (
+            [0.7, 0.3][intel]
+            * [0.6, 0.4][diff]
+            * network.get_cpds("grade").get_values()[grade, 2 * intel + diff]
+        )
+        assert np.isclose(freq, expected, atol=5e-3)
+
+
+def test_sampler_state_names() -> None:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"a": rng.choice(["x", "y", "z"], 1000)})
+    X["b"] = np.where(rng.random(1000) < 0.9, X["a"] == "x", rng.random(1000) < 0.5)
+    X["c"] = rng.integers(0, 4, 1000) + 10 * X["b"]
+
+    network = BayesianNetwork([("a", "b"), ("b", "c")])
+    network.fit(X)
+
+    np.random.seed(0)
+    samples = BayesianNetworkSampler(network).sample(50000)
+    reference = BayesianModelSampling(network).forward_sample(
+        size=50000, show_progress=False
+    )
+
+    assert list(samples.columns) == list(reference.columns)
+    for col in X.columns:
+        assert set(samples[col].unique()) == set(reference[col].unique())
+
+        expected = reference[col].value_counts(normalize=True)
+        freqs = samples[col].value_counts(normalize=True)
+        assert np.allclose(freqs.reindex(expected.index), expected, atol=0.02)
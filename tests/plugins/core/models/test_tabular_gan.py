@@ -13,6 +13,7 @@ from synthcity.metrics.eval_statistical import AlphaPrecision
 from synthcity.metrics.weighted_metrics import WeightedMetrics
 from synthcity.plugins.core.dataloader import GenericDataLoader
 from synthcity.plugins.core.models.tabular_gan import TabularGAN
+from synthcity.utils.serialization import load, save
 
 
 def test_network_config() -> None:
@@ -207,3 +208,35 @@ def test_gan_sampling_adjustment() -> None:
 
     # Fix this assertion which occasionally fails
     # assert metrics_before["authenticity_OC"] < metrics_after["authenticity_OC"]
+
+
+def test_gan_sampling_adjustment_cache() -> None:
+    X, y = load_iris(return_X_y=True, as_frame=True)
+    X["target"] = y
+
+    model = TabularGAN(
+        X,
+        n_units_latent=50,
+        generator_n_iter=10,
+        n_iter_min=1,
+        adjust_inference_sampling=True,
+    )
+    model.fit(X)
+
+    n_classes = model.dataloader_sampler.conditional_dimension()
+    prob_mat = model._sample_prob_mat
+    assert prob_mat is not None
+    assert prob_mat.shape == (n_classes, n_classes)
+    assert np.allclose(prob_mat.sum(axis=0), 1)
+    assert model.sample_prob is not None
+    assert model.sample_prob.shape == (n_classes,)
+
+    # the calibration is reused, and serialized with the model
+    model.adjust_inference_sampling(False)
+    assert model.sample_prob is None
+    model.adjust_inference_sampling(True)
+    assert model._sample_prob_mat is prob_mat
+
+    reloaded = load(save(model))
+    assert np.allclose(reloaded._sample_prob_mat, prob_mat)
+    assert np.allclose(reloaded.sample_prob, model.sample_prob)
@@ -111,3 +111,25 @@ def test_vae_conditional() -> None:
 
     generated = model.generate(5, np.ones(5))
     assert generated.shape == (5, X.shape[1])
+
+
+@pytest.mark.parametrize("generate_batch_size", [1, 7, 10000])
+def test_vae_generate_batch_size(generate_batch_size: int) -> None:
+    X, y = load_digits(return_X_y=True)
+    X = MinMaxScaler().fit_transform(X)
+
+    model = VAE(
+        n_features=X.shape[1],
+        n_units_embedding=50,
+        n_units_conditional=1,
+        n_iter=10,
+        generate_batch_size=generate_batch_size,
+    )
+    model.fit(X, cond=y)
+
+    generated = model.generate(20, np.ones(20))
+    assert generated.shape == (20, X.shape[1])
+    assert not np.isnan(generated).any()
+
+    generated = model.generate(0, np.ones(0))
+    assert generated.shape == (0, X.shape[1])
@@ -0,0 +1,74 @@
+# stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# third party
+import pytest
+from sklearn.datasets import load_iris
+
+# synthcity absolute
+from synthcity.plugins import Plugin, Plugins
+from synthcity.plugins.core.batching import GenerationBatcher, generation_batcher
+
+
+@pytest.fixture(scope="module")
+def model() -> Plugin:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+    model = Plugins().get("marginal_distributions")
+    model.fit(X)
+
+    return model
+
+
+def test_batcher_coalesces_concurrent_requests(model: Plugin) -> None:
+    batcher = GenerationBatcher(model, max_delay=0.5)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda count: batcher.generate(count), range(1, 9)))
+
+    assert [len(result) for result in results] == list(range(1, 9))
+    assert batcher.n_requests == 8
+    assert batcher.n_generate_calls < 8
+
+
+def test_batcher_max_batch_size(model: Plugin) -> None:
+    batcher = GenerationBatcher(model, max_batch_size=10, max_delay=0.5)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: batcher.generate(10), range(4)))
+
+    assert all(len(result) == 10 for result in results)
+    assert batcher.n_generate_calls == 4
+
+
+def test_batcher_seeded_requests(model: Plugin) -> None:
+    batcher = GenerationBatcher(model)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(lambda seed: batcher.generate(10, random_state=seed), [0, 1])
+        )
+
+    assert all(len(result) == 10 for result in results)
+    assert batcher.n_generate_calls == 2
+
+
+def test_agenerate(model: Plugin) -> None:
+    async def run() -> list:
+        return await asyncio.gather(*[model.agenerate(count=50) for _ in range(16)])
+
+    results = asyncio.run(run())
+
+    assert all(len(result) == 50 for result in results)
+    assert generation_batcher(model).n_generate_calls < 16
+
+    # the plugin is still serializable
+    reloaded = Plugin.load(model.save())
+    assert reloaded.name() == model.name()
+
+
+def test_agenerate_not_fitted() -> None:
+    model = Plugins().get("marginal_distributions")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(model.agenerate(count=10))
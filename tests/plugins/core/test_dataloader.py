@@ -4,12 +4,14 @@ from datetime import datetime
 from typing import Any
 
 # third party
+import cloudpickle
 import numpy as np
 import pandas as pd
 import pytest
 import torch
 from lifelines.datasets import load_rossi
 from sklearn.datasets import load_breast_cancer
+from sklearn.preprocessing import LabelEncoder
 from torchvision import datasets, transforms
 
 # synthcity absolute
@@ -26,6 +28,7 @@ from synthcity.plugins.core.dataset import FlexibleDataset, TensorDataset
 from synthcity.utils.datasets.time_series.google_stocks import GoogleStocksDataloader
 from synthcity.utils.datasets.time_series.pbc import PBCDataloader
 from synthcity.utils.datasets.time_series.sine import SineDataloader
+from synthcity.utils.serialization import dataframe_hash
 
 
 def test_generic_dataloader_sanity() -> None:
@@ -89,6 +92,44 @@ def test_generic_dataloader_encoder() -> None:
         assert dt == decoded_dtypes[idx]
 
 
+def test_generic_dataloader_label_encoders() -> None:
+    rng = np.random.default_rng(0)
+    test = pd.DataFrame(
+        {
+            "str": rng.choice(["b", "a", "c", "d"], 1000),
+            "int": rng.integers(3, 12, 1000),
+            "bool": rng.random(1000) > 0.5,
+            "float": rng.choice([0.5, -1.5, 2.0], 1000),
+        }
+    )
+    loader = GenericDataLoader(test)
+
+    encoded, encoders = loader.encode()
+    assert sorted(encoders.keys()) == sorted(test.columns)
+
+    # same encoding as LabelEncoder
+    for col in test.columns:
+        reference = LabelEncoder().fit(test[col])
+        assert isinstance(encoders[col], LabelEncoder)
+        assert np.array_equal(encoders[col].classes_, reference.classes_)
+        assert np.array_equal(
+            encoded.dataframe()[col].values, reference.transform(test[col])
+        )
+
+    # the serialized encoders and the LabelEncoder encoders decode the same way
+    restored = cloudpickle.loads(cloudpickle.dumps(encoders))
+    assert encoded.decode(restored).dataframe().equals(test)
+
+    references = {col: LabelEncoder().fit(test[col]) for col in test.columns}
+    assert encoded.decode(references).dataframe().equals(test)
+
+    reencoded, _ = loader.encode(restored)
+    assert reencoded.dataframe().equals(encoded.dataframe())
+
+    with pytest.raises(ValueError):
+        GenericDataLoader(pd.DataFrame({"str": ["e"]})).encode(restored)
+
+
 def test_generic_dataloader_info() -> None:
     X, y = load_breast_cancer(return_X_y=True, as_frame=True)
 
@@ -756,6 +797,68 @@ def test_image_datasets() -> None:
     assert (transform_dataset.indices == [1]).all()
 
 
+class CountingTensorDataset(TensorDataset):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def __getitem__(self, index: int) -> Any:
+        self.calls += 1
+        return super().__getitem__(index)
+
+
+def test_image_dataloader_cache(monkeypatch: Any) -> None:
+    X = torch.rand(100, 10, 10)
+    y = torch.randint(0, 2, (100,))
+    dataset = CountingTensorDataset(images=X, targets=y)
+
+    loader = ImageDataLoader(data=dataset, height=16)
+
+    x_np, y_np = loader.unpack().numpy()
+    for idx in [0, 17, 99]:
+        assert np.allclose(x_np[idx], loader.data_transform(X[idx]).numpy())
+    assert (y_np == y.numpy()).all()
+
+    # the subsets reuse the transformed images
+    train, test, sample = loader.train(), loader.test(), loader.sample(10)
+    calls = dataset.calls
+    assert train.numpy().shape == (80, 1, 16, 16)
+    assert test.numpy().shape == (20, 1, 16, 16)
+    assert sample.numpy().shape == (10, 1, 16, 16)
+    assert dataset.calls == calls
+
+    train_idx, _ = loader._train_test_split()
+    assert np.allclose(train.numpy(), x_np[train_idx])
+    assert (train.unpack().labels() == y_np[train_idx]).all()
+
+    assert loader.hash() == dataframe_hash(loader.dataframe())
+    # hashed by chunks of rows
+    monkeypatch.setattr(
+        "synthcity.plugins.core.dataloader.IMAGE_HASH_CHUNK_SIZE", 16 * 16 * 7
+    )
+    assert loader.hash() == dataframe_hash(loader.dataframe())
+    assert train.hash() == dataframe_hash(train.dataframe())
+
+    # the shared cache cannot be modified through a loader
+    x_np = loader.unpack().numpy()[0]
+    with pytest.raises(ValueError):
+        x_np[0] = 123
+    x_tensor, _ = loader.unpack().tensors()
+    x_tensor[0] = 123
+    assert not np.allclose(loader.unpack().filter_indices([0]).numpy()[0], 123)
+
+
+def test_image_dataloader_cache_transforms() -> None:
+    data = TensorDataset(images=torch.ones(10, 1, 4, 4), targets=torch.zeros(10))
+
+    # the Lambda transforms have the same repr
+    double = FlexibleDataset(data, transforms.Lambda(lambda x: x * 2))
+    fivefold = FlexibleDataset(data, transforms.Lambda(lambda x: x * 5))
+
+    assert np.allclose(double.numpy()[0], 2)
+    assert np.allclose(fivefold.numpy()[0], 5)
+
+
 def test_syn_seq_dataloader_sanity() -> None:
     """
     Test basic creation of Syn_SeqDataLoader, verifying:
@@ -2,12 +2,16 @@
 from typing import Any, List
 
 # third party
+import numpy as np
+import pandas as pd
 import pytest
 
 # synthcity absolute
+from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import DataLoader, GenericDataLoader
 from synthcity.plugins.core.distribution import Distribution
 from synthcity.plugins.core.plugin import Plugin
+from synthcity.plugins.core.schema import CompiledConstraints, Schema
 
 
 class AbstractMockPlugin(Plugin):
@@ -51,3 +55,65 @@ def test_mock_plugin_ok() -> None:
     reloaded = Plugin.load(buff)
 
     assert reloaded.name() == plugin.name()
+
+
+class SchemaRecorderPlugin(MockPlugin):
+    def _fit(self, X: DataLoader, *args: Any, **kwargs: Any) -> "Plugin":
+        self.X = X.dataframe()
+        self.syn_schemas: List[Schema] = []
+        return self
+
+    def _generate(self, count: int, syn_schema: Schema, **kwargs: Any) -> DataLoader:
+        self.syn_schemas.append(syn_schema)
+        return self._safe_generate(lambda count: self.X, count, syn_schema)
+
+
+def test_generate_constraints_cache() -> None:
+    X = pd.DataFrame({"a": np.arange(20) + 0.5, "b": [0, 1] * 10})
+    plugin = SchemaRecorderPlugin(sampling_patience=2)
+    plugin.fit(X)
+
+    plugin.generate(2)
+    plugin.generate(2)
+    assert plugin.syn_schemas[0] is plugin.syn_schemas[1]
+
+    constraints = Constraints(rules=[("a", "<=", 3)])
+    assert (plugin.generate(4, constraints=constraints).dataframe()["a"] <= 3).all()
+    plugin.generate(4, constraints=Constraints(rules=[("a", "<=", 3)]))
+    assert plugin.syn_schemas[2] is not plugin.syn_schemas[0]
+    assert plugin.syn_schemas[2] is plugin.syn_schemas[3]
+
+    # updated user constraints
+    constraints.rules.append(("b", "==", 1))
+    assert (plugin.generate(4, constraints=constraints).dataframe()["b"] == 1).all()
+    assert plugin.syn_schemas[4] is not plugin.syn_schemas[3]
+
+    # re-fit
+    previous = plugin.syn_schemas[0]
+    plugin.fit(X)
+    plugin.generate(2)
+    assert plugin.syn_schemas[0] is not previous
+
+
+def test_compile_constraints() -> None:
+    X = pd.DataFrame({"a": np.arange(20) + 0.5, "b": [0, 1] * 10})
+    plugin = SchemaRecorderPlugin(sampling_patience=2)
+    plugin.fit(X)
+
+    constraints = Constraints(rules=[("a", ">=", 3)])
+    compiled = plugin.compile_constraints(constraints)
+    assert isinstance(compiled, CompiledConstraints)
+
+    # later changes of the user constraints don't affect the compiled ones
+    constraints.rules.append(("b", "==", 1))
+
+    for _ in range(3):
+        out = plugin.generate(4, constraints=compiled).dataframe()
+        assert len(out) == 4
+        assert (out["a"] >= 3).all()
+    assert all(schema is compiled.syn_schema for schema in plugin.syn_schemas)
+
+    # constraints compiled before a re-fit are recompiled
+    plugin.fit(X)
+    plugin.generate(4, constraints=compiled)
+    assert plugin.syn_schemas[-1] is not compiled.syn_schema
@@ -5,6 +5,7 @@ from typing import List
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 from da_helpers import generate_fixtures, get_airfoil_dataset
 from sklearn.datasets import load_iris
 
@@ -13,7 +14,7 @@ from synthcity.metrics.eval import PerformanceEvaluatorXGB
 from synthcity.plugins import Plugin
 from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import GenericDataLoader
-from synthcity.plugins.domain_adaptation.plugin_radialgan import plugin
+from synthcity.plugins.domain_adaptation.plugin_radialgan import RadialGAN, plugin
 from synthcity.utils.serialization import load, save
 
 plugin_name = "radialgan"
@@ -95,6 +96,49 @@ def test_plugin_generate_domain(target_domains: List[int]) -> None:
         assert src_domain in X_gen["domain"].values
 
 
+def test_radialgan_grouped_generation() -> None:
+    n_domains = 5
+    X, _ = load_iris(return_X_y=True)
+    domains = np.arange(len(X)) % n_domains
+
+    model = RadialGAN(
+        domains=list(range(n_domains)),
+        n_features=X.shape[1],
+        n_units_latent=8,
+        generator_n_layers_hidden=1,
+        generator_n_units_hidden=10,
+        generator_n_iter=5,
+        discriminator_n_layers_hidden=1,
+        discriminator_n_units_hidden=10,
+        batch_size=32,
+    )
+    model.fit(X, domains)
+
+    target_domains = [1, 3]
+    torch.manual_seed(0)
+    X_gen, X_domains = model.generate(100, domains=target_domains)
+
+    # reference: a generator call and a mapper call for each (target, source) pair
+    torch.manual_seed(0)
+    expected = []
+    expected_domains: list = []
+    batch_per_domain = 100 // len(target_domains) + 1
+    with torch.no_grad():
+        for target_domain in target_domains:
+            for src_domain in model.domain_weights:
+                batch_size = int(batch_per_domain * model.domain_weights[src_domain])
+                noise = torch.randn(batch_size, model.n_units_latent)
+                out = model.generators[src_domain](noise)
+                if src_domain != target_domain:
+                    out = model.mappers[target_domain](out)
+                expected.append(out.numpy())
+                expected_domains.extend([target_domain] * len(out))
+
+    assert X_gen.shape == (len(expected_domains), X.shape[1])
+    assert np.allclose(X_gen, np.concatenate(expected), atol=1e-6)
+    assert list(X_domains) == expected_domains
+
+
 @pytest.mark.parametrize(
     "test_plugin", generate_fixtures(plugin_name, plugin, plugin_args)
 )
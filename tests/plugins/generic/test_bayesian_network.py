@@ -1,14 +1,23 @@
+# stdlib
+import sys
+from typing import Any
+
 # third party
 import pandas as pd
 import pytest
 from generic_helpers import generate_fixtures
+from pgmpy.sampling import BayesianModelSampling
 from sklearn.datasets import load_iris
 
 # synthcity absolute
 from synthcity.plugins import Plugin
 from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import GenericDataLoader
+from synthcity.plugins.core.models.bayesian_network_sampler import (
+    BayesianNetworkSampler,
+)
 from synthcity.plugins.generic.plugin_bayesian_network import plugin
+from synthcity.utils.serialization import load, save
 
 plugin_name = "bayesian_network"
 
@@ -64,6 +73,33 @@ def test_plugin_generate(test_plugin: Plugin) -> None:
     assert list(X_gen.columns) == list(X.columns)
 
 
+def test_plugin_generate_serialized_without_sampler(monkeypatch: Any) -> None:
+    networks = []
+
+    class RecordingSampler(BayesianNetworkSampler):
+        def __init__(self, network: Any) -> None:
+            networks.append(network)
+            super().__init__(network)
+
+    monkeypatch.setattr(
+        sys.modules[plugin.__module__], "BayesianNetworkSampler", RecordingSampler
+    )
+
+    X = pd.DataFrame(load_iris()["data"])
+    test_plugin = plugin()
+    test_plugin.fit(GenericDataLoader(X))
+
+    # the state of the plugins serialized before the compiled sampler
+    del test_plugin.sampler
+    test_plugin.model = BayesianModelSampling(networks[0])
+    restored = load(save(test_plugin))
+
+    X_gen = restored.generate(50)
+    assert len(X_gen) == 50
+    assert restored.schema_includes(X_gen)
+    assert networks[-1] is not networks[0]  # rebuilt from the deserialized network
+
+
 @pytest.mark.parametrize("test_plugin", generate_fixtures(plugin_name, plugin))
 def test_plugin_generate_constraints(test_plugin: Plugin) -> None:
     X = pd.DataFrame(load_iris()["data"])
@@ -143,6 +143,47 @@ def test_plugin_generate_constraints(test_plugin: Plugin) -> None:
     assert list(X_gen.columns) == list(X.columns)
 
 
+@pytest.mark.parametrize("sampling_steps", [1, 10, 100])
+def test_plugin_generate_ddim(sampling_steps: int) -> None:
+    X, y = load_iris(as_frame=True, return_X_y=True)
+    X["target"] = y
+    test_plugin = plugin(**plugin_params, is_classification=True)
+    test_plugin.fit(GenericDataLoader(X))
+
+    X_gen = test_plugin.generate(50, sampling_steps=sampling_steps)
+    assert len(X_gen) == 50
+    assert test_plugin.schema_includes(X_gen)
+
+    # the chain starts from pure noise
+    diffusion = test_plugin.model.diffusion
+    timesteps = diffusion.ddim_timesteps(sampling_steps)
+    assert len(timesteps) == min(sampling_steps, diffusion.num_timesteps)
+    assert timesteps[0] == diffusion.num_timesteps - 1
+    if sampling_steps == 1:
+        assert timesteps == [diffusion.num_timesteps - 1]
+
+
+def test_ddim_timesteps() -> None:
+    X = pd.DataFrame(load_iris()["data"])
+    test_plugin = plugin(**plugin_params)
+    test_plugin.fit(GenericDataLoader(X))
+    diffusion = test_plugin.model.diffusion
+
+    assert diffusion.ddim_timesteps() == list(range(99, -1, -1))
+    assert diffusion.ddim_timesteps(1000) == list(range(99, -1, -1))
+
+    timesteps = diffusion.ddim_timesteps(10)
+    assert len(timesteps) == 10
+    assert timesteps[0] == 99 and timesteps[-1] == 0
+    assert timesteps == sorted(timesteps, reverse=True)
+
+    assert diffusion.ddim_timesteps(1) == [99]
+    assert diffusion.ddim_timesteps(2) == [99, 0]
+
+    with pytest.raises(ValueError):
+        diffusion.ddim_timesteps(0)
+
+
 @pytest.mark.parametrize("test_plugin", extend_fixtures())
 def test_plugin_hyperparams(test_plugin: Plugin) -> None:
     assert len(test_plugin.hyperparameter_space()) == 4
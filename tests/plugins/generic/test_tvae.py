@@ -96,6 +96,18 @@ def test_plugin_generate_constraints(test_plugin: Plugin) -> None:
     assert list(X_gen.columns) == list(X.columns)
 
 
+def test_plugin_generate_batch_size() -> None:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+    test_plugin = plugin(generate_batch_size=7, **plugin_args)
+    test_plugin.fit(GenericDataLoader(X))
+
+    assert test_plugin.model.model.generate_batch_size == 7
+
+    X_gen = test_plugin.generate(50)
+    assert len(X_gen) == 50
+    assert test_plugin.schema_includes(X_gen)
+
+
 def test_sample_hyperparams() -> None:
     for i in range(100):
         args = plugin.sample_hyperparameters()
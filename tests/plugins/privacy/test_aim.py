@@ -3,6 +3,7 @@ import random
 from datetime import datetime, timedelta
 
 # third party
+import numpy as np
 import pandas as pd
 import pytest
 from fhelpers import generate_fixtures
@@ -11,6 +12,9 @@ from fhelpers import generate_fixtures
 from synthcity.plugins import Plugin
 from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import GenericDataLoader
+from synthcity.plugins.core.models.mbi.dataset import Dataset
+from synthcity.plugins.core.models.mbi.domain import Domain
+from synthcity.plugins.core.models.mbi.graphical_model import synthetic_cols
 from synthcity.plugins.privacy.plugin_aim import plugin
 from synthcity.utils.datasets.categorical.categorical_adult import (
     CategoricalAdultDataloader,
@@ -179,3 +183,45 @@ def test_plugin_encoding() -> None:
 
     assert syn_df["date"].infer_objects().dtype.kind == "M"
     assert syn_df["bool"].infer_objects().dtype.kind == "b"
+
+
+def test_mbi_dataset_datavector() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 4, 500),
+            "b": rng.integers(0, 3, 500),
+            "c": rng.normal(2, 2, 500),
+        }
+    )
+    domain = Domain(["a", "b", "c"], [4, 3, 5])
+    weights = rng.random(500)
+
+    for w in [None, weights]:
+        data = Dataset(df, domain, w)
+        for cols in [["a"], ["c"], ["b", "a"], ["a", "b", "c"]]:
+            bins = [range(n + 1) for n in domain.project(cols).shape]
+            expected = np.histogramdd(df[cols].values, bins, weights=w)[0]
+
+            assert np.allclose(data.project(cols).datavector(flatten=False), expected)
+            # cached
+            assert np.allclose(data.project(cols).datavector(), expected.flatten())
+
+
+@pytest.mark.parametrize("method", ["round", "sample"])
+def test_mbi_synthetic_cols(method: str) -> None:
+    marg = np.array([[5.0, 3.0, 2.0], [0.0, 0.0, 0.0], [1.0, 1.0, 8.0]])
+    groups = np.repeat([0, 1, 2], 1000)
+    np.random.seed(0)
+
+    vals = synthetic_cols(marg, groups, method)
+
+    assert vals.shape == groups.shape
+    for group, expected in enumerate([marg[0] / 10, [1 / 3] * 3, marg[2] / 10]):
+        freqs = np.bincount(vals[groups == group], minlength=3) / 1000
+        assert np.allclose(freqs, expected, atol=0.05)
+
+    if method == "round":
+        assert (np.bincount(vals[groups == 0], minlength=3) == [500, 300, 200]).all()
+        # shuffled within the groups
+        assert (np.diff(vals[groups == 0]) < 0).any()
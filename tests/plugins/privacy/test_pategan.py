@@ -4,13 +4,18 @@ import pandas as pd
 import pytest
 from fhelpers import generate_fixtures, get_airfoil_dataset
 from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
 
 # synthcity absolute
 from synthcity.metrics.eval import PerformanceEvaluatorXGB
 from synthcity.plugins import Plugin
 from synthcity.plugins.core.constraints import Constraints
 from synthcity.plugins.core.dataloader import GenericDataLoader
-from synthcity.plugins.privacy.plugin_pategan import plugin
+from synthcity.plugins.privacy.plugin_pategan import (
+    Teachers,
+    _fit_batched_logistic,
+    plugin,
+)
 
 plugin_name = "pategan"
 plugin_args = {
@@ -35,6 +40,43 @@ def test_plugin_type(test_plugin: Plugin) -> None:
     assert test_plugin.type() == "privacy"
 
 
+def test_batched_logistic() -> None:
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3, 100, 4))
+    y = np.concatenate([np.ones(50), np.zeros(50)])
+    X[:, :50] += 0.5
+
+    coef, intercept = _fit_batched_logistic(X, y)
+
+    for tidx in range(3):
+        model = LogisticRegression(tol=1e-10).fit(X[tidx], y)
+        assert np.allclose(coef[tidx], model.coef_[0], atol=1e-4)
+        assert np.allclose(intercept[tidx], model.intercept_[0], atol=1e-4)
+
+
+@pytest.mark.parametrize("template", ["linear", "batched_linear", "xgboost"])
+def test_teachers_n_jobs(template: str) -> None:
+    X = np.random.default_rng(0).normal(size=(200, 3))
+
+    def generator(count: int) -> np.ndarray:
+        return np.random.normal(loc=1, size=(count, 3))
+
+    predictions = []
+    for n_jobs in [1, 2]:
+        np.random.seed(0)
+        teachers = Teachers(
+            n_teachers=4, samples_per_teacher=50, template=template, n_jobs=n_jobs
+        ).fit(X, generator)
+        predictions.append(teachers._predict(X))
+
+    assert predictions[0].shape == (4, len(X))
+    assert (predictions[0] == predictions[1]).all()
+
+    if template == "linear":
+        expected = np.vstack([model.predict(X) for model in teachers.teacher_models])
+        assert (predictions[0] == expected).all()
+
+
 @pytest.mark.parametrize("test_plugin", generate_fixtures(plugin_name, plugin))
 def test_plugin_hyperparams(test_plugin: Plugin) -> None:
     assert len(test_plugin.hyperparameter_space()) == 20
@@ -1,12 +1,20 @@
 # third party
+import numpy as np
+import pandas as pd
 import pytest
 from fhelpers import generate_fixtures
 from sklearn.datasets import load_iris
+from sklearn.metrics import normalized_mutual_info_score
 
 # synthcity absolute
 from synthcity.plugins import Plugin
 from synthcity.plugins.core.dataloader import GenericDataLoader
-from synthcity.plugins.privacy.plugin_privbayes import plugin
+from synthcity.plugins.privacy.plugin_privbayes import (
+    ContingencyMutualInformation,
+    PrivBayes,
+    plugin,
+)
+from synthcity.utils.serialization import load, save
 
 plugin_name = "privbayes"
 
@@ -48,3 +56,39 @@ def test_plugin_generate_privbayes() -> None:
     assert len(X_gen) == 50
     assert test_plugin.schema_includes(X_gen)
     assert sorted(list(X_gen.columns)) == sorted(list(X.columns))
+
+    # the models serialized before the compiled sampler
+    del test_plugin.model.sampler
+    restored = load(save(test_plugin))
+
+    X_gen = restored.generate(50)
+    assert len(X_gen) == 50
+    assert restored.schema_includes(X_gen)
+
+
+@pytest.mark.parametrize("parents", [["a"], ["a", "b"], ["a", "b", "c"], ["const"]])
+def test_contingency_mutual_information(parents: list) -> None:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.integers(0, 7, size=(500, 3)), columns=["a", "b", "c"])
+    X["linked"] = X["a"] * 2 + rng.integers(0, 2, size=len(X))
+    X["wide"] = rng.integers(0, 1000, size=len(X))
+    X["const"] = 3
+
+    engine = ContingencyMutualInformation(X, n_bins=100)
+    assert engine.codes.max(axis=0)[list(X.columns).index("wide")] < 100
+
+    candidates = [col for col in X.columns if col not in parents]
+    scores = engine.scores(parents, candidates)
+
+    cells, _ = engine._parents(parents)
+    expected = [
+        normalized_mutual_info_score(
+            cells, engine.codes[:, list(X.columns).index(candidate)]
+        )
+        for candidate in candidates
+    ]
+    assert np.allclose(scores, expected)
+
+    model = PrivBayes()
+    for candidate, score in zip(candidates, scores):
+        assert np.isclose(model.mutual_info_score(X, parents, candidate), score)
@@ -1,5 +1,6 @@
 # stdlib
 import inspect
+from pathlib import Path
 from typing import Any
 
 # third party
@@ -75,6 +76,23 @@ def test_serialization_sanity() -> None:
     verify_serialization(syn_model, generate=True)
 
 
+@pytest.mark.parametrize("plugin", ["adsgan", "dpgan", "tvae"])
+def test_serialization_dir(plugin: str, tmp_path: Path) -> None:
+    generic_data = pd.DataFrame(load_iris()["data"])
+
+    syn_model = Plugins().get(plugin, strict=False, n_iter=10)
+    syn_model.fit(generic_data)
+
+    syn_model.save_to_dir(tmp_path / plugin)
+
+    for reloaded in [
+        Plugin.load_from_dir(tmp_path / plugin),
+        Plugins().load_from_dir(tmp_path / plugin, mmap=False),
+    ]:
+        sanity_check(syn_model, reloaded)
+        assert len(reloaded.generate(10)) == 10
+
+
 @pytest.mark.parametrize("plugin", Plugins(categories=["privacy"]).reload().list())
 @pytest.mark.slow_1
 @pytest.mark.slow
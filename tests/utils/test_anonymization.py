@@ -1,11 +1,16 @@
+# stdlib
+from typing import Any
+
 # third party
+import numpy as np
+import pandas as pd
 import pytest
 from sklearn.datasets import load_breast_cancer, load_diabetes
 
 # synthcity absolute
 from synthcity.metrics.eval_privacy import kAnonymization, lDiversityDistinct
 from synthcity.plugins.core.dataloader import GenericDataLoader
-from synthcity.utils.anonymization import DatasetAnonymization
+from synthcity.utils.anonymization import DatasetAnonymization, _MondrianEngine
 
 
 def test_k_anonymity_sanity() -> None:
@@ -60,6 +65,86 @@ def test_k_anonymity_partition() -> None:
     assert less_parts < more_parts
 
 
+@pytest.mark.parametrize("sensitive_column", ["c", "s"])
+def test_k_anonymity_partition_engine(sensitive_column: str) -> None:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=2000),
+            "b": rng.integers(0, 100, 2000),
+            "c": rng.choice([10, 20, 30], 2000),
+            "s": rng.integers(0, 4, 2000),
+        }
+    )
+    features = ["a", "b", "c"] if sensitive_column == "s" else ["a", "b", "s"]
+
+    evaluator = DatasetAnonymization(k_threshold=10, l_diversity=2, t_threshold=0.5)
+    partitions = evaluator._partition_dataset(X, features, sensitive_column)
+
+    # the partitions cover the dataset, and are valid
+    assert sorted(np.concatenate(partitions)) == list(X.index)
+    for partition in partitions:
+        assert evaluator._is_partition_anonymous(
+            X,
+            partition,
+            sensitive_column,
+            evaluator._get_frequencies(X, sensitive_column),
+            evaluator._get_categoricals(X),
+        )
+
+    # the parallel subtrees give the same partitions, in the same order
+    parallel = DatasetAnonymization(
+        k_threshold=10, l_diversity=2, t_threshold=0.5, n_jobs=2
+    )._partition_dataset(X, features, sensitive_column)
+    assert len(parallel) == len(partitions)
+    for lhs, rhs in zip(parallel, partitions):
+        assert lhs.equals(rhs)
+
+    anon_df = evaluator.anonymize_column(X.copy(), sensitive_column)
+    assert len(anon_df) == len(X)
+    assert (
+        anon_df[sensitive_column].value_counts() == X[sensitive_column].value_counts()
+    ).all()
+
+
+def test_k_anonymity_partition_all_cpus(monkeypatch: Any) -> None:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=1000),
+            "b": rng.integers(0, 100, 1000),
+            "s": rng.integers(0, 4, 1000),
+        }
+    )
+    reference = DatasetAnonymization(k_threshold=10)._partition_dataset(
+        X, ["a", "b"], "s"
+    )
+
+    # n_jobs=-1 is resolved to the number of CPUs before sizing the pending partitions
+    monkeypatch.setattr(
+        "synthcity.utils.anonymization.effective_n_jobs", lambda n_jobs: 2
+    )
+    pending = []
+    run = _MondrianEngine.run
+
+    def _run(engine: Any, queue: Any, max_pending: Any = None) -> Any:
+        finished = run(engine, queue, max_pending)
+        if max_pending is not None:
+            pending.append(len(queue))
+        return finished
+
+    monkeypatch.setattr(_MondrianEngine, "run", _run)
+    partitions = DatasetAnonymization(k_threshold=10, n_jobs=-1)._partition_dataset(
+        X, ["a", "b"], "s"
+    )
+
+    # the top of the tree was expanded for 2 workers, instead of dispatching the root
+    assert len(pending) == 1 and pending[0] > 4 * 2
+    assert len(partitions) == len(reference)
+    for lhs, rhs in zip(partitions, reference):
+        assert lhs.equals(rhs)
+
+
 def test_k_anonymity_validation() -> None:
     X, y = load_breast_cancer(return_X_y=True, as_frame=True)
 
@@ -2,6 +2,7 @@
 import urllib.error
 
 # third party
+import numpy as np
 import pandas as pd
 from sklearn.datasets import load_diabetes
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
@@ -143,3 +144,26 @@ def test_decompression_sanity_airfoil() -> None:
     assert sorted(df.columns.values) == sorted(decompressed_df.columns.values)
 
     assert decompressed_df["chord_length"].dtype == "object"
+
+
+def test_compression_parallel_sampled() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(3000, 4)), columns=["a", "b", "c", "d"])
+    df["a_dup"] = 2 * df["a"]
+    df["cat"] = rng.choice(["x y", "z"], len(df))  # the values contain the separator
+    df["cat2"] = rng.integers(0, 3, len(df))
+
+    compressed_df, context = compress_dataset(df, n_jobs=1, n_samples=1000)
+    parallel_df, parallel_context = compress_dataset(df, n_jobs=2, n_samples=1000)
+
+    assert sorted(context["compressers"].keys()) == ["a"]
+    assert sorted(parallel_context["compressers"].keys()) == ["a"]
+    assert compressed_df.equals(parallel_df)
+
+    assert list(context["compressers_categoricals"].keys()) == ["cat cat2"]
+    assert compressed_df["cat cat2"].nunique() == 6
+
+    decompressed_df = decompress_dataset(compressed_df, context)
+    assert (decompressed_df["cat"] == df["cat"]).all()
+    assert (decompressed_df["cat2"] == df["cat2"]).all()
+    assert decompressed_df["cat2"].dtype == df["cat2"].dtype
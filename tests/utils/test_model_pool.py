@@ -0,0 +1,139 @@
+# stdlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# third party
+import pytest
+from sklearn.datasets import load_iris
+
+# synthcity absolute
+from synthcity.plugins import Plugins
+from synthcity.utils.model_pool import GeneratorPool, load_model, model_fingerprint
+from synthcity.utils.serialization import save, save_to_file
+
+
+@pytest.fixture(scope="module")
+def models(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+    workspace = tmp_path_factory.mktemp("pool")
+
+    paths = {}
+    for name in ["marginal_distributions", "uniform_sampler"]:
+        model = Plugins().get(name)
+        model.fit(X)
+        paths[name] = workspace / f"{name}.pkl"
+        save_to_file(paths[name], model)
+
+    model = Plugins().get("dpgan", n_iter=10)
+    model.fit(X)
+    paths["dpgan"] = workspace / "dpgan"
+    model.save_to_dir(paths["dpgan"])
+
+    return paths
+
+
+def test_pool_hits_and_misses(models: dict) -> None:
+    pool = GeneratorPool()
+
+    assert len(pool.generate(models["marginal_distributions"], count=10)) == 10
+    assert len(pool.generate(models["marginal_distributions"], count=10)) == 10
+    assert len(pool.generate(models["dpgan"], count=10)) == 10
+
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["models"] == 2
+    assert stats["evictions"] == 0
+    assert models["dpgan"] in pool
+
+
+def test_pool_lru_eviction(models: dict) -> None:
+    pool = GeneratorPool(max_models=2)
+    pool.preload([models["marginal_distributions"], models["uniform_sampler"]])
+
+    # refresh the first model, the second one becomes the least recently used
+    pool.get(models["marginal_distributions"])
+    pool.get(models["dpgan"])
+
+    assert models["marginal_distributions"] in pool
+    assert models["uniform_sampler"] not in pool
+    assert pool.stats()["evictions"] == 1
+
+
+def test_pool_memory_budget(models: dict) -> None:
+    budget = Path(models["uniform_sampler"]).stat().st_size + 1
+    pool = GeneratorPool(memory_budget=budget)
+
+    pool.get(models["uniform_sampler"])
+    pool.get(models["marginal_distributions"])
+
+    assert len(pool) == 1
+    assert models["marginal_distributions"] in pool
+    assert pool.stats()["evictions"] == 1
+
+
+def test_pool_model_hash(models: dict) -> None:
+    pool = GeneratorPool()
+
+    pool.get(models["uniform_sampler"], model_hash="v1")
+    pool.get(models["uniform_sampler"], model_hash="v1")
+    pool.get(models["uniform_sampler"], model_hash="v2")
+
+    assert len(pool) == 1
+    assert pool.stats()["misses"] == 2
+
+
+def test_pool_fingerprint(models: dict, tmp_path: Path) -> None:
+    path = tmp_path / "model.pkl"
+    path.write_bytes(Path(models["uniform_sampler"]).read_bytes())
+
+    pool = GeneratorPool()
+    model = pool.get(path)
+    assert pool.get(path) is model
+    assert pool.stats()["hits"] == 1
+
+    # rewrite the file with another model
+    fingerprint = model_fingerprint(path)
+    path.write_bytes(Path(models["marginal_distributions"]).read_bytes())
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert model_fingerprint(path) != fingerprint
+
+    reloaded = pool.get(path)
+    assert reloaded is not model
+    assert reloaded.name() == "marginal_distributions"
+    assert len(pool) == 1
+    assert pool.stats()["misses"] == 2
+
+
+def test_pool_concurrent_generate(models: dict) -> None:
+    pool = GeneratorPool()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: pool.generate(models["dpgan"], count=5).dataframe(),
+                range(8),
+            )
+        )
+
+    assert all(len(result) == 5 for result in results)
+    assert pool.stats()["misses"] == 1
+    assert pool.stats()["hits"] == 7
+
+
+def test_load_model_dpgan_checkpoint(tmp_path: Path) -> None:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+    model = Plugins().get("dpgan", n_iter=10)
+    model.fit(X)
+
+    path = tmp_path / "dpgan.bkp"
+    with open(path, "wb") as f:
+        f.write(save(model))
+
+    with pytest.raises(ValueError):
+        load_model(path)
+
+    reloaded = load_model(path, custom_model=lambda: model)
+    assert len(reloaded.generate(5)) == 5
@@ -0,0 +1,77 @@
+# third party
+import optuna
+import pytest
+from sklearn.datasets import load_iris
+
+# synthcity absolute
+from synthcity.plugins.generic.plugin_ctgan import plugin as ctgan_plugin
+from synthcity.plugins.generic.plugin_uniform_sampler import (
+    plugin as uniform_sampler_plugin,
+)
+from synthcity.utils.callbacks import OptunaPruning
+from synthcity.utils.optimizer import (
+    create_multi_fidelity_pruner,
+    supports_training_callbacks,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("successive_halving", optuna.pruners.SuccessiveHalvingPruner),
+        ("hyperband", optuna.pruners.HyperbandPruner),
+    ],
+)
+def test_create_multi_fidelity_pruner(name: str, expected: type) -> None:
+    assert isinstance(create_multi_fidelity_pruner(name), expected)
+
+
+def test_create_multi_fidelity_pruner_invalid() -> None:
+    with pytest.raises(ValueError):
+        create_multi_fidelity_pruner("median")
+
+
+def test_supports_training_callbacks() -> None:
+    assert supports_training_callbacks(ctgan_plugin)
+    assert not supports_training_callbacks(uniform_sampler_plugin)
+
+
+def test_optuna_pruning_reports_intermediate_scores() -> None:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+
+    study = optuna.create_study(direction="minimize", pruner=optuna.pruners.NopPruner())
+    trial = study.ask()
+
+    model = ctgan_plugin(
+        n_iter=20,
+        n_iter_print=5,
+        generator_n_layers_hidden=1,
+        generator_n_units_hidden=10,
+        callbacks=[OptunaPruning(trial)],
+    )
+    model.fit(X)
+
+    assert len(trial.storage.get_trial(trial._trial_id).intermediate_values) > 0
+
+
+def test_optuna_pruning_stops_trial() -> None:
+    X, _ = load_iris(as_frame=True, return_X_y=True)
+
+    class AlwaysPrune(optuna.pruners.BasePruner):
+        def prune(
+            self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial
+        ) -> bool:
+            return True
+
+    study = optuna.create_study(direction="minimize", pruner=AlwaysPrune())
+    trial = study.ask()
+
+    model = ctgan_plugin(
+        n_iter=20,
+        n_iter_print=5,
+        generator_n_layers_hidden=1,
+        generator_n_units_hidden=10,
+        callbacks=[OptunaPruning(trial)],
+    )
+    with pytest.raises(optuna.TrialPruned):
+        model.fit(X)
@@ -0,0 +1,63 @@
+# stdlib
+from typing import Tuple
+
+# third party
+import numpy as np
+import pandas as pd
+
+# synthcity absolute
+from synthcity.plugins.core.models.tabular_encoder import TabularEncoder
+from synthcity.utils.samplers import ConditionalDatasetSampler
+
+
+def _encoded_dataset(n: int) -> Tuple[pd.DataFrame, list]:
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "a": rng.choice(["x", "y", "z"], n, p=[0.7, 0.2, 0.1]),
+            "b": rng.integers(0, 2, n),
+            "c": rng.normal(size=n),
+        }
+    )
+    encoder = TabularEncoder(categorical_limit=5).fit(X)
+
+    return encoder.transform(X), encoder.layout()
+
+
+def test_conditional_sampler_indices() -> None:
+    data, layout = _encoded_dataset(1000)
+    sampler = ConditionalDatasetSampler(data, layout)
+
+    values = data.values
+    offsets = np.cumsum([0] + [info.output_dimensions for info in layout])
+    discrete = [
+        offsets[idx]
+        for idx, info in enumerate(layout)
+        if info.feature_type == "discrete"
+    ]
+
+    _, cat_feats, cat_values = sampler.sample_conditional(500, with_ids=True)
+    indices = sampler.sample_conditional_indices(cat_feats, cat_values)
+
+    assert len(indices) == 500
+    for idx, feat, val in zip(indices, cat_feats, cat_values):
+        assert values[idx, discrete[feat] + val] == 1
+
+
+def test_conditional_sampler_train_mapping() -> None:
+    data, layout = _encoded_dataset(1000)
+    sampler = ConditionalDatasetSampler(data, layout)
+
+    train_idx, test_idx = sampler.train_test()
+    train_idx = np.array(train_idx)
+    assert len(np.intersect1d(train_idx, test_idx)) == 0
+    assert len(sampler) == len(train_idx)
+
+    # the positions index the rows of X[train_idx]
+    positions = list(sampler)
+    assert len(positions) == len(train_idx)
+    assert sorted(train_idx[positions]) == sorted(train_idx)
+    # duplicated rows map to their last position
+    for row, pos in zip(*np.unique(train_idx, return_index=True)):
+        last = np.nonzero(train_idx == row)[0][-1]
+        assert sampler._train_mapping[row] == last
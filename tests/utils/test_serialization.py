@@ -1,5 +1,19 @@
+# stdlib
+import json
+from pathlib import Path
+
+# third party
+import pytest
+import torch
+
 # synthcity absolute
-from synthcity.utils.serialization import load, save
+from synthcity.utils.serialization import (
+    load,
+    load_from_dir,
+    load_metadata_from_dir,
+    save,
+    save_to_dir,
+)
 
 
 def test_save_load() -> None:
@@ -12,3 +26,36 @@ def test_save_load() -> None:
     assert isinstance(reloaded, dict)
     assert reloaded["a"] == 1
     assert reloaded["b"] == "dssf"
+
+
+def test_save_load_dir(tmp_path: Path) -> None:
+    model = torch.nn.Linear(3, 2)
+    optimizer = torch.optim.Adam(model.parameters())
+    obj = {"model": model, "optimizer": optimizer, "meta": "dssf"}
+
+    metadata = save_to_dir(tmp_path / "model", obj)
+    assert metadata["n_tensors"] == 2
+    assert load_metadata_from_dir(tmp_path / "model") == metadata
+
+    reloaded = load_from_dir(tmp_path / "model")
+
+    assert reloaded["meta"] == "dssf"
+    assert isinstance(reloaded["model"].weight, torch.nn.Parameter)
+    assert reloaded["model"].weight.requires_grad
+    assert torch.equal(reloaded["model"].weight, model.weight)
+    # the optimizer keeps referencing the module parameters
+    assert (
+        reloaded["optimizer"].param_groups[0]["params"][0] is reloaded["model"].weight
+    )
+
+
+def test_load_dir_invalid_version(tmp_path: Path) -> None:
+    save_to_dir(tmp_path / "model", {"a": 1})
+
+    metadata_file = tmp_path / "model" / "metadata.json"
+    metadata = json.loads(metadata_file.read_text())
+    metadata["version"] = "invalid"
+    metadata_file.write_text(json.dumps(metadata))
+
+    with pytest.raises(RuntimeError):
+        load_from_dir(tmp_path / "model")
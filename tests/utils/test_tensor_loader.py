@@ -0,0 +1,109 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+# synthcity absolute
+from synthcity.plugins.core.models.vae import VAE
+from synthcity.utils.samplers import ImbalancedDatasetSampler
+from synthcity.utils.tensor_loader import TensorDataLoader
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 100, 200])
+@pytest.mark.parametrize("drop_last", [True, False])
+def test_tensor_loader_sequential(batch_size: int, drop_last: bool) -> None:
+    X = torch.arange(100).reshape(-1, 1).float()
+    y = torch.arange(100)
+
+    loader = TensorDataLoader(X, y, batch_size=batch_size, drop_last=drop_last)
+    reference = torch.utils.data.DataLoader(
+        torch.utils.data.TensorDataset(X, y),
+        batch_size=batch_size,
+        drop_last=drop_last,
+    )
+
+    assert len(loader) == len(reference)
+    assert len(loader.dataset) == 100
+
+    batches = list(loader)
+    assert len(batches) == len(reference)
+    for batch, ref_batch in zip(batches, reference):
+        assert len(batch) == 2
+        assert torch.equal(batch[0], ref_batch[0])
+        assert torch.equal(batch[1], ref_batch[1])
+
+
+def test_tensor_loader_random_state() -> None:
+    X = torch.arange(100)
+
+    torch.manual_seed(0)
+    for _ in torch.utils.data.DataLoader(
+        torch.utils.data.TensorDataset(X), batch_size=10
+    ):
+        pass
+    expected = torch.rand(5)
+
+    torch.manual_seed(0)
+    for _ in TensorDataLoader(X, batch_size=10):
+        pass
+
+    assert torch.equal(torch.rand(5), expected)
+
+
+def test_tensor_loader_shuffle() -> None:
+    X = torch.arange(100)
+
+    loader = TensorDataLoader(
+        X, batch_size=30, shuffle=True, generator=torch.Generator().manual_seed(0)
+    )
+    first = torch.cat([batch[0] for batch in loader])
+    second = torch.cat([batch[0] for batch in loader])
+
+    assert sorted(first.tolist()) == list(range(100))
+    assert sorted(second.tolist()) == list(range(100))
+    assert not torch.equal(first, second)
+
+
+def test_tensor_loader_sampler() -> None:
+    labels = [0] * 90 + [1] * 10
+    sampler = ImbalancedDatasetSampler(labels)
+    X = torch.arange(len(sampler))
+
+    loader = TensorDataLoader(X, batch_size=16, sampler=sampler)
+    assert len(loader) == int(np.ceil(len(sampler) / 16))
+
+    rows = torch.cat([batch[0] for batch in loader])
+    assert len(rows) == len(sampler)
+    assert rows.max() < len(sampler)
+
+    # The minority class is oversampled.
+    train_labels = pd.Series(labels).loc[sorted(sampler.train_idx)].values
+    assert train_labels[rows.numpy()].mean() > 0.3
+
+
+def test_tensor_loader_invalid() -> None:
+    with pytest.raises(ValueError):
+        TensorDataLoader()
+    with pytest.raises(ValueError):
+        TensorDataLoader(torch.zeros(10), batch_size=0)
+    with pytest.raises(ValueError):
+        TensorDataLoader(
+            torch.zeros(10),
+            sampler=ImbalancedDatasetSampler([0, 1] * 5),
+            shuffle=True,
+        )
+
+
+def test_vae_dataloader() -> None:
+    X = torch.randn(100, 5)
+    cond = torch.randint(0, 2, (100, 1)).float()
+    model = VAE(n_features=5, n_units_embedding=2, n_units_conditional=1, batch_size=32)
+
+    loader = model._dataloader(X, cond)
+    assert isinstance(loader, TensorDataLoader)
+    assert len(loader) == 4
+
+    batch_X, batch_cond = next(iter(loader))
+    assert torch.equal(batch_X, X[:32])
+    assert torch.equal(batch_cond, cond[:32])